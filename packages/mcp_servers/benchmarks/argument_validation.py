@@ -0,0 +1,91 @@
+"""Per-call cost of the compiled tool argument validators.
+
+Run from packages/mcp_servers:
+
+    python benchmarks/argument_validation.py --calls 20000
+
+Loads the combined runtime in this process and, for every tool's sample call
+from benchmarks/load.py, reports:
+
+  compile    time to compile the tool's parameter schema (once, at startup)
+  valid      validating and coercing the sample arguments
+  invalid    rejecting the arguments with every required one removed
+  dispatch   a full in-process runtime.dispatch() of the sample call, which
+             includes the validation, for scale
+"""
+import argparse
+import asyncio
+import importlib.util
+import os
+import sys
+import time
+import timeit
+from typing import Any, Callable, Dict
+from load import ROOT, TOOL_CALLS
+from shared.server import InvalidArgumentsError, compile_validator
+
+def per_call_us(fn: Callable[[], Any], calls: int) -> float:
+    return min(timeit.repeat(fn, number=calls, repeat=5)) / calls * 1e6
+
+def rejected(validator: Any, arguments: Dict[str, Any]) -> Callable[[], None]:
+    def call() -> None:
+        try:
+            validator.validate(arguments)
+        except InvalidArgumentsError:
+            return
+        raise RuntimeError("Expected the arguments to be rejected")
+    return call
+
+async def dispatch_us(runtime: Any, tool: str, arguments: Dict[str, Any], calls: int) -> float:
+    started = time.perf_counter()
+    for _ in range(calls):
+        response = await runtime.dispatch(tool, arguments)
+        if response.status != "success":
+            raise RuntimeError(f"{tool} failed: {response.error}")
+    return (time.perf_counter() - started) / calls * 1e6
+
+async def main(args: argparse.Namespace) -> None:
+    # Per-user rate limits would reject the repeated dispatches
+    os.environ.setdefault("ADMISSION_ENABLED", "false")
+    spec = importlib.util.spec_from_file_location(
+        "combined_server", ROOT / "combined" / "server.py"
+    )
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[spec.name] = module
+    spec.loader.exec_module(module)
+    runtime = module.runtime
+
+    await runtime.startup()
+    try:
+        print(
+            f"{'tool':<26}{'compile us':>12}{'valid us':>10}{'invalid us':>12}{'dispatch us':>13}"
+        )
+        for _, tool, arguments in TOOL_CALLS:
+            schema = runtime.tools[tool].parameters
+            compile_us = per_call_us(
+                lambda: compile_validator(tool, schema), max(1, args.calls // 100)
+            )
+            validator = compile_validator(tool, schema)
+            valid_us = per_call_us(lambda: validator.validate(arguments), args.calls)
+            missing = {
+                name: value
+                for name, value in arguments.items()
+                if name not in schema.get("required", [])
+            }
+            invalid_us = (
+                per_call_us(rejected(validator, missing), args.calls)
+                if len(missing) < len(arguments)
+                else float("nan")
+            )
+            total_us = await dispatch_us(runtime, tool, arguments, max(1, args.calls // 10))
+            print(
+                f"{tool:<26}{compile_us:>12.1f}{valid_us:>10.2f}"
+                f"{invalid_us:>12.2f}{total_us:>13.1f}"
+            )
+    finally:
+        await runtime.shutdown()
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--calls", type=int, default=20000)
+    asyncio.run(main(parser.parse_args()))
@@ -0,0 +1,164 @@
+"""Per-call tool latency: standalone servers vs the combined server vs in-process dispatch.
+
+Run from packages/mcp_servers:
+
+    python benchmarks/combined_latency.py --calls 2000
+    python benchmarks/combined_latency.py --modes combined in_process
+
+Modes:
+
+  standalone  the three servers as separate processes, tools called over HTTP;
+              recommend_payment_method makes a second HTTP hop Benefits -> SafePay
+  combined    combined/server.py as one process, tools called over HTTP;
+              Benefits reads the SafePay wallet cache directly
+  in_process  combined runtime loaded into this process, runtime.dispatch()
+              without HTTP or JSON (the agent's MCP_MODE=in_process)
+
+Calls are sequential so the numbers are per-call overhead, not throughput.
+HTTP modes use the /api/tools/{name} route.
+"""
+import argparse
+import asyncio
+import importlib.util
+import os
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, List, Tuple
+import httpx
+from load import SERVERS, wait_ready
+
+ROOT = Path(__file__).resolve().parent.parent
+COMBINED_PORT = 3000
+
+TOOL_CALLS: List[Tuple[str, str, Dict[str, Any]]] = [
+    ("safepay_wallet", "get_payment_methods", {"user_id": "D649217"}),
+    ("benefits", "get_card_benefits", {"card_id": "card_123"}),
+    (
+        "chase_travel",
+        "search_flights",
+        {"origin": "JFK", "destination": "LAX", "departure_date": "2026-12-01"}
+    ),
+    # Crosses from Benefits to SafePay for the user's wallet
+    ("benefits", "recommend_payment_method", {"user_id": "D649217", "category": "TRAVEL"})
+]
+
+def start_process(directory: str, port: int) -> subprocess.Popen:
+    env = {
+        **os.environ,
+        "ENVIRONMENT": "production",
+        "WEB_CONCURRENCY": "1",
+        "PORT": str(port),
+        "SERVER_ACCESS_LOG": "false",
+        "SAFEPAY_WALLET_URL": f"http://127.0.0.1:{SERVERS['safepay_wallet']['port']}"
+    }
+    return subprocess.Popen(
+        [sys.executable, "server.py"],
+        cwd=ROOT / directory,
+        env=env,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL
+    )
+
+async def measure(call: Callable[[], Awaitable[None]], calls: int) -> Dict[str, float]:
+    for _ in range(min(calls, 100)):
+        await call()
+    latencies: List[float] = []
+    for _ in range(calls):
+        started = time.perf_counter()
+        await call()
+        latencies.append(time.perf_counter() - started)
+    latencies.sort()
+    return {
+        "p50_us": latencies[len(latencies) // 2] * 1e6,
+        "p99_us": latencies[min(int(len(latencies) * 0.99), len(latencies) - 1)] * 1e6
+    }
+
+async def measure_http(
+    client: httpx.AsyncClient, base_urls: Dict[str, str], calls: int
+) -> Dict[str, Dict[str, float]]:
+    results = {}
+    for server, tool, arguments in TOOL_CALLS:
+        url = f"{base_urls[server]}/api/tools/{tool}"
+
+        async def call() -> None:
+            response = await client.post(url, json=arguments)
+            response.raise_for_status()
+            if response.json()["status"] != "success":
+                raise RuntimeError(f"{tool} failed: {response.text}")
+
+        results[tool] = await measure(call, calls)
+    return results
+
+async def run_standalone(client: httpx.AsyncClient, calls: int) -> Dict[str, Dict[str, float]]:
+    processes = {name: start_process(name, spec["port"]) for name, spec in SERVERS.items()}
+    base_urls = {name: f"http://127.0.0.1:{spec['port']}" for name, spec in SERVERS.items()}
+    try:
+        for name, process in processes.items():
+            await wait_ready(client, base_urls[name], process)
+        return await measure_http(client, base_urls, calls)
+    finally:
+        for process in processes.values():
+            process.terminate()
+            process.wait()
+
+async def run_combined(client: httpx.AsyncClient, calls: int) -> Dict[str, Dict[str, float]]:
+    process = start_process("combined", COMBINED_PORT)
+    base_url = f"http://127.0.0.1:{COMBINED_PORT}"
+    try:
+        await wait_ready(client, base_url, process)
+        return await measure_http(client, {name: base_url for name in SERVERS}, calls)
+    finally:
+        process.terminate()
+        process.wait()
+
+async def run_in_process(client: httpx.AsyncClient, calls: int) -> Dict[str, Dict[str, float]]:
+    spec = importlib.util.spec_from_file_location(
+        "combined_server", ROOT / "combined" / "server.py"
+    )
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[spec.name] = module
+    spec.loader.exec_module(module)
+    runtime = module.runtime
+
+    results = {}
+    await runtime.startup()
+    try:
+        for _, tool, arguments in TOOL_CALLS:
+
+            async def call() -> None:
+                response = await runtime.dispatch(tool, arguments)
+                if response.status != "success":
+                    raise RuntimeError(f"{tool} failed: {response.error}")
+
+            results[tool] = await measure(call, calls)
+    finally:
+        await runtime.shutdown()
+    return results
+
+MODES = {
+    "standalone": run_standalone,
+    "combined": run_combined,
+    "in_process": run_in_process
+}
+
+async def main(args: argparse.Namespace) -> None:
+    results = {}
+    async with httpx.AsyncClient(timeout=30.0) as client:
+        for mode in args.modes:
+            results[mode] = await MODES[mode](client, args.calls)
+
+    print(f"{'tool':<26}" + "".join(f"{mode:>24}" for mode in args.modes) + "   (p50 / p99 us)")
+    for _, tool, _ in TOOL_CALLS:
+        cells = "".join(
+            f"{results[mode][tool]['p50_us']:>12.0f} /{results[mode][tool]['p99_us']:>9.0f}"
+            for mode in args.modes
+        )
+        print(f"{tool:<26}{cells}")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--modes", nargs="+", choices=list(MODES), default=list(MODES))
+    parser.add_argument("--calls", type=int, default=2000)
+    asyncio.run(main(parser.parse_args()))
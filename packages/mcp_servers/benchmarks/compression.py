@@ -0,0 +1,86 @@
+"""Micro-benchmark of response compression: CPU time against bytes on the wire.
+
+Run from packages/mcp_servers:
+
+    python benchmarks/compression.py --flights 50 500 2000
+
+For tool responses of several sizes it compresses the JSON with each
+encoding and level the CompressionMiddleware can use and reports:
+
+  bytes      compressed size (and ratio against the raw JSON)
+  comp/dec   compression and decompression time per response
+  break-even link speed below which compressing delivers the response
+             sooner (bytes saved / compression time); on cross-AZ links
+             (typically well under this) compression also cuts transfer cost
+
+zstd rows need the zstandard package (pip install "shared[zstd]").
+"""
+import argparse
+import json
+import timeit
+import zlib
+from typing import Callable, Dict, List, Tuple
+from serialization import CATALOG_PATH, flight_results, wallet
+from shared.models.config import CompressionConfig
+from shared.server import response_json
+from shared.server.compression import available_encodings, create_compressor, zstandard
+
+def compress(encoding: str, level: int, body: bytes) -> bytes:
+    config = (
+        CompressionConfig(gzip_level=level)
+        if encoding == "gzip"
+        else CompressionConfig(zstd_level=level)
+    )
+    compressor = create_compressor(encoding, config)
+    return compressor.compress(body) + compressor.finish()
+
+def decompressor(encoding: str) -> Callable[[bytes], bytes]:
+    if encoding == "zstd":
+        return lambda data: zstandard.ZstdDecompressor().decompressobj().decompress(data)
+    return lambda data: zlib.decompress(data, 31)
+
+def time_call(fn: Callable[[], bytes], repeat: int) -> float:
+    number = max(1, repeat)
+    return min(timeit.repeat(fn, number=number, repeat=5)) / number * 1e6
+
+def main(args: argparse.Namespace) -> None:
+    payloads: Dict[str, bytes] = {
+        f"flights ({count})": response_json("success", data=flight_results(count))
+        for count in args.flights
+    }
+    payloads[f"wallet ({args.cards} cards)"] = response_json("success", data=wallet(args.cards))
+    with open(CATALOG_PATH, "rb") as f:
+        payloads["card catalog"] = response_json("success", data=json.load(f))
+    settings: List[Tuple[str, int]] = [("gzip", level) for level in args.gzip_levels]
+    if "zstd" in available_encodings():
+        settings += [("zstd", level) for level in args.zstd_levels]
+    else:
+        print("zstandard not installed: gzip only")
+    print(
+        f"{'payload':<20}{'encoding':>10}{'bytes':>10}{'ratio':>8}"
+        f"{'comp us':>10}{'dec us':>10}{'break-even':>14}"
+    )
+    for name, body in payloads.items():
+        print(f"{name:<20}{'identity':>10}{len(body):>10}{1.0:>8.2f}{'-':>10}{'-':>10}{'-':>14}")
+        for encoding, level in settings:
+            compressed = compress(encoding, level, body)
+            decompress = decompressor(encoding)
+            assert decompress(compressed) == body
+            compress_us = time_call(lambda: compress(encoding, level, body), args.repeat)
+            decompress_us = time_call(lambda: decompress(compressed), args.repeat)
+            saved_bits = (len(body) - len(compressed)) * 8
+            break_even = f"{saved_bits / compress_us:.0f} Mbit/s" if saved_bits > 0 else "never"
+            print(
+                f"{'':<20}{f'{encoding}-{level}':>10}{len(compressed):>10}"
+                f"{len(body) / len(compressed):>8.2f}"
+                f"{compress_us:>10.1f}{decompress_us:>10.1f}{break_even:>14}"
+            )
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--flights", type=int, nargs="+", default=[5, 50, 500, 2000])
+    parser.add_argument("--cards", type=int, default=8)
+    parser.add_argument("--gzip-levels", type=int, nargs="+", default=[1, 6, 9])
+    parser.add_argument("--zstd-levels", type=int, nargs="+", default=[1, 3, 9])
+    parser.add_argument("--repeat", type=int, default=20)
+    main(parser.parse_args())
@@ -0,0 +1,130 @@
+"""Interactive tail latency while a batch client floods the same tool.
+
+Run from packages/mcp_servers:
+
+    python benchmarks/fairness.py --capacity 16 --interactive-users 20 --batch-concurrency 128
+
+One batch user keeps --batch-concurrency calls in flight against the
+contended tool from benchmarks/overload.py (backing off briefly when
+shed), while interactive users call it open-loop at --interactive-rate
+each. Two schedulers are compared:
+
+  fifo  admission control with a single FIFO queue and no per-user state
+  fair  per-user round-robin, interactive:batch weights and token buckets
+
+For each it reports interactive p50/p99 latency and shed rate, and the
+batch user's completed calls/sec.
+"""
+import argparse
+import asyncio
+import random
+import time
+from typing import Dict, List
+from overload import ContendedTool
+from shared.models.config import AdmissionConfig
+from shared.server import ServerRuntime, current_priority
+
+async def run(mode: str, args: argparse.Namespace) -> Dict[str, float]:
+    if mode == "fifo":
+        admission = AdmissionConfig(
+            max_concurrency=args.capacity,
+            max_wait=args.max_wait,
+            shed_delay=args.shed_delay,
+            priority_weights={"interactive": 1.0},
+            user_rate=0
+        )
+    else:
+        admission = AdmissionConfig(
+            max_concurrency=args.capacity,
+            max_wait=args.max_wait,
+            shed_delay=args.shed_delay,
+            user_rate=args.user_rate,
+            user_burst=args.user_burst
+        )
+    runtime = ServerRuntime("Fairness", admission=admission)
+    runtime.add_tool("contended", lambda rt: ContendedTool(args.capacity, args.service_time, 0.0))
+    await runtime.startup()
+
+    interactive: List[float] = []
+    interactive_shed = 0
+    batch_done = 0
+    deadline = time.perf_counter() + args.seconds
+
+    def parameters(user_id: str) -> Dict[str, str]:
+        # The FIFO baseline schedules without knowing who is calling
+        return {} if mode == "fifo" else {"user_id": user_id}
+
+    async def batch_worker() -> None:
+        nonlocal batch_done
+        current_priority.set("batch")
+        while time.perf_counter() < deadline:
+            response = await runtime.dispatch("contended", parameters("batch_job"))
+            if response.status == "success":
+                batch_done += 1
+            else:
+                await asyncio.sleep(args.shed_delay)
+
+    async def interactive_call(user_id: str) -> None:
+        nonlocal interactive_shed
+        started = time.perf_counter()
+        response = await runtime.dispatch("contended", parameters(user_id))
+        if response.status == "success":
+            interactive.append(time.perf_counter() - started)
+        else:
+            interactive_shed += 1
+
+    async def interactive_user(user_id: str) -> None:
+        calls = []
+        await asyncio.sleep(random.uniform(0, 1.0 / args.interactive_rate))
+        while time.perf_counter() < deadline:
+            calls.append(asyncio.create_task(interactive_call(user_id)))
+            await asyncio.sleep(random.expovariate(args.interactive_rate))
+        await asyncio.gather(*calls)
+
+    started = time.perf_counter()
+    await asyncio.gather(
+        *(batch_worker() for _ in range(args.batch_concurrency)),
+        *(interactive_user(f"user_{i}") for i in range(args.interactive_users))
+    )
+    elapsed = time.perf_counter() - started
+    await runtime.shutdown()
+
+    interactive.sort()
+    percentile = lambda p: (
+        interactive[min(int(len(interactive) * p), len(interactive) - 1)] * 1000
+        if interactive
+        else float("nan")
+    )
+    return {
+        "p50_ms": percentile(0.5),
+        "p99_ms": percentile(0.99),
+        "shed_pct": 100.0 * interactive_shed / max(1, interactive_shed + len(interactive)),
+        "batch_per_sec": batch_done / elapsed
+    }
+
+async def main(args: argparse.Namespace) -> None:
+    print(f"{'mode':<6}{'interactive p50 ms':>20}{'p99 ms':>9}{'shed %':>8}{'batch/s':>9}")
+    for mode in ("fifo", "fair"):
+        r = await run(mode, args)
+        print(
+            f"{mode:<6}{r['p50_ms']:>20.1f}{r['p99_ms']:>9.1f}"
+            f"{r['shed_pct']:>8.1f}{r['batch_per_sec']:>9.0f}"
+        )
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--capacity", type=int, default=16)
+    parser.add_argument("--service-time", type=float, default=0.02)
+    parser.add_argument("--interactive-users", type=int, default=20)
+    parser.add_argument(
+        "--interactive-rate", type=float, default=5.0, help="Calls per second per interactive user"
+    )
+    parser.add_argument("--batch-concurrency", type=int, default=128)
+    parser.add_argument(
+        "--user-rate", type=float, default=1000.0, help="Token bucket rate per user in fair mode"
+    )
+    parser.add_argument("--user-burst", type=int, default=200)
+    parser.add_argument("--seconds", type=float, default=5.0)
+    parser.add_argument("--max-wait", type=float, default=1.0)
+    parser.add_argument("--shed-delay", type=float, default=0.25)
+    asyncio.run(main(parser.parse_args()))
@@ -0,0 +1,108 @@
+"""Cold-start import time of each MCP server, the agent and the shared models.
+
+Run from packages/mcp_servers:
+
+    python benchmarks/import_time.py --runs 5 --top 8
+
+Each target is imported in a fresh interpreter (so nothing is cached in
+sys.modules) and timed from the first import to the last; the median and
+best of --runs are reported. With --top, the heaviest top-level imports of
+each target are listed from `python -X importtime`.
+"""
+import argparse
+import os
+import re
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+ROOT = Path(__file__).resolve().parent.parent
+AGENT_DIR = ROOT.parent / "optimization_agent"
+
+# name -> (working directory, import statement)
+TARGETS: Dict[str, Tuple[Path, str]] = {
+    "shared models": (
+        ROOT,
+        "import shared.models.api.flight_search, shared.models.api.payment_methods, "
+        "shared.models.api.travel_benefits"
+    ),
+    "chase_travel": (ROOT / "chase_travel", "import server"),
+    "safepay_wallet": (ROOT / "safepay_wallet", "import server"),
+    "benefits": (ROOT / "benefits", "import server"),
+    "combined": (ROOT / "combined", "import server"),
+    "agent": (AGENT_DIR, "import agent")
+}
+
+TIMER = (
+    "import time; _start = time.perf_counter(); {statement}; print(time.perf_counter() - _start)"
+)
+IMPORTTIME_LINE = re.compile(r"import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)")
+
+def run_python(cwd: Path, *arguments: str) -> subprocess.CompletedProcess:
+    env = {
+        **os.environ,
+        "PYTHONPATH": os.pathsep.join(filter(None, [str(cwd), os.getenv("PYTHONPATH")]))
+    }
+    return subprocess.run(
+        [sys.executable, *arguments], cwd=cwd, env=env, capture_output=True, text=True
+    )
+
+def time_import(cwd: Path, statement: str) -> Optional[float]:
+    result = run_python(cwd, "-c", TIMER.format(statement=statement))
+    if result.returncode != 0:
+        print(f"  import failed in {cwd.name}: {result.stderr.strip().splitlines()[-1]}")
+        return None
+    return float(result.stdout.strip().splitlines()[-1])
+
+def imported_packages(cwd: Path, statement: str) -> Dict[str, int]:
+    """Cumulative import time in microseconds of each top-level package the statement imports."""
+    result = run_python(cwd, "-X", "importtime", "-c", statement)
+    packages: Dict[str, int] = {}
+    for line in result.stderr.splitlines():
+        match = IMPORTTIME_LINE.match(line)
+        if match and "." not in match.group(4):
+            packages[match.group(4)] = max(packages.get(match.group(4), 0), int(match.group(2)))
+    return packages
+
+def heaviest_imports(cwd: Path, statement: str, top: int) -> List[Tuple[str, int]]:
+    """Heaviest packages the target imports, leaving out the interpreter's own startup imports.
+
+    A package's time includes the packages it imports (fastapi includes pydantic).
+    """
+    startup = imported_packages(cwd, "pass")
+    own_modules = set(re.findall(r"import (\w+)", statement))
+    packages = [
+        (package, cumulative_us)
+        for package, cumulative_us in imported_packages(cwd, statement).items()
+        if package not in startup and package not in own_modules
+    ]
+    return sorted(packages, key=lambda package: package[1], reverse=True)[:top]
+
+def main(args: argparse.Namespace) -> None:
+    unknown = [name for name in args.targets if name not in TARGETS]
+    if unknown:
+        raise SystemExit(f"Unknown targets {unknown}; expected any of {list(TARGETS)}")
+    targets = {name: TARGETS[name] for name in args.targets} if args.targets else TARGETS
+    print(f"{'target':<16}{'median ms':>12}{'best ms':>10}")
+    for name, (cwd, statement) in targets.items():
+        timings = [time_import(cwd, statement) for _ in range(args.runs)]
+        if None in timings:
+            print(f"{name:<16}{'-':>12}{'-':>10}")
+            continue
+        print(f"{name:<16}{statistics.median(timings) * 1000:>12.1f}{min(timings) * 1000:>10.1f}")
+        if args.top:
+            for module, cumulative_us in heaviest_imports(cwd, statement, args.top):
+                print(f"{'':<18}{module:<40}{cumulative_us / 1000:>8.1f} ms")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "targets", nargs="*", help=f"Targets to time: {', '.join(TARGETS)} (default: all)"
+    )
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument(
+        "--top", type=int, default=0, help="List this many of each target's heaviest imports"
+    )
+    main(parser.parse_args())
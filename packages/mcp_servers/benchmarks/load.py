@@ -0,0 +1,189 @@
+"""Requests/sec per MCP tool with each server in development and production mode.
+
+Run from packages/mcp_servers:
+
+    python benchmarks/load.py --requests 5000 --concurrency 100
+    python benchmarks/load.py --servers benefits --modes production --workers 8
+
+Each server is started as a subprocess with ENVIRONMENT set to the mode
+(development: one reloading worker on the default loop; production: no
+reload, uvloop/httptools when installed, --workers workers), then every
+tool is called over the MCP HTTP endpoint with JSON-RPC tools/call.
+"""
+import argparse
+import asyncio
+import os
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+import httpx
+
+ROOT = Path(__file__).resolve().parent.parent
+STARTUP_TIMEOUT = 60.0
+
+SERVERS: Dict[str, Dict[str, Any]] = {
+    "chase_travel": {"port": 3001},
+    "safepay_wallet": {"port": 3002},
+    "benefits": {"port": 3003}
+}
+
+TOOL_CALLS: List[Tuple[str, str, Dict[str, Any]]] = [
+    (
+        "chase_travel",
+        "search_flights",
+        {"origin": "JFK", "destination": "LAX", "departure_date": "2026-12-01"}
+    ),
+    ("chase_travel", "get_flight_details", {"flight_id": "FL123"}),
+    ("safepay_wallet", "get_payment_methods", {"user_id": "D649217"}),
+    ("safepay_wallet", "get_payment_methods_bulk", {"user_ids": ["D649217"] * 10}),
+    ("benefits", "get_card_benefits", {"card_id": "card_123"}),
+    ("benefits", "calculate_rewards", {
+        "card_id": "card_123",
+        "purchases": [
+            {"category": "TRAVEL", "amount": 500.0},
+            {"category": "DINING", "amount": 80.0}
+        ]
+    }),
+    ("benefits", "calculate_rewards_batch", {
+        "card_ids": ["card_123", "card_789", "card_654"],
+        "purchases": [
+            {"category": category, "amount": 25.0}
+            for category in ("TRAVEL", "DINING", "GROCERY", "GAS")
+        ] * 25
+    }),
+    ("benefits", "get_transfer_partners", {"card_id": "card_123"})
+]
+
+def start_server(name: str, mode: str, workers: Optional[int]) -> subprocess.Popen:
+    env = {
+        **os.environ,
+        "ENVIRONMENT": mode,
+        "PORT": str(SERVERS[name]["port"]),
+        "SERVER_ACCESS_LOG": "false"
+    }
+    if workers:
+        env["WEB_CONCURRENCY"] = str(workers)
+    return subprocess.Popen(
+        [sys.executable, "server.py"],
+        cwd=ROOT / name,
+        env=env,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL
+    )
+
+async def wait_ready(client: httpx.AsyncClient, base_url: str, process: subprocess.Popen) -> None:
+    deadline = time.monotonic() + STARTUP_TIMEOUT
+    while time.monotonic() < deadline:
+        if process.poll() is not None:
+            raise RuntimeError(f"Server at {base_url} exited with code {process.returncode}")
+        try:
+            if (await client.get(f"{base_url}/health")).status_code == 200:
+                return
+        except httpx.TransportError:
+            pass
+        await asyncio.sleep(0.2)
+    raise TimeoutError(f"Server at {base_url} was not ready after {STARTUP_TIMEOUT}s")
+
+async def load_tool(
+    client: httpx.AsyncClient,
+    url: str,
+    tool: str,
+    arguments: Dict[str, Any],
+    requests: int,
+    concurrency: int
+) -> Dict[str, float]:
+    latencies: List[float] = []
+    errors = 0
+    next_id = iter(range(requests))
+
+    async def worker() -> None:
+        nonlocal errors
+        for request_id in next_id:
+            payload = {
+                "jsonrpc": "2.0",
+                "id": request_id,
+                "method": "tools/call",
+                "params": {"name": tool, "arguments": arguments}
+            }
+            started = time.perf_counter()
+            try:
+                response = await client.post(url, json=payload)
+                if response.status_code >= 400:
+                    errors += 1
+            except httpx.HTTPError:
+                errors += 1
+            latencies.append(time.perf_counter() - started)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - started
+    latencies.sort()
+    return {
+        "requests_per_sec": requests / elapsed,
+        "p50_ms": latencies[len(latencies) // 2] * 1000,
+        "p99_ms": latencies[min(int(len(latencies) * 0.99), len(latencies) - 1)] * 1000,
+        "errors": errors
+    }
+
+async def main(args: argparse.Namespace) -> None:
+    limits = httpx.Limits(
+        max_connections=args.concurrency, max_keepalive_connections=args.concurrency
+    )
+    results: Dict[Tuple[str, str], Dict[str, float]] = {}
+
+    async with httpx.AsyncClient(limits=limits, timeout=30.0) as client:
+        for mode in args.modes:
+            for name in args.servers:
+                base_url = f"http://127.0.0.1:{SERVERS[name]['port']}"
+                process = start_server(name, mode, args.workers)
+                try:
+                    await wait_ready(client, base_url, process)
+                    for server, tool, arguments in TOOL_CALLS:
+                        if server != name:
+                            continue
+                        # Warm connections and server-side caches before measuring
+                        await load_tool(
+                            client,
+                            base_url + args.mcp_path,
+                            tool,
+                            arguments,
+                            args.concurrency,
+                            args.concurrency
+                        )
+                        results[(tool, mode)] = await load_tool(
+                            client,
+                            base_url + args.mcp_path,
+                            tool,
+                            arguments,
+                            args.requests,
+                            args.concurrency
+                        )
+                finally:
+                    process.terminate()
+                    process.wait(timeout=STARTUP_TIMEOUT)
+
+    print(f"{'tool':<26}" + "".join(f"{mode:>30}" for mode in args.modes))
+    for _, tool, _ in TOOL_CALLS:
+        row = [results.get((tool, mode)) for mode in args.modes]
+        if not any(row):
+            continue
+        cells = "".join(
+            f"{r['requests_per_sec']:>10.0f} req/s p99 {r['p99_ms']:>6.1f}ms"
+            + (f" ({r['errors']:.0f} err)" if r["errors"] else "")
+            if r
+            else f"{'-':>30}"
+            for r in row
+        )
+        print(f"{tool:<26}{cells}")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--servers", nargs="+", choices=list(SERVERS), default=list(SERVERS))
+    parser.add_argument("--modes", nargs="+", default=["development", "production"])
+    parser.add_argument("--requests", type=int, default=5000)
+    parser.add_argument("--concurrency", type=int, default=100)
+    parser.add_argument("--workers", type=int, help="Workers in production mode (default: 1)")
+    parser.add_argument("--mcp-path", default="/mcp/", help="Path of the MCP HTTP endpoint")
+    asyncio.run(main(parser.parse_args()))
@@ -0,0 +1,139 @@
+"""Micro-benchmark of the optimize_travel flights x cards ranking.
+
+Run from packages/mcp_servers:
+
+    python benchmarks/optimizer.py --flights 1000 10000 100000 --cards 10
+
+Ranks synthetic one- and two-stop search results against a wallet built
+from the benefits catalog (cards repeated to reach --cards) and times:
+
+  encode     flattening the flight dicts into columns
+  layovers   parsing connection times (only with a min_layover_time preference)
+  rank       penalties, the value matrix, best card per flight and top-k
+  total      optimize_travel end to end, including the k result models
+"""
+import argparse
+import json
+import sys
+import tempfile
+import timeit
+from pathlib import Path
+from typing import Any, Dict, List
+import numpy as np
+from load import ROOT
+
+sys.path.insert(0, str(ROOT / "benefits"))
+
+from catalog.card_catalog import DEFAULT_CATALOG_PATH, CardCatalog
+from engine.optimizer import (
+    OptimizationPreferences,
+    build_wallet_columns,
+    encode_flights,
+    optimize_travel,
+    preference_penalties,
+    top_k,
+    value_matrix
+)
+
+PREFERENCES = {"max_price": 600.0, "preferred_airlines": ["AA", "DL"], "min_layover_time": 60}
+AIRLINES = ("AA", "DL", "UA", "B6")
+
+def flight_results(count: int, seed: int = 0) -> List[Dict[str, Any]]:
+    rng = np.random.default_rng(seed)
+    prices = rng.uniform(89.0, 1200.0, count).round(2).tolist()
+    carriers = rng.integers(0, len(AIRLINES), (count, 2)).tolist()
+    stops = rng.integers(0, 2, count).tolist()
+    layovers = rng.integers(30, 240, count).tolist()
+    flights = []
+    for i in range(count):
+        segments = [{
+            "flight_number": f"{AIRLINES[carriers[i][0]]}{100 + i % 900}",
+            "airline_code": AIRLINES[carriers[i][0]],
+            "departure_airport": "JFK",
+            "arrival_airport": "ORD" if stops[i] else "LAX",
+            "departure_time": "2026-12-01T10:00:00Z",
+            "arrival_time": "2026-12-01T12:00:00Z",
+            "duration_minutes": 120
+        }]
+        if stops[i]:
+            departure = f"2026-12-01T{12 + layovers[i] // 60:02d}:{layovers[i] % 60:02d}:00Z"
+            segments.append({
+                "flight_number": f"{AIRLINES[carriers[i][1]]}{1000 + i % 900}",
+                "airline_code": AIRLINES[carriers[i][1]],
+                "departure_airport": "ORD",
+                "arrival_airport": "LAX",
+                "departure_time": departure,
+                "arrival_time": "2026-12-01T20:00:00Z",
+                "duration_minutes": 240
+            })
+        flights.append({
+            "id": f"FL{i}",
+            "segments": segments,
+            "price": {"amount": prices[i], "currency": "USD"},
+            "cabin_class": "ECONOMY",
+            "available_seats": 9
+        })
+    return flights
+
+def wallet_catalog(count: int, directory: Path) -> CardCatalog:
+    """Catalog with count cards, cycling through the real catalog's cards."""
+    cards = json.loads(DEFAULT_CATALOG_PATH.read_text())["cards"]
+    repeated = [{**cards[i % len(cards)], "card_id": f"card_{i}"} for i in range(count)]
+    path = directory / "card_catalog.json"
+    path.write_text(json.dumps({"cards": repeated}))
+    return CardCatalog(path, reload_interval=3600)
+
+def per_call_ms(fn: Any, repeat: int) -> float:
+    number = max(1, repeat)
+    return min(timeit.repeat(fn, number=number, repeat=5)) / number * 1e3
+
+def main(args: argparse.Namespace) -> None:
+    with tempfile.TemporaryDirectory() as directory:
+        catalog = wallet_catalog(args.cards, Path(directory))
+        cards = [
+            {
+                "card_id": f"card_{i}",
+                "last_four_digits": f"{i:04d}",
+                "expiry_month": 12,
+                "expiry_year": 2030,
+                "is_default": i == 0
+            }
+            for i in range(args.cards)
+        ]
+        wallet = build_wallet_columns(cards, catalog)
+        preferences = OptimizationPreferences.from_dict(PREFERENCES)
+
+        print(
+            f"{'flights x cards':<18}{'encode ms':>11}{'layovers ms':>13}"
+            f"{'rank ms':>10}{'total ms':>10}"
+        )
+        for count in args.flights:
+            flights = flight_results(count)
+            repeat = max(1, args.repeat * 1000 // count)
+            encode_ms = per_call_ms(lambda: encode_flights(flights), repeat)
+            columns = encode_flights(flights)
+            layovers_ms = (
+                per_call_ms(lambda: encode_flights(flights).min_layovers, repeat) - encode_ms
+            )
+            columns.min_layovers
+
+            def rank() -> np.ndarray:
+                values = value_matrix(columns, wallet, preference_penalties(columns, preferences))
+                return top_k(values.max(axis=1), args.top_k)
+
+            rank_ms = per_call_ms(rank, repeat)
+            total_ms = per_call_ms(
+                lambda: optimize_travel(flights, cards, catalog, PREFERENCES, k=args.top_k), repeat
+            )
+            print(
+                f"{f'{count} x {args.cards}':<18}{encode_ms:>11.2f}{layovers_ms:>13.2f}"
+                f"{rank_ms:>10.2f}{total_ms:>10.2f}"
+            )
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--flights", type=int, nargs="+", default=[1000, 10000, 100000])
+    parser.add_argument("--cards", type=int, default=10)
+    parser.add_argument("--top-k", type=int, default=5)
+    parser.add_argument("--repeat", type=int, default=20)
+    main(parser.parse_args())
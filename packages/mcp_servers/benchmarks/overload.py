@@ -0,0 +1,133 @@
+"""Latency and goodput under overload, with and without admission control.
+
+Run from packages/mcp_servers:
+
+    python benchmarks/overload.py --capacity 32 --load 0.5 1.0 2.0 4.0
+
+A synthetic tool behind ServerRuntime.dispatch models a server with
+`capacity` units of parallelism: calls share it (processor sharing) and every
+call beyond capacity adds contention overhead, as CPU, connection pool and
+memory pressure do. Calls arrive open-loop at `load` x capacity for
+--seconds, and each mode reports completed calls/sec, shed calls and
+p50/p99 latency of the completed calls (queueing included).
+"""
+import argparse
+import asyncio
+import random
+import time
+from typing import Any, Dict, List
+from shared.models.config import AdmissionConfig
+from shared.server import ServerRuntime
+
+TICK = 0.001
+
+class ContendedTool:
+    """Work of service_time seconds, slowed down by concurrent calls past capacity."""
+    name = "contended"
+
+    def __init__(self, capacity: int, service_time: float, overhead: float):
+        self.capacity = capacity
+        self.service_time = service_time
+        self.overhead = overhead
+        self.active = 0
+
+    async def execute(self, context: Any, **kwargs) -> Dict[str, Any]:
+        self.active += 1
+        try:
+            remaining = self.service_time
+            while remaining > 0:
+                await asyncio.sleep(TICK)
+                excess = max(0, self.active - self.capacity)
+                share = min(1.0, self.capacity / self.active) / (1.0 + self.overhead * excess)
+                remaining -= TICK * share
+            return {"ok": True}
+        finally:
+            self.active -= 1
+
+async def run(
+    admission: AdmissionConfig, args: argparse.Namespace, load: float
+) -> Dict[str, float]:
+    runtime = ServerRuntime("Overload", admission=admission)
+    runtime.add_tool(
+        "contended", lambda rt: ContendedTool(args.capacity, args.service_time, args.overhead)
+    )
+    await runtime.startup()
+
+    latencies: List[float] = []
+    shed = 0
+    rate = load * args.capacity / args.service_time
+
+    async def call() -> None:
+        nonlocal shed
+        started = time.perf_counter()
+        response = await runtime.dispatch("contended", {})
+        if response.status == "success":
+            latencies.append(time.perf_counter() - started)
+        else:
+            shed += 1
+
+    calls = []
+    started = time.perf_counter()
+    deadline = started + args.seconds
+    while time.perf_counter() < deadline:
+        calls.append(asyncio.create_task(call()))
+        await asyncio.sleep(random.expovariate(rate))
+    # Only calls that finish within the drain window count as served
+    done, pending = await asyncio.wait(calls, timeout=args.drain)
+    for task in pending:
+        task.cancel()
+    elapsed = time.perf_counter() - started
+    await runtime.shutdown()
+
+    latencies.sort()
+    percentile = lambda p: (
+        latencies[min(int(len(latencies) * p), len(latencies) - 1)] * 1000
+        if latencies
+        else float("nan")
+    )
+    return {
+        "offered": len(calls) / args.seconds,
+        "goodput": len(latencies) / elapsed,
+        "shed": shed,
+        "unfinished": len(pending),
+        "p50_ms": percentile(0.5),
+        "p99_ms": percentile(0.99)
+    }
+
+async def main(args: argparse.Namespace) -> None:
+    modes = {
+        "unbounded": AdmissionConfig(enabled=False),
+        "admission": AdmissionConfig(
+            max_concurrency=args.capacity,
+            max_queue=args.capacity * 4,
+            max_wait=args.max_wait,
+            shed_delay=args.shed_delay
+        )
+    }
+    print(
+        f"{'load':>5} {'mode':<10}{'offered/s':>10}{'goodput/s':>10}{'shed':>7}"
+        f"{'unfinished':>11}{'p50 ms':>9}{'p99 ms':>9}"
+    )
+    for load in args.load:
+        for mode, admission in modes.items():
+            r = await run(admission, args, load)
+            print(
+                f"{load:>5.1f} {mode:<10}{r['offered']:>10.0f}{r['goodput']:>10.0f}{r['shed']:>7}"
+                f"{r['unfinished']:>11}{r['p50_ms']:>9.1f}{r['p99_ms']:>9.1f}"
+            )
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--capacity", type=int, default=32)
+    parser.add_argument("--service-time", type=float, default=0.02, help="Seconds of work per call")
+    parser.add_argument(
+        "--overhead", type=float, default=0.01, help="Slowdown per call beyond capacity"
+    )
+    parser.add_argument("--load", type=float, nargs="+", default=[0.5, 1.0, 2.0, 4.0])
+    parser.add_argument("--seconds", type=float, default=5.0)
+    parser.add_argument(
+        "--drain", type=float, default=10.0, help="Seconds to wait for calls after arrivals stop"
+    )
+    parser.add_argument("--max-wait", type=float, default=0.2)
+    parser.add_argument("--shed-delay", type=float, default=0.05)
+    asyncio.run(main(parser.parse_args()))
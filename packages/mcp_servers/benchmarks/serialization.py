@@ -0,0 +1,122 @@
+"""Micro-benchmark of tool result serialization: dict round-trip vs the fast JSON path.
+
+Run from packages/mcp_servers:
+
+    python benchmarks/serialization.py --flights 500 --cards 8
+
+For flight search results, a wallet and a card's benefits it times:
+
+  dict+json      model_dump(), wrap in an envelope dict, json.dumps (today's transport)
+  dict+envelope  model_dump(), wrap in an MCPResponse-shaped model, model_dump_json
+  fast           shared.server.response_json straight from the model
+  cached         response_json around bytes serialized ahead of time
+"""
+import argparse
+import json
+import timeit
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional
+from pydantic import BaseModel
+from shared.models.api.flight_search import Flight, FlightSearchResponse, FlightSegment, Price
+from shared.models.api.payment_methods import Card, PaymentMethodsResponse
+from shared.server import RawJSON, dumps, response_json
+from shared.server.serialization import orjson
+
+CATALOG_PATH = Path(__file__).resolve().parent.parent / "benefits" / "data" / "card_catalog.json"
+
+class Envelope(BaseModel):
+    """Stand-in for MCPResponse."""
+    status: str
+    data: Any = None
+    error: Optional[str] = None
+
+def flight_results(count: int) -> FlightSearchResponse:
+    flights = [
+        Flight(
+            id=f"FL{i}",
+            segments=[
+                FlightSegment(
+                    flight_number=f"AA{100 + j}",
+                    airline_code="AA",
+                    departure_airport="JFK" if j == 0 else "ORD",
+                    arrival_airport="ORD" if j == 0 else "LAX",
+                    departure_time="2026-12-01T10:00:00Z",
+                    arrival_time="2026-12-01T12:00:00Z",
+                    duration_minutes=120
+                )
+                for j in range(2)
+            ],
+            price=Price(amount=199.0 + i, currency="USD"),
+            cabin_class="ECONOMY",
+            available_seats=9
+        )
+        for i in range(count)
+    ]
+    return FlightSearchResponse(flights=flights, total_count=count)
+
+def wallet(count: int) -> PaymentMethodsResponse:
+    cards = [
+        Card(
+            card_id=f"card_{i}",
+            type="CREDIT",
+            last_four_digits=f"{i:04d}",
+            expiry_month=1 + i % 12,
+            expiry_year=2030,
+            cardholder_name="John Doe",
+            is_default=i == 0
+        )
+        for i in range(count)
+    ]
+    return PaymentMethodsResponse(cards=cards, total_count=count)
+
+def card_benefits() -> Dict[str, Any]:
+    with open(CATALOG_PATH, "rb") as f:
+        return json.load(f)["cards"][0]
+
+def time_call(fn: Callable[[], bytes], repeat: int) -> float:
+    number = max(1, repeat)
+    return min(timeit.repeat(fn, number=number, repeat=5)) / number * 1e6
+
+def main(args: argparse.Namespace) -> None:
+    payloads = {
+        f"flights ({args.flights})": flight_results(args.flights),
+        f"wallet ({args.cards} cards)": wallet(args.cards),
+        "card benefits": card_benefits()
+    }
+    print(f"orjson: {'yes' if orjson else 'no (pydantic_core fallback)'}")
+    print(
+        f"{'payload':<22}{'bytes':>9}{'dict+json':>12}{'dict+envelope':>15}"
+        f"{'fast':>10}{'cached':>10}   (us per call)"
+    )
+    for name, payload in payloads.items():
+        as_dict = (
+            (lambda: payload.model_dump()) if isinstance(payload, BaseModel) else (lambda: payload)
+        )
+        cached = RawJSON(dumps(payload))
+        paths = {
+            "dict+json": lambda: json.dumps(
+                {"status": "success", "data": as_dict(), "error": None}, default=str
+            ).encode(),
+            "dict+envelope": lambda: (
+                Envelope(status="success", data=as_dict()).model_dump_json().encode()
+            ),
+            "fast": lambda: response_json("success", data=payload),
+            "cached": lambda: response_json("success", data=cached)
+        }
+        # Every path must produce the same document
+        reference = json.loads(paths["fast"]())
+        for path in paths.values():
+            assert json.loads(path()) == reference
+        timings = {path_name: time_call(path, args.repeat) for path_name, path in paths.items()}
+        print(
+            f"{name:<22}{len(cached.content):>9}"
+            f"{timings['dict+json']:>12.1f}{timings['dict+envelope']:>15.1f}"
+            f"{timings['fast']:>10.1f}{timings['cached']:>10.1f}"
+        )
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--flights", type=int, default=500)
+    parser.add_argument("--cards", type=int, default=8)
+    parser.add_argument("--repeat", type=int, default=200)
+    main(parser.parse_args())
@@ -0,0 +1,106 @@
+"""Micro-benchmark of building result models with and without re-validation.
+
+Run from packages/mcp_servers:
+
+    python benchmarks/trusted_models.py --flights 10 100 1000 --cards 8 64
+
+For flight search results and wallets of several sizes it times:
+
+  validated  model constructors, re-checking every constraint (debug mode)
+  trusted    shared.models.trusted.trusted, i.e. model_construct
+  +json      the same followed by serialization to the response JSON, to
+             show the share of per-request CPU the validation accounts for
+"""
+import argparse
+import timeit
+from typing import Any, Callable, Dict, List
+from pydantic import BaseModel
+from shared.models.api.flight_search import Flight, FlightSearchResponse, FlightSegment, Price
+from shared.models.api.payment_methods import Card, PaymentMethodsResponse
+from shared.models.trusted import set_trusted_validation, trusted
+from shared.server import response_json
+
+def flight_results(count: int) -> FlightSearchResponse:
+    flights = [
+        trusted(
+            Flight,
+            id=f"FL{i}",
+            segments=[
+                trusted(
+                    FlightSegment,
+                    flight_number=f"AA{100 + j}",
+                    airline_code="AA",
+                    departure_airport="JFK" if j == 0 else "ORD",
+                    arrival_airport="ORD" if j == 0 else "LAX",
+                    departure_time="2026-12-01T10:00:00Z",
+                    arrival_time="2026-12-01T12:00:00Z",
+                    duration_minutes=120
+                )
+                for j in range(2)
+            ],
+            price=trusted(Price, amount=199.0 + i, currency="USD"),
+            cabin_class="ECONOMY",
+            available_seats=9
+        )
+        for i in range(count)
+    ]
+    return trusted(FlightSearchResponse, flights=flights, total_count=count)
+
+def wallet(count: int) -> PaymentMethodsResponse:
+    cards = [
+        trusted(
+            Card,
+            card_id=f"card_{i}",
+            type="CREDIT",
+            last_four_digits=f"{i:04d}",
+            expiry_month=1 + i % 12,
+            expiry_year=2030,
+            cardholder_name="John Doe",
+            is_default=i == 0
+        )
+        for i in range(count)
+    ]
+    return trusted(PaymentMethodsResponse, cards=cards, total_count=count)
+
+def timed(build: Callable[[], BaseModel], validate: bool, serialize: bool, repeat: int) -> float:
+    def run() -> Any:
+        model = build()
+        return response_json("success", data=model) if serialize else model
+    set_trusted_validation(validate)
+    number = max(1, repeat)
+    return min(timeit.repeat(run, number=number, repeat=5)) / number * 1e6
+
+def main(args: argparse.Namespace) -> None:
+    builders: Dict[str, Callable[[], BaseModel]] = {}
+    for count in args.flights:
+        builders[f"flights ({count})"] = lambda count=count: flight_results(count)
+    for count in args.cards:
+        builders[f"wallet ({count} cards)"] = lambda count=count: wallet(count)
+    print(
+        f"{'result set':<20}{'validated':>11}{'trusted':>10}{'saved':>8}"
+        f"{'validated+json':>16}{'trusted+json':>14}{'saved':>8}   (us per request)"
+    )
+    for name, build in builders.items():
+        # Both modes must produce the same document
+        set_trusted_validation(True)
+        reference = response_json("success", data=build())
+        set_trusted_validation(False)
+        assert response_json("success", data=build()) == reference
+        timings: List[float] = [
+            timed(build, validate, serialize, args.repeat)
+            for serialize in (False, True)
+            for validate in (True, False)
+        ]
+        validated, fast, validated_json, fast_json = timings
+        print(
+            f"{name:<20}{validated:>11.1f}{fast:>10.1f}{1 - fast / validated:>8.0%}"
+            f"{validated_json:>16.1f}{fast_json:>14.1f}{1 - fast_json / validated_json:>8.0%}"
+        )
+    set_trusted_validation(False)
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--flights", type=int, nargs="+", default=[10, 100, 1000])
+    parser.add_argument("--cards", type=int, nargs="+", default=[8, 64])
+    parser.add_argument("--repeat", type=int, default=20)
+    main(parser.parse_args())
@@ -0,0 +1,129 @@
+import json
+import os
+from dataclasses import dataclass, field
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, Optional
+from loguru import logger
+from shared.models.api.travel_benefits import BenefitsResponse
+from catalog.watched_file import WatchedFile
+from engine.rules import (
+    DEFAULT_CATEGORY,
+    DEFAULT_MULTIPLIER,
+    CompiledRuleSet,
+    RewardRule,
+    compile_rules,
+    rules_from_multipliers
+)
+
+DEFAULT_CATALOG_PATH = Path(__file__).resolve().parent.parent / "data" / "card_catalog.json"
+DEFAULT_RELOAD_INTERVAL = 1.0
+
+@dataclass(frozen=True)
+class CatalogEntry:
+    """A card's benefits, validated and serialized once at load time."""
+    response: BenefitsResponse
+    payload: Dict[str, Any]
+    payload_json: bytes
+    multipliers: Dict[str, float]
+    rules: CompiledRuleSet
+    rewards_program: Optional[str] = None
+    portal_cents_per_point: Optional[float] = None
+    trip_benefit_values: Dict[str, float] = field(default_factory=dict)
+
+    @classmethod
+    def from_raw(cls, raw: Dict[str, Any]) -> "CatalogEntry":
+        response = BenefitsResponse(**raw)
+        multipliers = {m.category: m.multiplier for m in response.multipliers}
+        # Cards without explicit earn rules fall back to their flat multipliers
+        rules = (
+            [RewardRule(**rule) for rule in raw["rules"]]
+            if raw.get("rules")
+            else rules_from_multipliers(multipliers)
+        )
+        return cls(
+            response=response,
+            payload=response.model_dump(),
+            payload_json=response.model_dump_json().encode(),
+            multipliers=multipliers,
+            rules=compile_rules(
+                rules, default_multiplier=multipliers.get(DEFAULT_CATEGORY, DEFAULT_MULTIPLIER)
+            ),
+            rewards_program=raw.get("rewards_program"),
+            portal_cents_per_point=raw.get("portal_cents_per_point"),
+            # Estimated value per trip of the active benefits that apply to a booking
+            trip_benefit_values={
+                benefit["benefit_id"]: float(benefit["trip_value"])
+                for benefit in raw.get("benefits", [])
+                if benefit.get("trip_value") and benefit.get("is_active", True)
+            }
+        )
+
+@dataclass(frozen=True)
+class CatalogSnapshot:
+    """Immutable view of the catalog file at one point in time."""
+    version: int
+    entries: Dict[str, CatalogEntry] = field(default_factory=dict)
+
+class CardCatalog:
+    """Card benefits catalog indexed by card_id and hot reloaded from disk.
+
+    Readers always see a complete snapshot: a reload builds the new index
+    off to the side and swaps it in with a single assignment, so requests
+    in flight keep using the snapshot they started with.
+    """
+
+    def __init__(self, path: Path, reload_interval: float = DEFAULT_RELOAD_INTERVAL):
+        self.path = Path(path)
+        self._watched = WatchedFile(self.path, reload_interval)
+        self._watched.mark_seen()
+        self._snapshot = self._build_snapshot(version=1)
+
+    @property
+    def version(self) -> int:
+        return self._snapshot.version
+
+    @property
+    def snapshot(self) -> CatalogSnapshot:
+        self._maybe_reload()
+        return self._snapshot
+
+    def get(self, card_id: str) -> Optional[CatalogEntry]:
+        """Look up a card's catalog entry."""
+        return self.snapshot.entries.get(card_id)
+
+    def reload(self) -> bool:
+        """Reload the catalog file, keeping the current snapshot on failure."""
+        try:
+            self._snapshot = self._build_snapshot(version=self._snapshot.version + 1)
+        except Exception as e:
+            logger.error(f"Failed to reload card catalog from {self.path}: {str(e)}")
+            return False
+        logger.info(
+            f"Reloaded card catalog v{self.version} with {len(self._snapshot.entries)} cards"
+        )
+        return True
+
+    def _maybe_reload(self) -> None:
+        if self._watched.poll():
+            self.reload()
+
+    def _build_snapshot(self, version: int) -> CatalogSnapshot:
+        with open(self.path, "rb") as f:
+            raw = json.load(f)
+
+        entries = {}
+        for card in raw.get("cards", []):
+            entry = CatalogEntry.from_raw(card)
+            entries[entry.response.card_id] = entry
+
+        return CatalogSnapshot(version=version, entries=entries)
+
+@lru_cache(maxsize=1)
+def get_card_catalog() -> CardCatalog:
+    """Return the process-wide card catalog."""
+    path = os.getenv("BENEFITS_CATALOG_PATH", str(DEFAULT_CATALOG_PATH))
+    reload_interval = float(
+        os.getenv("BENEFITS_CATALOG_RELOAD_INTERVAL", str(DEFAULT_RELOAD_INTERVAL))
+    )
+    return CardCatalog(Path(path), reload_interval=reload_interval)
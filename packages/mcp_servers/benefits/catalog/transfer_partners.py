@@ -0,0 +1,265 @@
+import json
+import math
+import os
+from dataclasses import dataclass, field
+from datetime import date
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, List, Literal, Mapping, Optional, Tuple
+from loguru import logger
+from pydantic import BaseModel, Field
+from catalog.card_catalog import get_card_catalog
+from catalog.watched_file import WatchedFile
+
+DEFAULT_TRANSFER_PARTNERS_PATH = (
+    Path(__file__).resolve().parent.parent / "data" / "transfer_partners.json"
+)
+DEFAULT_RELOAD_INTERVAL = 1.0
+DEFAULT_MAX_HOPS = 3
+
+class LoyaltyProgram(BaseModel):
+    """A points, miles or cashback program with its baseline valuation."""
+    program_id: str = Field(..., description="Program identifier")
+    name: str = Field(..., description="Program name")
+    type: Literal["points", "miles", "cashback"] = Field(..., description="Reward type")
+    cents_per_point: float = Field(..., gt=0, description="Baseline value of one point in cents")
+
+class TransferPartner(BaseModel):
+    """A one-way transfer between two programs."""
+    from_program: str = Field(..., description="Source program identifier")
+    to_program: str = Field(..., description="Destination program identifier")
+    ratio: float = Field(..., gt=0, description="Destination points per source point")
+    bonus: float = Field(0.0, ge=0, description="Promotional bonus as a fraction, e.g. 0.3 for 30%")
+    bonus_valid_from: Optional[date] = Field(None, description="First day of the bonus (inclusive)")
+    bonus_valid_to: Optional[date] = Field(None, description="Last day of the bonus (inclusive)")
+
+    def rate(self, as_of: date) -> float:
+        """Destination points per source point on a given day."""
+        is_bonus_active = (
+            self.bonus > 0
+            and (self.bonus_valid_from is None or self.bonus_valid_from <= as_of)
+            and (self.bonus_valid_to is None or as_of <= self.bonus_valid_to)
+        )
+        return self.ratio * (1 + self.bonus) if is_bonus_active else self.ratio
+
+@dataclass(frozen=True)
+class TransferPath:
+    """Best way to move points from one program into another."""
+    program_id: str
+    rate: float
+    hops: Tuple[str, ...]
+
+@dataclass(frozen=True)
+class TransferSnapshot:
+    """Transfer table at one point in time, with its memoized best paths."""
+    version: int
+    programs: Dict[str, LoyaltyProgram]
+    partners: Dict[str, List[TransferPartner]]
+    paths: Dict[Tuple[str, date], Dict[str, TransferPath]] = field(default_factory=dict)
+
+class TransferGraph:
+    """Points transfer-partner graph with memoized best-value paths.
+
+    Memoized paths live on the snapshot, so replacing the snapshot on a
+    reload invalidates every cached path at once.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        reload_interval: float = DEFAULT_RELOAD_INTERVAL,
+        max_hops: int = DEFAULT_MAX_HOPS
+    ):
+        self.path = Path(path)
+        self.max_hops = max_hops
+        self._watched = WatchedFile(self.path, reload_interval)
+        self._watched.mark_seen()
+        self._snapshot = self._build_snapshot(version=1)
+
+    @property
+    def version(self) -> int:
+        return self._snapshot.version
+
+    @property
+    def snapshot(self) -> TransferSnapshot:
+        if self._watched.poll():
+            self.reload()
+        return self._snapshot
+
+    def reload(self) -> bool:
+        """Reload the transfer table, keeping the current one on failure."""
+        try:
+            self._snapshot = self._build_snapshot(version=self._snapshot.version + 1)
+        except Exception as e:
+            logger.error(f"Failed to reload transfer partners from {self.path}: {str(e)}")
+            return False
+        logger.info(f"Reloaded transfer partners v{self.version}")
+        return True
+
+    def get_program(self, program_id: str) -> LoyaltyProgram:
+        program = self.snapshot.programs.get(program_id)
+        if program is None:
+            raise ValueError(f"Unknown rewards program: {program_id}")
+        return program
+
+    def best_paths(self, source: str, as_of: Optional[date] = None) -> Dict[str, TransferPath]:
+        """Highest-rate path from source to every reachable program."""
+        snapshot = self.snapshot
+        if source not in snapshot.programs:
+            raise ValueError(f"Unknown rewards program: {source}")
+
+        as_of = as_of or date.today()
+        key = (source, as_of)
+        cached = snapshot.paths.get(key)
+        if cached is None:
+            cached = _search_paths(snapshot.partners, source, as_of, self.max_hops)
+            snapshot.paths[key] = cached
+        return cached
+
+    def value_points(self, source: str, as_of: Optional[date] = None) -> List[Dict[str, Any]]:
+        """Baseline value of one source point in each reachable program."""
+        programs = self.snapshot.programs
+        options = [
+            {
+                "program_id": path.program_id,
+                "program_name": programs[path.program_id].name,
+                "transfer_rate": path.rate,
+                "cents_per_point": path.rate * programs[path.program_id].cents_per_point,
+                "path": list(path.hops)
+            }
+            for path in self.best_paths(source, as_of).values()
+        ]
+        return sorted(options, key=lambda option: option["cents_per_point"], reverse=True)
+
+    def price_fare(
+        self,
+        source: str,
+        fare_amount: float,
+        award_costs: Mapping[str, float],
+        taxes_and_fees: float = 0.0,
+        portal_cents_per_point: Optional[float] = None,
+        as_of: Optional[date] = None
+    ) -> Dict[str, Any]:
+        """Price a fare in source points for each way of redeeming them.
+
+        cents_per_point is the cash fare avoided per source point spent.
+        """
+        if fare_amount <= 0:
+            raise ValueError("Fare amount must be positive")
+
+        paths = self.best_paths(source, as_of)
+        programs = self.snapshot.programs
+        cash_value_cents = max(fare_amount - taxes_and_fees, 0.0) * 100
+        options = []
+
+        for program_id, award_points in award_costs.items():
+            path = paths.get(program_id)
+            if path is None or award_points <= 0:
+                continue
+            source_points = math.ceil(award_points / path.rate)
+            options.append({
+                "method": "transfer",
+                "program_id": program_id,
+                "program_name": programs[program_id].name,
+                "award_points": award_points,
+                "source_points": source_points,
+                "taxes_and_fees": taxes_and_fees,
+                "cents_per_point": cash_value_cents / source_points,
+                "path": list(path.hops)
+            })
+
+        if portal_cents_per_point:
+            options.append({
+                "method": "portal",
+                "program_id": source,
+                "program_name": programs[source].name,
+                "source_points": math.ceil(fare_amount * 100 / portal_cents_per_point),
+                "taxes_and_fees": 0.0,
+                "cents_per_point": portal_cents_per_point,
+                "path": [source]
+            })
+
+        options.sort(key=lambda option: option["cents_per_point"], reverse=True)
+        return {
+            "program_id": source,
+            "fare_amount": fare_amount,
+            "baseline_cents_per_point": programs[source].cents_per_point,
+            "best": options[0] if options else None,
+            "options": options
+        }
+
+    def _build_snapshot(self, version: int) -> TransferSnapshot:
+        with open(self.path, "rb") as f:
+            raw = json.load(f)
+
+        programs = {
+            p.program_id: p for p in (LoyaltyProgram(**item) for item in raw.get("programs", []))
+        }
+        partners: Dict[str, List[TransferPartner]] = {}
+        for item in raw.get("transfers", []):
+            partner = TransferPartner(**item)
+            if partner.from_program not in programs or partner.to_program not in programs:
+                raise ValueError(
+                    f"Transfer {partner.from_program} -> {partner.to_program} "
+                    "references an unknown program"
+                )
+            partners.setdefault(partner.from_program, []).append(partner)
+
+        return TransferSnapshot(version=version, programs=programs, partners=partners)
+
+def _search_paths(
+    partners: Mapping[str, List[TransferPartner]],
+    source: str,
+    as_of: date,
+    max_hops: int
+) -> Dict[str, TransferPath]:
+    """Hop-bounded Bellman-Ford maximizing the product of transfer rates.
+
+    Bonuses can make rates exceed 1, so cycles are excluded per path.
+    """
+    best: Dict[str, TransferPath] = {source: TransferPath(source, 1.0, (source,))}
+    frontier = [source]
+    for _ in range(max_hops):
+        improved: Dict[str, TransferPath] = {}
+        for program_id in frontier:
+            current = best[program_id]
+            for partner in partners.get(program_id, []):
+                if partner.to_program in current.hops:
+                    continue
+                rate = current.rate * partner.rate(as_of)
+                incumbent = improved.get(partner.to_program) or best.get(partner.to_program)
+                if incumbent is None or rate > incumbent.rate:
+                    improved[partner.to_program] = TransferPath(
+                        partner.to_program, rate, current.hops + (partner.to_program,)
+                    )
+        if not improved:
+            break
+        best.update(improved)
+        frontier = list(improved)
+    return best
+
+def resolve_rewards_program(
+    card_id: Optional[str] = None,
+    program_id: Optional[str] = None
+) -> Tuple[str, Optional[float]]:
+    """Program and portal valuation for a card, or an explicit program."""
+    if program_id:
+        return program_id, None
+    if not card_id:
+        raise ValueError("Either card_id or program_id is required")
+
+    entry = get_card_catalog().get(card_id)
+    if entry is None:
+        raise ValueError(f"Unknown card ID: {card_id}")
+    if not entry.rewards_program:
+        raise ValueError(f"Card {card_id} does not earn transferable points")
+    return entry.rewards_program, entry.portal_cents_per_point
+
+@lru_cache(maxsize=1)
+def get_transfer_graph() -> TransferGraph:
+    """Return the process-wide transfer-partner graph."""
+    path = os.getenv("BENEFITS_TRANSFER_PARTNERS_PATH", str(DEFAULT_TRANSFER_PARTNERS_PATH))
+    reload_interval = float(
+        os.getenv("BENEFITS_CATALOG_RELOAD_INTERVAL", str(DEFAULT_RELOAD_INTERVAL))
+    )
+    return TransferGraph(Path(path), reload_interval=reload_interval)
@@ -0,0 +1,38 @@
+import time
+from pathlib import Path
+from typing import Optional, Tuple
+from loguru import logger
+
+class WatchedFile:
+    """Cheap change detection for a data file, throttled to one stat() per interval."""
+
+    def __init__(self, path: Path, interval: float):
+        self.path = Path(path)
+        self.interval = interval
+        self._next_check = 0.0
+        self._last_seen: Optional[Tuple[int, int]] = None
+
+    def mark_seen(self) -> None:
+        """Record the file's current state as loaded."""
+        self._last_seen = self._stat()
+
+    def poll(self) -> bool:
+        """Return True once per change to the file since it was last seen."""
+        now = time.monotonic()
+        if now < self._next_check:
+            return False
+        self._next_check = now + self.interval
+
+        try:
+            seen = self._stat()
+        except OSError as e:
+            logger.warning(f"Data file {self.path} is not accessible: {str(e)}")
+            return False
+        if seen == self._last_seen:
+            return False
+        self._last_seen = seen
+        return True
+
+    def _stat(self) -> Tuple[int, int]:
+        stat = self.path.stat()
+        return (stat.st_mtime_ns, stat.st_size)
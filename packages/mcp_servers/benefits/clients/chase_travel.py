@@ -0,0 +1,34 @@
+import os
+from typing import Any, Dict, List, Optional
+import httpx
+
+DEFAULT_CHASE_TRAVEL_URL = "http://localhost:3001"
+DEFAULT_TIMEOUT = 10.0
+
+class SearchUnavailableError(Exception):
+    """Raised when the Chase Travel server cannot return a stored search."""
+    pass
+
+def get_chase_travel_url() -> str:
+    return os.getenv("CHASE_TRAVEL_URL", DEFAULT_CHASE_TRAVEL_URL).rstrip("/")
+
+class ChaseTravelClient:
+    """Chase Travel HTTP client for stored search results, reusing connections between calls."""
+
+    def __init__(self, base_url: Optional[str] = None, timeout: float = DEFAULT_TIMEOUT):
+        self.base_url = (base_url or get_chase_travel_url()).rstrip("/")
+        self._client = httpx.AsyncClient(base_url=self.base_url, timeout=timeout)
+
+    async def fetch_search_flights(self, search_id: str) -> List[Dict[str, Any]]:
+        """Fetch every flight of a stored search; the search itself is not run again."""
+        try:
+            response = await self._client.get(f"/api/searches/{search_id}/flights")
+            if response.status_code == 404:
+                raise ValueError(f"Unknown or expired search: {search_id}")
+            response.raise_for_status()
+            return response.json()["flights"]
+        except (httpx.HTTPError, KeyError) as e:
+            raise SearchUnavailableError(f"Could not load search {search_id}: {str(e)}") from e
+
+    async def aclose(self) -> None:
+        await self._client.aclose()
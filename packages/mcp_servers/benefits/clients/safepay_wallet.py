@@ -0,0 +1,36 @@
+import os
+from typing import Any, Dict, List, Optional
+import httpx
+
+DEFAULT_SAFEPAY_WALLET_URL = "http://localhost:3002"
+DEFAULT_TIMEOUT = 10.0
+
+class WalletUnavailableError(Exception):
+    """Raised when the SafePay Wallet server cannot return a user's wallet."""
+    pass
+
+def get_safepay_wallet_url() -> str:
+    return os.getenv("SAFEPAY_WALLET_URL", DEFAULT_SAFEPAY_WALLET_URL).rstrip("/")
+
+class SafePayWalletClient:
+    """SafePay Wallet HTTP client that keeps its connections open between calls."""
+
+    def __init__(self, base_url: Optional[str] = None, timeout: float = DEFAULT_TIMEOUT):
+        self.base_url = (base_url or get_safepay_wallet_url()).rstrip("/")
+        self._client = httpx.AsyncClient(base_url=self.base_url, timeout=timeout)
+
+    async def fetch_wallet_cards(self, user_id: str) -> List[Dict[str, Any]]:
+        """Fetch a user's cards from the SafePay Wallet server."""
+        try:
+            response = await self._client.get(
+                "/api/wallet/payment-methods", headers={"user-id": user_id}
+            )
+            response.raise_for_status()
+            return response.json()["cards"]
+        except (httpx.HTTPError, KeyError, ValueError) as e:
+            raise WalletUnavailableError(
+                f"Could not load wallet for user {user_id}: {str(e)}"
+            ) from e
+
+    async def aclose(self) -> None:
+        await self._client.aclose()
@@ -0,0 +1,274 @@
+import csv
+import io
+import os
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from dataclasses import asdict, dataclass, field
+from itertools import compress
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Set, Tuple
+import numpy as np
+from catalog.card_catalog import CardCatalog, get_card_catalog
+from engine.rules import (
+    CapState,
+    CompiledRuleSet,
+    aggregate_spend,
+    dictionary_encode,
+    make_stream,
+    rewards_for_spend
+)
+
+DEFAULT_CHUNK_BYTES = 8 * 1024 * 1024
+DEFAULT_CENTS_PER_POINT = 1.0
+REQUIRED_COLUMNS = ("date", "amount", "category")
+BREAK_EVEN_MAX_SCALE = 1e6
+BREAK_EVEN_ITERATIONS = 60
+
+# Catalog loaded once per worker process by _init_worker
+_worker_catalog: Optional[CardCatalog] = None
+
+@dataclass
+class ChunkSummary:
+    """Spend aggregated from one chunk of the transaction file."""
+    rows: int = 0
+    skipped_rows: int = 0
+    total_spend: float = 0.0
+    spend_by_card: Dict[str, CapState] = field(default_factory=dict)
+
+    def merge(self, other: "ChunkSummary") -> None:
+        self.rows += other.rows
+        self.skipped_rows += other.skipped_rows
+        self.total_spend += other.total_spend
+        for card_id, spend in other.spend_by_card.items():
+            merged = self.spend_by_card.setdefault(card_id, {})
+            for key, amount in spend.items():
+                merged[key] = merged.get(key, 0.0) + amount
+
+@dataclass(frozen=True)
+class CardFeeResult:
+    """Net value of one card over the simulated year."""
+    card_id: str
+    card_name: str
+    annual_fee: float
+    rewards_points: float
+    cents_per_point: float
+    rewards_value: float
+    net_value: float
+    break_even_spend: Optional[float]
+
+def iter_chunks(
+    path: Path, chunk_bytes: int = DEFAULT_CHUNK_BYTES
+) -> Tuple[List[str], Iterator[bytes]]:
+    """Split a CSV into its header and newline-aligned chunks of about chunk_bytes."""
+    with open(path, "rb") as f:
+        header = next(csv.reader([f.readline().decode("utf-8-sig")]), [])
+        body_start = f.tell()
+
+    def chunks() -> Iterator[bytes]:
+        # Opened lazily, so a caller that rejects the header leaks no handle
+        with open(path, "rb") as f:
+            f.seek(body_start)
+            carry = b""
+            while True:
+                block = f.read(chunk_bytes)
+                if not block:
+                    break
+                block = carry + block
+                cut = block.rfind(b"\n") + 1
+                if cut == 0:
+                    carry = block
+                    continue
+                carry = block[cut:]
+                yield block[:cut]
+            if carry.strip():
+                yield carry
+
+    return [column.strip().lower() for column in header], chunks()
+
+def summarize_chunk(
+    catalog: CardCatalog,
+    card_ids: Sequence[str],
+    header: Sequence[str],
+    chunk: bytes
+) -> ChunkSummary:
+    """Parse a chunk and aggregate its spend per card, rule and period."""
+    columns = {name: header.index(name) for name in REQUIRED_COLUMNS}
+    merchant_column = header.index("merchant") if "merchant" in header else None
+    width = max(columns.values()) + 1
+
+    rows = [row for row in csv.reader(io.StringIO(chunk.decode("utf-8"))) if row]
+    valid = [row for row in rows if len(row) >= width]
+    amounts = _parse_column([row[columns["amount"]] for row in valid], np.float64, np.nan)
+    days = _parse_column(
+        [row[columns["date"]].strip() for row in valid], "datetime64[D]", np.datetime64("NaT")
+    )
+    # Rows with an unparseable, missing or non-finite amount or date are skipped
+    parsed = np.isfinite(amounts) & ~np.isnat(days)
+    if not parsed.all():
+        valid = list(compress(valid, parsed))
+        amounts, days = amounts[parsed], days[parsed]
+    summary = ChunkSummary(rows=len(valid), skipped_rows=len(rows) - len(valid))
+    if not valid:
+        return summary
+
+    categories, category_codes = dictionary_encode(
+        row[columns["category"]].strip().upper() for row in valid
+    )
+    merchants, merchant_codes = dictionary_encode(
+        (
+            row[merchant_column].strip().upper()
+            if merchant_column is not None and len(row) > merchant_column
+            else ""
+        )
+        for row in valid
+    )
+    # Refunds and credits do not earn rewards
+    amounts = np.clip(amounts, 0, None)
+    stream = make_stream(categories, category_codes, merchants, merchant_codes, days, amounts)
+
+    summary.total_spend = float(amounts.sum())
+    entries = catalog.snapshot.entries
+    summary.spend_by_card = {
+        card_id: aggregate_spend(entries[card_id].rules, stream) for card_id in card_ids
+    }
+    return summary
+
+def _parse_column(values: List[str], dtype: Any, missing: Any) -> np.ndarray:
+    """Convert a column in one call, or row by row with missing for malformed values."""
+    try:
+        return np.array(values, dtype=dtype)
+    except ValueError:
+        pass
+    parsed = np.empty(len(values), dtype=dtype)
+    for i, value in enumerate(values):
+        try:
+            parsed[i] = value
+        except ValueError:
+            parsed[i] = missing
+    return parsed
+
+def simulate_annual_fees(
+    path: Path,
+    card_ids: Optional[Sequence[str]] = None,
+    chunk_bytes: int = DEFAULT_CHUNK_BYTES,
+    workers: Optional[int] = None,
+    cents_per_point: Optional[float] = None
+) -> Dict[str, Any]:
+    """Stream a year of transactions and value every catalog card net of its fee.
+
+    Chunks are parsed and aggregated in worker processes; at most two
+    chunks per worker are in flight, so memory stays bounded regardless of
+    file size.
+    """
+    catalog = get_card_catalog()
+    entries = catalog.snapshot.entries
+    card_ids = list(card_ids or entries)
+    unknown = [card_id for card_id in card_ids if card_id not in entries]
+    if unknown:
+        raise ValueError(f"Unknown card IDs: {', '.join(unknown)}")
+
+    header, chunks = iter_chunks(Path(path), chunk_bytes)
+    missing = [name for name in REQUIRED_COLUMNS if name not in header]
+    if missing:
+        raise ValueError(f"Transaction file is missing columns: {', '.join(missing)}")
+
+    workers = workers or os.cpu_count() or 1
+    summary = ChunkSummary()
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=_init_worker,
+        initargs=(str(catalog.path),)
+    ) as executor:
+        pending: Set[Future] = set()
+        for chunk in chunks:
+            if len(pending) >= workers * 2:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    summary.merge(future.result())
+            pending.add(executor.submit(_summarize_in_worker, card_ids, header, chunk))
+        for future in pending:
+            summary.merge(future.result())
+
+    results = [
+        _card_result(
+            catalog,
+            card_id,
+            summary.spend_by_card.get(card_id, {}),
+            summary.total_spend,
+            cents_per_point
+        )
+        for card_id in card_ids
+    ]
+    results.sort(key=lambda result: result.net_value, reverse=True)
+    return {
+        "rows": summary.rows,
+        "skipped_rows": summary.skipped_rows,
+        "total_spend": summary.total_spend,
+        "best_card_id": results[0].card_id if results else None,
+        "cards": [asdict(result) for result in results]
+    }
+
+def _card_result(
+    catalog: CardCatalog,
+    card_id: str,
+    spend: CapState,
+    total_spend: float,
+    cents_per_point: Optional[float]
+) -> CardFeeResult:
+    entry = catalog.snapshot.entries[card_id]
+    point_value = cents_per_point or entry.portal_cents_per_point or DEFAULT_CENTS_PER_POINT
+    annual_fee = entry.response.annual_fee
+    points = rewards_for_spend(entry.rules, spend)
+    value = points * point_value / 100
+
+    return CardFeeResult(
+        card_id=card_id,
+        card_name=entry.response.card_name,
+        annual_fee=annual_fee,
+        rewards_points=points,
+        cents_per_point=point_value,
+        rewards_value=value,
+        net_value=value - annual_fee,
+        break_even_spend=_break_even_spend(entry.rules, spend, total_spend, point_value, annual_fee)
+    )
+
+def _break_even_spend(
+    rules: CompiledRuleSet,
+    spend: CapState,
+    total_spend: float,
+    point_value: float,
+    annual_fee: float
+) -> Optional[float]:
+    """Spend, at the observed category mix, where rewards value covers the fee.
+
+    Caps make rewards concave in spend, so the scale is found by bisection.
+    """
+    if annual_fee <= 0:
+        return 0.0
+    if total_spend <= 0:
+        return None
+
+    def value_at(scale: float) -> float:
+        return rewards_for_spend(rules, spend, scale) * point_value / 100
+
+    high = 1.0
+    while value_at(high) < annual_fee:
+        high *= 2
+        if high > BREAK_EVEN_MAX_SCALE:
+            return None
+    low = 0.0
+    for _ in range(BREAK_EVEN_ITERATIONS):
+        middle = (low + high) / 2
+        if value_at(middle) < annual_fee:
+            low = middle
+        else:
+            high = middle
+    return high * total_spend
+
+def _init_worker(catalog_path: str) -> None:
+    global _worker_catalog
+    _worker_catalog = CardCatalog(Path(catalog_path), reload_interval=float("inf"))
+
+def _summarize_in_worker(
+    card_ids: Sequence[str], header: Sequence[str], chunk: bytes
+) -> ChunkSummary:
+    return summarize_chunk(_worker_catalog, card_ids, header, chunk)
@@ -0,0 +1,383 @@
+import time
+import uuid
+from dataclasses import dataclass
+from datetime import date, datetime, timezone
+from functools import cached_property
+from typing import Any, Dict, List, Mapping, Optional, Sequence
+import numpy as np
+from shared.models.domain import (
+    Airline,
+    Airport,
+    Benefit,
+    Card,
+    Flight,
+    Multiplier,
+    OptimizationResult,
+    PaymentMethod,
+    Recommendation,
+    Reward
+)
+from catalog.card_catalog import CardCatalog
+from engine.annual_fees import DEFAULT_CENTS_PER_POINT
+from engine.rules import dictionary_encode, encode_stream, evaluate_rules
+
+DEFAULT_TOP_K = 5
+TRAVEL_CATEGORY = "TRAVEL"
+
+# Preference penalties in dollars, added to a flight's effective cost
+OVER_BUDGET_PENALTY = 2.0            # per dollar above max_price
+NON_PREFERRED_AIRLINE_PENALTY = 50.0  # once per flight with a segment on another airline
+SHORT_LAYOVER_PENALTY = 1.0          # per minute the shortest connection is below min_layover_time
+
+@dataclass(frozen=True)
+class OptimizationPreferences:
+    """Soft preferences; a flight that misses one is penalized, not excluded."""
+    max_price: Optional[float] = None
+    preferred_airlines: frozenset = frozenset()
+    min_layover_time: Optional[float] = None
+
+    @classmethod
+    def from_dict(cls, preferences: Optional[Mapping[str, Any]]) -> "OptimizationPreferences":
+        preferences = preferences or {}
+        max_price = preferences.get("max_price")
+        min_layover_time = preferences.get("min_layover_time")
+        return cls(
+            max_price=None if max_price is None else float(max_price),
+            preferred_airlines=frozenset(
+                code.upper() for code in preferences.get("preferred_airlines") or ()
+            ),
+            min_layover_time=None if min_layover_time is None else float(min_layover_time)
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "max_price": self.max_price,
+            "preferred_airlines": sorted(self.preferred_airlines),
+            "min_layover_time": self.min_layover_time
+        }
+
+@dataclass(frozen=True)
+class FlightColumns:
+    """Candidate flights in columnar form; segments flattened, carriers dictionary-encoded."""
+    flights: Sequence[Mapping[str, Any]]
+    prices: np.ndarray
+    carriers: np.ndarray
+    segment_carriers: np.ndarray
+    segment_flights: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.prices)
+
+    @cached_property
+    def min_layovers(self) -> np.ndarray:
+        """Shortest connection per flight in minutes; inf for nonstop flights.
+
+        Times are only parsed for connections, and only when a
+        min_layover_time preference asks for them.
+        """
+        segments = [segment for flight in self.flights for segment in flight["segments"]]
+        connects = np.flatnonzero(self.segment_flights[1:] == self.segment_flights[:-1]).tolist()
+        departures = _timestamps([segments[i + 1]["departure_time"] for i in connects])
+        arrivals = _timestamps([segments[i]["arrival_time"] for i in connects])
+        layovers = np.full(len(self), np.inf)
+        np.minimum.at(layovers, self.segment_flights[1:][connects], (departures - arrivals) / 60)
+        return layovers
+
+@dataclass(frozen=True)
+class WalletColumns:
+    """A wallet's cards with catalog entries, valued for a travel purchase."""
+    cards: List[Mapping[str, Any]]
+    card_names: List[str]
+    multipliers: np.ndarray
+    reward_rates: np.ndarray
+    benefit_values: np.ndarray
+    benefits: List[List[Dict[str, Any]]]
+
+    def __len__(self) -> int:
+        return len(self.cards)
+
+def encode_flights(flights: Sequence[Mapping[str, Any]]) -> FlightColumns:
+    """Flatten flight search results (shared.models.api.flight_search.Flight dicts) into columns."""
+    prices = np.empty(len(flights))
+    segment_counts = np.empty(len(flights), dtype=np.intp)
+    carrier_codes: List[str] = []
+    row = 0
+    try:
+        for row, flight in enumerate(flights):
+            prices[row] = flight["price"]["amount"]
+            segments = flight["segments"]
+            if not segments:
+                raise ValueError(f"Flight {flight['id']} has no segments")
+            segment_counts[row] = len(segments)
+            carrier_codes.extend([segment["airline_code"] for segment in segments])
+    except (KeyError, TypeError) as e:
+        raise ValueError(f"Malformed flight at index {row}: missing {str(e)}") from e
+
+    carriers, segment_carriers = dictionary_encode(carrier_codes)
+    return FlightColumns(
+        flights=flights,
+        prices=prices,
+        carriers=carriers,
+        segment_carriers=segment_carriers,
+        segment_flights=np.repeat(np.arange(len(flights)), segment_counts)
+    )
+
+def build_wallet_columns(
+    cards: Sequence[Mapping[str, Any]],
+    catalog: CardCatalog,
+    as_of: Optional[date] = None
+) -> WalletColumns:
+    """Value each wallet card for a travel purchase from its catalog entry.
+
+    The reward rate is the card's travel multiplier on as_of, at its first
+    tier rate, times its portal value per point; benefit values are the
+    card's per-trip benefit estimates.
+    """
+    entries = catalog.snapshot.entries
+    # Default card first, so it wins ties
+    known = sorted(
+        (card for card in cards if card["card_id"] in entries),
+        key=lambda card: not card.get("is_default", False)
+    )
+    if not known:
+        raise ValueError("No cards with known benefits in wallet")
+
+    probe = encode_stream([{"category": TRAVEL_CATEGORY, "amount": 0.0}], as_of=as_of)
+    card_entries = [entries[card["card_id"]] for card in known]
+    multipliers = np.array(
+        [evaluate_rules(entry.rules, probe).multipliers[0] for entry in card_entries]
+    )
+    cents_per_point = np.array(
+        [entry.portal_cents_per_point or DEFAULT_CENTS_PER_POINT for entry in card_entries]
+    )
+    benefits = [
+        [
+            {"benefit": benefit, "value": entry.trip_benefit_values[benefit.benefit_id]}
+            for benefit in entry.response.benefits
+            if benefit.benefit_id in entry.trip_benefit_values
+        ]
+        for entry in card_entries
+    ]
+    return WalletColumns(
+        cards=known,
+        card_names=[entry.response.card_name for entry in card_entries],
+        multipliers=multipliers,
+        reward_rates=multipliers * cents_per_point / 100,
+        benefit_values=np.array(
+            [sum(item["value"] for item in card_benefits) for card_benefits in benefits]
+        ),
+        benefits=benefits,
+    )
+
+def preference_penalties(
+    flights: FlightColumns, preferences: OptimizationPreferences
+) -> np.ndarray:
+    """Penalty per flight, in dollars."""
+    penalties = np.zeros(len(flights))
+    if preferences.max_price is not None:
+        penalties += OVER_BUDGET_PENALTY * np.maximum(flights.prices - preferences.max_price, 0.0)
+    if preferences.preferred_airlines:
+        other_carrier = ~np.isin(flights.carriers, list(preferences.preferred_airlines))
+        other_segments = np.bincount(
+            flights.segment_flights,
+            weights=other_carrier[flights.segment_carriers].astype(float),
+            minlength=len(flights)
+        )
+        penalties += NON_PREFERRED_AIRLINE_PENALTY * (other_segments > 0)
+    if preferences.min_layover_time:
+        penalties += SHORT_LAYOVER_PENALTY * np.maximum(
+            preferences.min_layover_time - flights.min_layovers, 0.0
+        )
+    return penalties
+
+def value_matrix(
+    flights: FlightColumns, wallet: WalletColumns, penalties: np.ndarray
+) -> np.ndarray:
+    """flights x cards net value: rewards + trip benefits - price - preference penalties."""
+    values = np.multiply.outer(flights.prices, wallet.reward_rates)
+    values += wallet.benefit_values
+    values -= (flights.prices + penalties)[:, None]
+    return values
+
+def top_k(scores: np.ndarray, k: int) -> np.ndarray:
+    """Indices of the k highest scores, best first; ties keep input order.
+
+    argpartition selects the k candidates in linear time, so only those are sorted.
+    """
+    k = min(k, len(scores))
+    if k <= 0:
+        return np.empty(0, dtype=np.intp)
+    candidates = np.argpartition(-scores, k - 1)[:k] if k < len(scores) else np.arange(len(scores))
+    return candidates[np.lexsort((candidates, -scores[candidates]))]
+
+def optimize_travel(
+    flights: Sequence[Mapping[str, Any]],
+    cards: Sequence[Mapping[str, Any]],
+    catalog: CardCatalog,
+    preferences: Optional[Mapping[str, Any]] = None,
+    k: int = DEFAULT_TOP_K,
+    as_of: Optional[date] = None,
+    metadata: Optional[Dict[str, Any]] = None
+) -> OptimizationResult:
+    """Rank flight and payment card pairs by net value.
+
+    Every flight is valued against every card in one flights x cards
+    matrix; each flight keeps its best card and the top k flights become
+    recommendations. Only those k are turned into models.
+    """
+    if not flights:
+        raise ValueError("At least one flight is required")
+    if k < 1:
+        raise ValueError("top_k must be at least 1")
+
+    started = time.perf_counter()
+    parsed_preferences = OptimizationPreferences.from_dict(preferences)
+    columns = encode_flights(flights)
+    wallet = build_wallet_columns(cards, catalog, as_of=as_of)
+    penalties = preference_penalties(columns, parsed_preferences)
+    values = value_matrix(columns, wallet, penalties)
+
+    best_cards = values.argmax(axis=1)
+    ranked = top_k(values[np.arange(len(columns)), best_cards], k)
+    recommendations = [
+        _recommendation(
+            columns, wallet, row, int(best_cards[row]), float(penalties[row]), parsed_preferences
+        )
+        for row in ranked.tolist()
+    ]
+    return OptimizationResult(
+        id=f"opt_{uuid.uuid4().hex}",
+        recommendations=recommendations,
+        created_at=datetime.now(timezone.utc),
+        metadata={
+            **(metadata or {}),
+            "flight_count": len(columns),
+            "card_count": len(wallet),
+            "preferences": parsed_preferences.to_dict(),
+            "elapsed_ms": round((time.perf_counter() - started) * 1000, 3)
+        }
+    )
+
+def _recommendation(
+    columns: FlightColumns,
+    wallet: WalletColumns,
+    row: int,
+    column: int,
+    penalty: float,
+    preferences: OptimizationPreferences
+) -> Recommendation:
+    flight = columns.flights[row]
+    card = wallet.cards[column]
+    card_name = wallet.card_names[column]
+    price = float(columns.prices[row])
+    currency = flight["price"].get("currency", "USD")
+    multiplier = float(wallet.multipliers[column])
+    points = price * multiplier
+    rewards_value = price * float(wallet.reward_rates[column])
+    card_benefits = wallet.benefits[column]
+
+    benefits = [
+        Benefit(
+            id=f"{card['card_id']}_travel_rewards",
+            name=f"{multiplier:g}x points on travel",
+            description=f"{points:,.0f} points on this fare, worth {rewards_value:.2f} {currency}",
+            type="rewards",
+            rewards=[Reward(type="points", amount=points)],
+            multipliers=[Multiplier(category=TRAVEL_CATEGORY, multiplier=multiplier)]
+        )
+    ]
+    benefits.extend(
+        Benefit(
+            id=item["benefit"].benefit_id,
+            name=item["benefit"].name,
+            description=item["benefit"].description,
+            type="travel",
+            rewards=[Reward(type="cashback", amount=item["value"], currency=currency)],
+            multipliers=[]
+        )
+        for item in card_benefits
+    )
+
+    explanation = (
+        f"Pay with {card_name} to earn {points:,.0f} points "
+        f"({multiplier:g}x, worth {rewards_value:.2f} {currency})"
+    )
+    if card_benefits:
+        explanation += " plus " + ", ".join(item["benefit"].name for item in card_benefits)
+    explanation += f" on this {price:.2f} {currency} fare"
+    if penalty > 0:
+        missed = _missed_preferences(columns, row, preferences)
+        explanation += f"; penalized {penalty:.2f} for {', '.join(missed)}"
+
+    return Recommendation(
+        id=f"rec_{flight['id']}_{card['card_id']}",
+        flight=_domain_flight(flight),
+        payment_method=PaymentMethod(
+            id=card["card_id"],
+            type="card",
+            card=Card(
+                id=card["card_id"],
+                last_four=card.get("last_four_digits", ""),
+                brand=card_name,
+                expiry_month=card.get("expiry_month", 0),
+                expiry_year=card.get("expiry_year", 0),
+                is_default=card.get("is_default", False)
+            )
+        ),
+        benefits=benefits,
+        total_savings=round(rewards_value + sum(item["value"] for item in card_benefits), 2),
+        currency=currency,
+        explanation=explanation
+    )
+
+def _missed_preferences(
+    columns: FlightColumns, row: int, preferences: OptimizationPreferences
+) -> List[str]:
+    missed = []
+    if preferences.max_price is not None and columns.prices[row] > preferences.max_price:
+        missed.append(f"exceeding the {preferences.max_price:.2f} budget")
+    segments = columns.flights[row]["segments"]
+    if preferences.preferred_airlines and any(
+        segment["airline_code"] not in preferences.preferred_airlines for segment in segments
+    ):
+        missed.append("a non-preferred airline")
+    if preferences.min_layover_time and columns.min_layovers[row] < preferences.min_layover_time:
+        missed.append(f"a {columns.min_layovers[row]:.0f} minute layover")
+    return missed
+
+def _domain_flight(flight: Mapping[str, Any]) -> Flight:
+    """Domain flight for a search result; search results only carry IATA codes."""
+    segments = flight["segments"]
+    first, last = segments[0], segments[-1]
+    departure_time = datetime.fromisoformat(first["departure_time"])
+    arrival_time = datetime.fromisoformat(last["arrival_time"])
+    return Flight(
+        flight_number="/".join(segment["flight_number"] for segment in segments),
+        airline=Airline(code=first["airline_code"], name=first["airline_code"]),
+        origin=_airport(first["departure_airport"]),
+        destination=_airport(last["arrival_airport"]),
+        departure_time=departure_time,
+        arrival_time=arrival_time,
+        duration=int((arrival_time - departure_time).total_seconds() // 60),
+        aircraft_type="",
+        cabin_class=flight.get("cabin_class", ""),
+        price=flight["price"]["amount"],
+        currency=flight["price"].get("currency", "USD")
+    )
+
+def _airport(code: str) -> Airport:
+    return Airport(code=code, name=code, city="", country="", timezone="UTC")
+
+def _timestamps(values: List[str]) -> np.ndarray:
+    """Epoch seconds; UTC ("Z") times, which search results use, are parsed by NumPy in bulk."""
+    if all(value.endswith("Z") for value in values):
+        return (
+            np.array([value[:-1] for value in values], dtype="datetime64[s]")
+            .astype(np.int64)
+            .astype(float)
+        )
+    return np.fromiter(
+        (datetime.fromisoformat(value).timestamp() for value in values),
+        dtype=float,
+        count=len(values)
+    )
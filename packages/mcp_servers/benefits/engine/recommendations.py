@@ -0,0 +1,165 @@
+import os
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import date
+from typing import Any, Awaitable, Callable, Dict, List, Mapping, Optional, Sequence, Tuple
+import numpy as np
+from catalog.card_catalog import CardCatalog
+from engine.rewards import PURCHASE_CATEGORIES
+from engine.rules import encode_stream, evaluate_rules
+
+DEFAULT_WALLET_TTL = 60.0
+DEFAULT_MAX_USERS = 10_000
+
+WalletFetcher = Callable[[str], Awaitable[List[Dict[str, Any]]]]
+
+@dataclass(frozen=True)
+class CategoryTable:
+    """Best card per purchase category for one wallet."""
+    card_ids: List[str]
+    card_names: List[str]
+    multipliers: np.ndarray
+    ranking: np.ndarray
+
+    def best(self, category: str) -> Dict[str, Any]:
+        """Best card for a category, with the other cards in ranked order."""
+        row = _category_row(category)
+        ranked = [
+            {
+                "card_id": self.card_ids[column],
+                "card_name": self.card_names[column],
+                "multiplier": float(self.multipliers[row, column])
+            }
+            for column in self.ranking[row].tolist()
+        ]
+        return {"category": PURCHASE_CATEGORIES[row], **ranked[0], "alternatives": ranked[1:]}
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {category: self.best(category) for category in PURCHASE_CATEGORIES}
+
+@dataclass
+class _CachedTable:
+    table: CategoryTable
+    wallet_fingerprint: Tuple[str, ...]
+    catalog_version: int
+    as_of: date
+    expires_at: float
+
+def build_category_table(
+    card_ids: Sequence[str],
+    catalog: CardCatalog,
+    as_of: Optional[date] = None
+) -> CategoryTable:
+    """Join wallet cards with the catalog into a categories x cards table.
+
+    Each card is scored by the rule that would apply to a purchase in the
+    category on as_of, at its first tier rate.
+    """
+    entries = catalog.snapshot.entries
+    known = [card_id for card_id in card_ids if card_id in entries]
+    if not known:
+        raise ValueError("No cards with known benefits in wallet")
+
+    probe = encode_stream(
+        [{"category": category, "amount": 0.0} for category in PURCHASE_CATEGORIES], as_of=as_of
+    )
+    multipliers = np.column_stack([
+        evaluate_rules(entries[card_id].rules, probe).multipliers for card_id in known
+    ])
+    # Stable sort keeps wallet order (default card first) on ties
+    ranking = np.argsort(-multipliers, axis=1, kind="stable")
+    return CategoryTable(
+        card_ids=known,
+        card_names=[entries[card_id].response.card_name for card_id in known],
+        multipliers=multipliers,
+        ranking=ranking
+    )
+
+class RecommendationCache:
+    """Per-user category -> best card tables.
+
+    A table is rebuilt when the catalog version or the day changes, and the
+    wallet is re-fetched after wallet_ttl seconds or an explicit
+    invalidation; an unchanged wallet keeps its table.
+    """
+
+    def __init__(
+        self,
+        catalog: CardCatalog,
+        fetch_wallet: WalletFetcher,
+        wallet_ttl: float = DEFAULT_WALLET_TTL,
+        max_users: int = DEFAULT_MAX_USERS
+    ):
+        self.catalog = catalog
+        self.fetch_wallet = fetch_wallet
+        self.wallet_ttl = wallet_ttl
+        self.max_users = max_users
+        self._tables: "OrderedDict[str, _CachedTable]" = OrderedDict()
+
+    async def get_table(self, user_id: str) -> CategoryTable:
+        today = date.today()
+        now = time.monotonic()
+        catalog_version = self.catalog.version
+        cached = self._tables.get(user_id)
+
+        if cached and now < cached.expires_at:
+            if cached.catalog_version == catalog_version and cached.as_of == today:
+                self._tables.move_to_end(user_id)
+                return cached.table
+            # The wallet was fetched no more recently, so its deadline carries over
+            return self._store(user_id, cached.wallet_fingerprint, today, cached.expires_at)
+
+        cards = await self.fetch_wallet(user_id)
+        fingerprint = _wallet_fingerprint(cards)
+        if (
+            cached
+            and cached.wallet_fingerprint == fingerprint
+            and cached.catalog_version == catalog_version
+            and cached.as_of == today
+        ):
+            cached.expires_at = now + self.wallet_ttl
+            self._tables.move_to_end(user_id)
+            return cached.table
+        return self._store(user_id, fingerprint, today, now + self.wallet_ttl)
+
+    def invalidate(self, user_id: str) -> None:
+        """Drop a user's table, e.g. after a wallet change."""
+        self._tables.pop(user_id, None)
+
+    def clear(self) -> None:
+        self._tables.clear()
+
+    def _store(
+        self, user_id: str, fingerprint: Tuple[str, ...], today: date, expires_at: float
+    ) -> CategoryTable:
+        table = build_category_table(fingerprint, self.catalog, as_of=today)
+        self._tables[user_id] = _CachedTable(
+            table=table,
+            wallet_fingerprint=fingerprint,
+            catalog_version=self.catalog.version,
+            as_of=today,
+            expires_at=expires_at
+        )
+        self._tables.move_to_end(user_id)
+        while len(self._tables) > self.max_users:
+            self._tables.popitem(last=False)
+        return table
+
+def _wallet_fingerprint(cards: Sequence[Mapping[str, Any]]) -> Tuple[str, ...]:
+    """Card ids with the default card first; wallet order otherwise."""
+    ordered = sorted(cards, key=lambda card: not card.get("is_default", False))
+    return tuple(card["card_id"] for card in ordered)
+
+def _category_row(category: str) -> int:
+    try:
+        return PURCHASE_CATEGORIES.index(category.upper())
+    except ValueError:
+        return PURCHASE_CATEGORIES.index("GENERAL")
+
+def create_recommendation_cache(
+    catalog: CardCatalog, fetch_wallet: WalletFetcher
+) -> RecommendationCache:
+    """Create a recommendation cache configured from env."""
+    wallet_ttl = float(os.getenv("RECOMMENDATION_WALLET_TTL", str(DEFAULT_WALLET_TTL)))
+    return RecommendationCache(catalog, fetch_wallet, wallet_ttl=wallet_ttl)
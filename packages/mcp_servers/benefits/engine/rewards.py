@@ -0,0 +1,99 @@
+from dataclasses import dataclass
+from datetime import date
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Tuple
+import numpy as np
+from catalog.card_catalog import get_card_catalog
+from engine.rules import CapState, CompiledRuleSet, PurchaseStream, encode_stream, evaluate_rules
+
+PURCHASE_CATEGORIES: Tuple[str, ...] = (
+    "TRAVEL", "DINING", "GROCERY", "GAS", "STREAMING", "GENERAL"
+)
+
+def get_card_rules(card_id: str) -> CompiledRuleSet:
+    """Return the compiled earn rules for a card from the benefits catalog."""
+    entry = get_card_catalog().get(card_id)
+    if entry is None:
+        raise ValueError(f"Unknown card ID: {card_id}")
+    return entry.rules
+
+@dataclass(frozen=True)
+class RewardsMatrix:
+    """Rewards for every purchase x card pair of a batch."""
+    card_ids: List[str]
+    purchases: PurchaseStream
+    multipliers: np.ndarray
+    rewards: np.ndarray
+    cap_states: Dict[str, CapState]
+
+    @property
+    def categories(self) -> List[str]:
+        return self.purchases.categories[self.purchases.category_codes].tolist()
+
+    @property
+    def totals(self) -> np.ndarray:
+        """Total rewards per card over the whole batch."""
+        return self.rewards.sum(axis=0)
+
+    @property
+    def best_card_index(self) -> np.ndarray:
+        """Index of the highest earning card for each purchase."""
+        return self.rewards.argmax(axis=1)
+
+    @property
+    def best_rewards(self) -> np.ndarray:
+        """Rewards earned by the best card for each purchase."""
+        return self.rewards.max(axis=1)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Serialize the matrix in columnar form."""
+        totals = self.totals
+        best_index = self.best_card_index
+        best_rewards = self.best_rewards
+        card_ids = np.asarray(self.card_ids, dtype=object)
+        return {
+            "card_ids": self.card_ids,
+            "purchase_count": len(self.purchases),
+            "categories": self.categories,
+            "amounts": self.purchases.amounts.tolist(),
+            "rewards": self.rewards.tolist(),
+            "totals": dict(zip(self.card_ids, totals.tolist(), strict=True)),
+            "best_card_ids": card_ids[best_index].tolist(),
+            "best_rewards": best_rewards.tolist(),
+            "best_overall_card_id": self.card_ids[int(totals.argmax())],
+            "optimal_total_rewards": float(best_rewards.sum())
+        }
+
+def compute_rewards_matrix(
+    purchases: Sequence[Mapping[str, Any]],
+    card_ids: Sequence[str],
+    cap_states: Optional[Mapping[str, CapState]] = None,
+    as_of: Optional[date] = None
+) -> RewardsMatrix:
+    """Compute rewards for every purchase against every card.
+
+    Purchases are encoded once; each card's compiled rules are then
+    evaluated over the whole batch in a single vectorized pass.
+    """
+    if not card_ids:
+        raise ValueError("At least one card ID is required")
+
+    rule_sets = [get_card_rules(card_id) for card_id in card_ids]
+    stream = encode_stream(purchases, as_of=as_of)
+    cap_states = cap_states or {}
+
+    rewards = np.empty((len(stream), len(card_ids)))
+    multipliers = np.empty_like(rewards)
+    new_states = {}
+    for column, (card_id, rule_set) in enumerate(zip(card_ids, rule_sets, strict=True)):
+        evaluation = evaluate_rules(rule_set, stream, cap_states.get(card_id))
+        rewards[:, column] = evaluation.rewards
+        multipliers[:, column] = evaluation.multipliers
+        new_states[card_id] = evaluation.cap_state
+
+    return RewardsMatrix(
+        card_ids=list(card_ids),
+        purchases=stream,
+        multipliers=multipliers,
+        rewards=rewards,
+        cap_states=new_states
+    )
@@ -0,0 +1,350 @@
+from dataclasses import dataclass
+from datetime import date
+from typing import Any, Dict, Iterable, List, Literal, Mapping, Optional, Sequence, Tuple
+import numpy as np
+from pydantic import BaseModel, Field, model_validator
+
+DEFAULT_RULE_ID = "default"
+DEFAULT_MULTIPLIER = 1.0
+DEFAULT_CATEGORY = "GENERAL"
+
+PERIODS: Tuple[str, ...] = ("none", "month", "quarter", "year")
+_PERIOD_INDEX: Dict[str, int] = {name: i for i, name in enumerate(PERIODS)}
+
+_DAY_MIN = np.iinfo(np.int64).min
+_DAY_MAX = np.iinfo(np.int64).max
+
+# Running spend per (rule_id, period bucket) for rules with spend tiers
+CapState = Dict[Tuple[str, int], float]
+
+class RewardTier(BaseModel):
+    """One band of a tiered earn rate, e.g. "5x up to $1,500"."""
+    up_to: Optional[float] = Field(
+        None, gt=0, description="Period spend where this tier ends; open-ended when omitted"
+    )
+    multiplier: float = Field(..., ge=0, description="Reward multiplier within this tier")
+
+class RewardRule(BaseModel):
+    """Declarative earn rule. Rules are matched in order; the first match wins."""
+    rule_id: str = Field(..., description="Unique rule identifier within a card")
+    description: str = Field("", description="Human readable description of the rule")
+    categories: List[str] = Field(
+        default_factory=list, description="Matching purchase categories; any when empty"
+    )
+    merchants: List[str] = Field(
+        default_factory=list, description="Matching merchants; any when empty"
+    )
+    valid_from: Optional[date] = Field(None, description="First day the rule applies (inclusive)")
+    valid_to: Optional[date] = Field(None, description="Last day the rule applies (inclusive)")
+    multiplier: Optional[float] = Field(None, ge=0, description="Flat multiplier for the rule")
+    tiers: List[RewardTier] = Field(
+        default_factory=list, description="Spend tiers, in ascending order"
+    )
+    period: Literal["none", "month", "quarter", "year"] = Field(
+        "none", description="Period over which tier spend accumulates"
+    )
+
+    @model_validator(mode="after")
+    def check_rate(self) -> "RewardRule":
+        if (self.multiplier is None) == (not self.tiers):
+            raise ValueError(f"Rule {self.rule_id} needs exactly one of multiplier or tiers")
+        if self.tiers:
+            bounds = [tier.up_to for tier in self.tiers[:-1]]
+            if None in bounds or bounds != sorted(bounds):
+                raise ValueError(
+                    f"Rule {self.rule_id} tiers must be ascending with only the last open-ended"
+                )
+        if self.valid_from and self.valid_to and self.valid_from > self.valid_to:
+            raise ValueError(f"Rule {self.rule_id} has valid_from after valid_to")
+        return self
+
+    def rate_tiers(self) -> List[RewardTier]:
+        if self.tiers:
+            return self.tiers
+        return [RewardTier(multiplier=self.multiplier)]
+
+@dataclass(frozen=True)
+class PurchaseStream:
+    """Columnar, dictionary-encoded purchases shared across rule sets."""
+    categories: np.ndarray
+    category_codes: np.ndarray
+    merchants: np.ndarray
+    merchant_codes: np.ndarray
+    days: np.ndarray
+    period_buckets: np.ndarray
+    amounts: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.amounts)
+
+@dataclass(frozen=True)
+class CompiledRuleSet:
+    """Decision tables compiled from an ordered list of rules.
+
+    The final rule is always a catch-all so every purchase matches something.
+    """
+    rule_ids: List[str]
+    categories: List[frozenset]
+    merchants: List[frozenset]
+    valid_from: np.ndarray
+    valid_to: np.ndarray
+    period: np.ndarray
+    tier_low: np.ndarray
+    tier_high: np.ndarray
+    tier_multiplier: np.ndarray
+    is_tiered: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.rule_ids)
+
+@dataclass(frozen=True)
+class RuleEvaluation:
+    """Per-purchase outcome of evaluating a rule set over a stream."""
+    rule_index: np.ndarray
+    rewards: np.ndarray
+    multipliers: np.ndarray
+    cap_state: CapState
+
+def rules_from_multipliers(multipliers: Mapping[str, float]) -> List[RewardRule]:
+    """Express flat category multipliers as rules."""
+    return [
+        RewardRule(
+            rule_id=f"category_{category.lower()}", categories=[category], multiplier=multiplier
+        )
+        for category, multiplier in multipliers.items()
+    ]
+
+def compile_rules(
+    rules: Sequence[RewardRule],
+    default_multiplier: float = DEFAULT_MULTIPLIER
+) -> CompiledRuleSet:
+    """Compile ordered rules into decision tables."""
+    rules = list(rules) + [RewardRule(rule_id=DEFAULT_RULE_ID, multiplier=default_multiplier)]
+    tier_count = max(len(rule.rate_tiers()) for rule in rules)
+
+    tier_low = np.zeros((len(rules), tier_count))
+    tier_high = np.zeros((len(rules), tier_count))
+    tier_multiplier = np.zeros((len(rules), tier_count))
+    for row, rule in enumerate(rules):
+        low = 0.0
+        for column, tier in enumerate(rule.rate_tiers()):
+            high = np.inf if tier.up_to is None else tier.up_to
+            tier_low[row, column] = low
+            tier_high[row, column] = high
+            tier_multiplier[row, column] = tier.multiplier
+            low = high
+
+    return CompiledRuleSet(
+        rule_ids=[rule.rule_id for rule in rules],
+        categories=[frozenset(c.upper() for c in rule.categories) for rule in rules],
+        merchants=[frozenset(m.upper() for m in rule.merchants) for rule in rules],
+        valid_from=np.array([_day(rule.valid_from, _DAY_MIN) for rule in rules], dtype=np.int64),
+        valid_to=np.array([_day(rule.valid_to, _DAY_MAX) for rule in rules], dtype=np.int64),
+        period=np.array([_PERIOD_INDEX[rule.period] for rule in rules], dtype=np.intp),
+        tier_low=tier_low,
+        tier_high=tier_high,
+        tier_multiplier=tier_multiplier,
+        is_tiered=np.array([len(rule.rate_tiers()) > 1 for rule in rules])
+    )
+
+def encode_stream(
+    purchases: Sequence[Mapping[str, Any]],
+    as_of: Optional[date] = None
+) -> PurchaseStream:
+    """Dictionary-encode purchases once so many rule sets can evaluate them."""
+    count = len(purchases)
+    default_day = np.datetime64(as_of or date.today(), "D")
+
+    amounts = np.fromiter(
+        (float(purchase.get("amount", 0)) for purchase in purchases),
+        dtype=np.float64,
+        count=count
+    )
+    if count and amounts.min() < 0:
+        raise ValueError("Purchase amounts must be non-negative")
+
+    try:
+        days = np.array(
+            [purchase.get("date") or default_day for purchase in purchases],
+            dtype="datetime64[D]"
+        )
+    except ValueError as e:
+        raise ValueError(f"Invalid purchase date: {str(e)}") from e
+
+    categories, category_codes = dictionary_encode(
+        str(purchase.get("category", DEFAULT_CATEGORY)).upper() for purchase in purchases
+    )
+    merchants, merchant_codes = dictionary_encode(
+        str(purchase.get("merchant") or "").upper() for purchase in purchases
+    )
+    return make_stream(categories, category_codes, merchants, merchant_codes, days, amounts)
+
+def make_stream(
+    categories: np.ndarray,
+    category_codes: np.ndarray,
+    merchants: np.ndarray,
+    merchant_codes: np.ndarray,
+    days: np.ndarray,
+    amounts: np.ndarray
+) -> PurchaseStream:
+    """Build a stream from already encoded columns."""
+    months = days.astype("datetime64[M]").astype(np.int64)
+    period_buckets = np.stack([
+        np.zeros_like(months),
+        months,
+        months // 3,
+        months // 12
+    ])
+    return PurchaseStream(
+        categories=categories,
+        category_codes=category_codes.reshape(-1),
+        merchants=merchants,
+        merchant_codes=merchant_codes.reshape(-1),
+        days=days.astype(np.int64),
+        period_buckets=period_buckets,
+        amounts=amounts
+    )
+
+def match_rules(rule_set: CompiledRuleSet, stream: PurchaseStream) -> np.ndarray:
+    """Index of the first matching rule for every purchase."""
+    category_table = _vocabulary_table(rule_set.categories, stream.categories)
+    merchant_table = _vocabulary_table(rule_set.merchants, stream.merchants)
+
+    matches = category_table[:, stream.category_codes]
+    matches &= merchant_table[:, stream.merchant_codes]
+    matches &= rule_set.valid_from[:, np.newaxis] <= stream.days
+    matches &= stream.days <= rule_set.valid_to[:, np.newaxis]
+    # The catch-all rule guarantees at least one True per column
+    return matches.argmax(axis=0)
+
+def period_groups(
+    rule_set: CompiledRuleSet, stream: PurchaseStream, rule_index: np.ndarray
+) -> np.ndarray:
+    """Period bucket each purchase's spend accrues to under its matched rule."""
+    return stream.period_buckets[rule_set.period[rule_index], np.arange(len(stream))]
+
+def tier_rewards(
+    rule_set: CompiledRuleSet,
+    rule_index: np.ndarray,
+    spend_before: np.ndarray,
+    spend_after: np.ndarray
+) -> np.ndarray:
+    """Rewards earned moving from spend_before to spend_after under each rule's tiers."""
+    low = rule_set.tier_low[rule_index]
+    high = rule_set.tier_high[rule_index]
+    overlap = (
+        np.minimum(spend_after[:, np.newaxis], high)
+        - np.maximum(spend_before[:, np.newaxis], low)
+    )
+    return (np.clip(overlap, 0, None) * rule_set.tier_multiplier[rule_index]).sum(axis=1)
+
+def evaluate_rules(
+    rule_set: CompiledRuleSet,
+    stream: PurchaseStream,
+    cap_state: Optional[CapState] = None
+) -> RuleEvaluation:
+    """Evaluate a rule set over a purchase stream in order.
+
+    Spend against tiered rules accumulates per (rule, period bucket) in
+    stream order, starting from cap_state. The returned cap_state carries
+    the running totals forward for the next chunk of the stream.
+    """
+    amounts = stream.amounts
+    rule_index = match_rules(rule_set, stream)
+    buckets = period_groups(rule_set, stream, rule_index)
+
+    spend_before = np.zeros_like(amounts)
+    new_state = dict(cap_state or {})
+    tiered = rule_set.is_tiered[rule_index]
+    if tiered.any():
+        spend_before[tiered] = _running_spend(
+            rule_set, rule_index[tiered], buckets[tiered], amounts[tiered], new_state
+        )
+
+    rewards = tier_rewards(rule_set, rule_index, spend_before, spend_before + amounts)
+    first_tier = rule_set.tier_multiplier[rule_index, 0]
+    multipliers = np.divide(rewards, amounts, out=first_tier.copy(), where=amounts > 0)
+    return RuleEvaluation(
+        rule_index=rule_index,
+        rewards=rewards,
+        multipliers=multipliers,
+        cap_state=new_state
+    )
+
+def aggregate_spend(rule_set: CompiledRuleSet, stream: PurchaseStream) -> CapState:
+    """Total spend per (rule_id, period bucket).
+
+    Tier rewards depend only on cumulative spend within a group, so totals
+    from separately aggregated chunks can be merged in any order.
+    """
+    rule_index = match_rules(rule_set, stream)
+    buckets = period_groups(rule_set, stream, rule_index)
+    groups, codes = np.unique(np.stack([rule_index, buckets], axis=1), axis=0, return_inverse=True)
+    totals = np.bincount(codes.reshape(-1), weights=stream.amounts, minlength=len(groups))
+    return {
+        (rule_set.rule_ids[rule], int(bucket)): total
+        for (rule, bucket), total in zip(groups.tolist(), totals.tolist(), strict=True)
+    }
+
+def rewards_for_spend(rule_set: CompiledRuleSet, spend: CapState, scale: float = 1.0) -> float:
+    """Rewards earned on aggregated group spend, optionally scaled."""
+    if not spend:
+        return 0.0
+    rule_lookup = {rule_id: i for i, rule_id in enumerate(rule_set.rule_ids)}
+    rule_index = np.array([rule_lookup[rule_id] for rule_id, _ in spend], dtype=np.intp)
+    totals = np.fromiter(spend.values(), dtype=np.float64, count=len(spend)) * scale
+    return float(tier_rewards(rule_set, rule_index, np.zeros_like(totals), totals).sum())
+
+def _running_spend(
+    rule_set: CompiledRuleSet,
+    rule_index: np.ndarray,
+    buckets: np.ndarray,
+    amounts: np.ndarray,
+    state: CapState
+) -> np.ndarray:
+    """Spend already accrued in each purchase's group before that purchase.
+
+    Updates state in place with the group totals after this stream.
+    """
+    groups = np.stack([rule_index, buckets], axis=1)
+    unique_groups, group_codes = np.unique(groups, axis=0, return_inverse=True)
+    group_codes = group_codes.reshape(-1)
+
+    order = np.argsort(group_codes, kind="stable")
+    sorted_codes = group_codes[order]
+    cumulative = np.cumsum(amounts[order])
+    group_start = np.searchsorted(sorted_codes, np.arange(len(unique_groups)))
+    start_offset = np.concatenate([[0.0], cumulative])[group_start]
+
+    keys = [(rule_set.rule_ids[rule], int(bucket)) for rule, bucket in unique_groups.tolist()]
+    prior = np.array([state.get(key, 0.0) for key in keys])
+
+    before_sorted = cumulative - amounts[order] - start_offset[sorted_codes] + prior[sorted_codes]
+    spend_before = np.empty_like(amounts)
+    spend_before[order] = before_sorted
+
+    totals = np.bincount(group_codes, weights=amounts, minlength=len(unique_groups))
+    for key, total, start in zip(keys, totals.tolist(), prior.tolist(), strict=True):
+        state[key] = start + total
+    return spend_before
+
+def dictionary_encode(values: Iterable[str]) -> Tuple[np.ndarray, np.ndarray]:
+    """Hash-based dictionary encoding; cheaper than sorting for string columns."""
+    vocabulary: Dict[str, int] = {}
+    codes = np.fromiter(
+        (vocabulary.setdefault(value, len(vocabulary)) for value in values), dtype=np.intp
+    )
+    return np.array(list(vocabulary), dtype=object), codes
+
+def _vocabulary_table(rule_values: Sequence[frozenset], vocabulary: np.ndarray) -> np.ndarray:
+    """rules x vocabulary boolean table; an empty rule value set matches everything."""
+    table = np.ones((len(rule_values), len(vocabulary)), dtype=bool)
+    for row, values in enumerate(rule_values):
+        if values:
+            table[row] = [value in values for value in vocabulary.tolist()]
+    return table
+
+def _day(value: Optional[date], missing: int) -> int:
+    if value is None:
+        return missing
+    return int(np.datetime64(value, "D").astype(np.int64))
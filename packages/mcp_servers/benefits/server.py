@@ -1,22 +1,77 @@
-import asyncio
-import os
-from typing import Dict, Any
-from fastapi import FastAPI
+from fastapi import FastAPI, HTTPException, Response
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse
 from loguru import logger
 from mcp import FastMCP, MCPRequest, MCPResponse
 from dotenv import load_dotenv
+from shared.server import (
+    CompressionMiddleware,
+    RequestIdentityMiddleware,
+    ServerRuntime,
+    create_metrics_router,
+    create_tool_router,
+    health_response,
+    load_server_config,
+    run_server
+)
+from shared.tracing import configure_tracing
+from catalog.card_catalog import get_card_catalog
+from catalog.transfer_partners import get_transfer_graph
+from clients.chase_travel import ChaseTravelClient
+from clients.safepay_wallet import SafePayWalletClient
 from tools.get_card_benefits import GetCardBenefitsTool
 from tools.calculate_rewards import CalculateRewardsTool
+from tools.calculate_rewards_batch import CalculateRewardsBatchTool
+from tools.recommend_payment_method import RecommendPaymentMethodTool
+from tools.get_transfer_partners import GetTransferPartnersTool
+from tools.price_points_for_fare import PricePointsForFareTool
+from tools.optimize_travel import OptimizeTravelTool
+from engine.recommendations import create_recommendation_cache
 
 # Load environment variables
 load_dotenv()
 
+# Spans are exported to TRACE_EXPORT_PATH when set
+configure_tracing("benefits-mcp")
+
+# Long-lived resources and tools, created at startup and shared by all requests
+runtime = ServerRuntime("Benefits")
+runtime.add_resource("catalog", lambda rt: get_card_catalog())
+runtime.add_resource("transfer_graph", lambda rt: get_transfer_graph())
+runtime.add_resource(
+    "wallet_client", lambda rt: SafePayWalletClient(), close=SafePayWalletClient.aclose
+)
+runtime.add_resource(
+    "chase_travel_client", lambda rt: ChaseTravelClient(), close=ChaseTravelClient.aclose
+)
+runtime.add_resource(
+    "recommendations",
+    lambda rt: create_recommendation_cache(rt["catalog"], rt["wallet_client"].fetch_wallet_cards)
+)
+runtime.add_tool("get_card_benefits", lambda rt: GetCardBenefitsTool(rt["catalog"]))
+runtime.add_tool("calculate_rewards", lambda rt: CalculateRewardsTool())
+runtime.add_tool(
+    "calculate_rewards_batch",
+    lambda rt: CalculateRewardsBatchTool(),
+    max_concurrency=8,
+    priority="batch"
+)
+runtime.add_tool(
+    "recommend_payment_method", lambda rt: RecommendPaymentMethodTool(rt["recommendations"])
+)
+runtime.add_tool("get_transfer_partners", lambda rt: GetTransferPartnersTool(rt["transfer_graph"]))
+runtime.add_tool("price_points_for_fare", lambda rt: PricePointsForFareTool(rt["transfer_graph"]))
+runtime.add_tool(
+    "optimize_travel",
+    lambda rt: OptimizeTravelTool(rt["catalog"], rt["recommendations"], rt["chase_travel_client"])
+)
+
 # Initialize FastAPI app
 app = FastAPI(
     title="Benefits MCP Server",
     description="MCP server for card benefits and rewards functionality",
-    version="0.1.0"
+    version="0.1.0",
+    lifespan=runtime.lifespan
 )
 
 # Configure CORS
@@ -28,6 +83,12 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# user-id and priority headers schedule calls per caller; traceparent continues the caller's trace
+app.add_middleware(RequestIdentityMiddleware)
+
+# gzip/zstd for clients that accept it; small responses are sent as-is
+app.add_middleware(CompressionMiddleware)
+
 # Initialize MCP server
 mcp = FastMCP("Benefits")
 
@@ -35,39 +96,70 @@ mcp = FastMCP("Benefits")
 @mcp.tool("get_card_benefits")
 async def get_card_benefits(request: MCPRequest) -> MCPResponse:
     """Get benefits for a specific card."""
-    try:
-        tool = GetCardBenefitsTool()
-        result = await tool.execute(None, **request.parameters)
-        return MCPResponse(status="success", data=result)
-    except ValueError as e:
-        return MCPResponse(status="error", error=str(e))
-    except Exception as e:
-        logger.error(f"Error getting card benefits: {str(e)}")
-        return MCPResponse(status="error", error="Internal server error")
+    return await runtime.dispatch("get_card_benefits", request.parameters)
 
 @mcp.tool("calculate_rewards")
 async def calculate_rewards(request: MCPRequest) -> MCPResponse:
     """Calculate rewards for a purchase."""
-    try:
-        tool = CalculateRewardsTool()
-        result = await tool.execute(None, **request.parameters)
-        return MCPResponse(status="success", data=result)
-    except ValueError as e:
-        return MCPResponse(status="error", error=str(e))
-    except Exception as e:
-        logger.error(f"Error calculating rewards: {str(e)}")
-        return MCPResponse(status="error", error="Internal server error")
-
-# Health check endpoint
+    return await runtime.dispatch("calculate_rewards", request.parameters)
+
+@mcp.tool("calculate_rewards_batch")
+async def calculate_rewards_batch(request: MCPRequest) -> MCPResponse:
+    """Calculate rewards for many purchases across many cards."""
+    return await runtime.dispatch("calculate_rewards_batch", request.parameters)
+
+@mcp.tool("recommend_payment_method")
+async def recommend_payment_method(request: MCPRequest) -> MCPResponse:
+    """Recommend the best card in a user's wallet for a purchase category."""
+    return await runtime.dispatch("recommend_payment_method", request.parameters)
+
+@mcp.tool("get_transfer_partners")
+async def get_transfer_partners(request: MCPRequest) -> MCPResponse:
+    """Get transfer partners and point values for a rewards program."""
+    return await runtime.dispatch("get_transfer_partners", request.parameters)
+
+@mcp.tool("price_points_for_fare")
+async def price_points_for_fare(request: MCPRequest) -> MCPResponse:
+    """Price a flight fare in points."""
+    return await runtime.dispatch("price_points_for_fare", request.parameters)
+
+@mcp.tool("optimize_travel")
+async def optimize_travel(request: MCPRequest) -> MCPResponse:
+    """Rank candidate flights paired with the best card in the user's wallet."""
+    return await runtime.dispatch("optimize_travel", request.parameters)
+
+# Card benefits served straight from the catalog's pre-serialized bytes
+@app.get("/api/benefits/cards/{card_id}")
+async def get_card_benefits_json(card_id: str) -> Response:
+    """Get benefits for a specific card as cached JSON."""
+    entry = runtime["catalog"].get(card_id)
+    if entry is None:
+        raise HTTPException(status_code=404, detail=f"Unknown card ID: {card_id}")
+    return Response(content=entry.payload_json, media_type="application/json")
+
+# Wallet change notifications drop the user's cached recommendation table
+@app.post("/api/benefits/wallet-events/{user_id}", status_code=204)
+async def wallet_changed(user_id: str) -> Response:
+    """Invalidate cached recommendations after a wallet change."""
+    runtime["recommendations"].invalidate(user_id)
+    return Response(status_code=204)
+
+# Fast JSON path: POST /api/tools/{tool_name} serializes results from models or cached bytes
+app.include_router(create_tool_router(runtime))
+
+# Per-tool request, error, latency and payload size metrics
+app.include_router(create_metrics_router(runtime))
+
+# Readiness: 503 while starting or while admission control is shedding calls
 @app.get("/health")
-async def health_check() -> Dict[str, str]:
+async def health_check() -> JSONResponse:
     """Health check endpoint."""
-    return {"status": "healthy", "service": "benefits-mcp"}
+    return health_response(runtime, "benefits-mcp")
 
 # Mount MCP server to FastAPI app
 app.mount("/mcp", mcp.app)
 
-async def main():
+def main():
     """Main entry point for the server."""
     # Configure logging
     logger.add(
@@ -77,15 +169,8 @@ async def main():
         level="INFO"
     )
     
-    # Start the server
-    import uvicorn
-    port = int(os.getenv("PORT", "3003"))
-    uvicorn.run(
-        "server:app",
-        host="0.0.0.0",
-        port=port,
-        reload=True
-    )
+    # Start the server; one worker unless WEB_CONCURRENCY is set, reloading only in development
+    run_server("server:app", load_server_config(default_port=3003))
 
 if __name__ == "__main__":
-    asyncio.run(main()) 
\ No newline at end of file
+    main()
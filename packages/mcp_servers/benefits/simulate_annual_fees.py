@@ -0,0 +1,76 @@
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+from dotenv import load_dotenv
+from loguru import logger
+from engine.annual_fees import DEFAULT_CHUNK_BYTES, simulate_annual_fees
+
+# Load environment variables
+load_dotenv()
+
+def format_report(report: dict) -> str:
+    """Render the simulation report as a table."""
+    lines = [
+        f"Transactions: {report['rows']:,} ({report['skipped_rows']:,} skipped)",
+        f"Total spend:  ${report['total_spend']:,.2f}",
+        "",
+        f"{'Card':<30} {'Fee':>8} {'Rewards':>12} {'Net value':>12} {'Break-even spend':>18}"
+    ]
+    for card in report["cards"]:
+        break_even = card["break_even_spend"]
+        lines.append(
+            f"{card['card_name']:<30} "
+            f"{card['annual_fee']:>8,.2f} "
+            f"{card['rewards_value']:>12,.2f} "
+            f"{card['net_value']:>12,.2f} "
+            f"{'never' if break_even is None else f'{break_even:,.2f}':>18}"
+        )
+    return "\n".join(lines)
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Simulate a year of card rewards net of annual fees"
+    )
+    parser.add_argument(
+        "transactions",
+        type=Path,
+        help="CSV with date, amount, category and optional merchant columns"
+    )
+    parser.add_argument(
+        "--cards", nargs="+", help="Card IDs to compare (default: every catalog card)"
+    )
+    parser.add_argument(
+        "--chunk-mb",
+        type=float,
+        default=DEFAULT_CHUNK_BYTES / (1024 * 1024),
+        help="Chunk size in MB"
+    )
+    parser.add_argument("--workers", type=int, help="Worker processes (default: CPU count)")
+    parser.add_argument(
+        "--cents-per-point", type=float, help="Override the value of one point in cents"
+    )
+    parser.add_argument("--json", action="store_true", help="Print the report as JSON")
+    args = parser.parse_args()
+
+    started = time.perf_counter()
+    try:
+        report = simulate_annual_fees(
+            args.transactions,
+            card_ids=args.cards,
+            chunk_bytes=int(args.chunk_mb * 1024 * 1024),
+            workers=args.workers,
+            cents_per_point=args.cents_per_point
+        )
+    except (OSError, ValueError) as e:
+        logger.error(f"Simulation failed: {str(e)}")
+        sys.exit(1)
+    logger.info(
+        f"Simulated {report['rows']:,} transactions in {time.perf_counter() - started:.2f}s"
+    )
+
+    print(json.dumps(report, indent=2) if args.json else format_report(report))
+
+if __name__ == "__main__":
+    main()
@@ -1,6 +1,6 @@
 from typing import List, Dict
 from mcp import Tool, ToolContext
-from shared.models.api.travel_benefits import Multiplier
+from engine.rewards import PURCHASE_CATEGORIES, compute_rewards_matrix
 
 class CalculateRewardsTool(Tool):
     """Tool for calculating potential rewards for purchases."""
@@ -18,35 +18,28 @@ class CalculateRewardsTool(Tool):
             if not purchases:
                 raise ValueError("At least one purchase is required")
             
-            # TODO: Implement actual rewards calculation logic
-            # This is a mock implementation
-            mock_multipliers = {
-                "TRAVEL": 3.0,
-                "DINING": 2.0,
-                "GENERAL": 1.0
-            }
-            
-            total_rewards = 0
-            purchase_rewards = []
+            matrix = compute_rewards_matrix(purchases, [card_id])
+            multipliers = matrix.multipliers[:, 0].tolist()
+            rewards = matrix.rewards[:, 0].tolist()
             
-            for purchase in purchases:
-                category = purchase.get("category", "GENERAL")
-                amount = float(purchase.get("amount", 0))
-                multiplier = mock_multipliers.get(category, 1.0)
-                
-                rewards = amount * multiplier
-                total_rewards += rewards
-                
-                purchase_rewards.append({
+            purchase_rewards = [
+                {
                     "category": category,
                     "amount": amount,
                     "multiplier": multiplier,
-                    "rewards": rewards
-                })
+                    "rewards": reward
+                }
+                for category, amount, multiplier, reward in zip(
+                    matrix.categories,
+                    matrix.purchases.amounts.tolist(),
+                    multipliers,
+                    rewards
+                )
+            ]
             
             return {
                 "card_id": card_id,
-                "total_rewards": total_rewards,
+                "total_rewards": float(matrix.totals[0]),
                 "purchase_rewards": purchase_rewards
             }
             
@@ -71,13 +64,22 @@ class CalculateRewardsTool(Tool):
                         "properties": {
                             "category": {
                                 "type": "string",
-                                "enum": ["TRAVEL", "DINING", "GENERAL"],
+                                "enum": list(PURCHASE_CATEGORIES),
                                 "description": "Purchase category"
                             },
                             "amount": {
                                 "type": "number",
                                 "minimum": 0,
                                 "description": "Purchase amount"
+                            },
+                            "date": {
+                                "type": "string",
+                                "format": "date",
+                                "description": "Purchase date (YYYY-MM-DD); defaults to today"
+                            },
+                            "merchant": {
+                                "type": "string",
+                                "description": "Merchant name, used for merchant-specific offers"
                             }
                         },
                         "required": ["category", "amount"]
@@ -0,0 +1,72 @@
+from mcp import Tool, ToolContext
+from engine.rewards import PURCHASE_CATEGORIES, compute_rewards_matrix
+
+class CalculateRewardsBatchTool(Tool):
+    """Tool for calculating rewards for a batch of purchases across several cards."""
+
+    name = "calculate_rewards_batch"
+    description = (
+        "Calculate rewards for every purchase on every card and pick the best card per purchase"
+    )
+
+    async def execute(self, context: ToolContext, **kwargs) -> dict:
+        try:
+            card_ids = kwargs.get("card_ids", [])
+            purchases = kwargs.get("purchases", [])
+
+            if not card_ids:
+                raise ValueError("At least one card ID is required")
+            if not purchases:
+                raise ValueError("At least one purchase is required")
+
+            matrix = compute_rewards_matrix(purchases, card_ids)
+            return matrix.to_dict()
+
+        except ValueError as e:
+            raise ValueError(f"Invalid input parameters: {str(e)}")
+        except Exception as e:
+            raise Exception(f"Error calculating batch rewards: {str(e)}")
+
+    @property
+    def parameters(self) -> dict:
+        return {
+            "type": "object",
+            "properties": {
+                "card_ids": {
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "minItems": 1,
+                    "description": "Card identifiers to compare"
+                },
+                "purchases": {
+                    "type": "array",
+                    "items": {
+                        "type": "object",
+                        "properties": {
+                            "category": {
+                                "type": "string",
+                                "enum": list(PURCHASE_CATEGORIES),
+                                "description": "Purchase category"
+                            },
+                            "amount": {
+                                "type": "number",
+                                "minimum": 0,
+                                "description": "Purchase amount"
+                            },
+                            "date": {
+                                "type": "string",
+                                "format": "date",
+                                "description": "Purchase date (YYYY-MM-DD); defaults to today"
+                            },
+                            "merchant": {
+                                "type": "string",
+                                "description": "Merchant name, used for merchant-specific offers"
+                            }
+                        },
+                        "required": ["category", "amount"]
+                    },
+                    "description": "List of purchases to calculate rewards for"
+                }
+            },
+            "required": ["card_ids", "purchases"]
+        }
@@ -0,0 +1,48 @@
+from mcp import Tool, ToolContext
+from catalog.transfer_partners import TransferGraph, resolve_rewards_program
+
+class GetTransferPartnersTool(Tool):
+    """Tool for valuing points across a program's transfer partners."""
+
+    name = "get_transfer_partners"
+    description = (
+        "List the programs a card's points can be transferred to, "
+        "with the best path and value per point"
+    )
+
+    def __init__(self, graph: TransferGraph):
+        super().__init__()
+        self.graph = graph
+
+    async def execute(self, context: ToolContext, **kwargs) -> dict:
+        try:
+            program_id, _ = resolve_rewards_program(kwargs.get("card_id"), kwargs.get("program_id"))
+            program = self.graph.get_program(program_id)
+
+            return {
+                "program_id": program_id,
+                "program_name": program.name,
+                "baseline_cents_per_point": program.cents_per_point,
+                "partners": self.graph.value_points(program_id)
+            }
+
+        except ValueError as e:
+            raise ValueError(f"Invalid input parameters: {str(e)}")
+        except Exception as e:
+            raise Exception(f"Error retrieving transfer partners: {str(e)}")
+
+    @property
+    def parameters(self) -> dict:
+        return {
+            "type": "object",
+            "properties": {
+                "card_id": {
+                    "type": "string",
+                    "description": "Card identifier; its rewards program is used"
+                },
+                "program_id": {
+                    "type": "string",
+                    "description": "Rewards program identifier, e.g. CHASE_UR"
+                }
+            }
+        }
@@ -0,0 +1,131 @@
+from mcp import Tool, ToolContext
+from shared.models.domain import OptimizationResult
+from catalog.card_catalog import CardCatalog
+from clients.chase_travel import ChaseTravelClient, SearchUnavailableError
+from clients.safepay_wallet import WalletUnavailableError
+from engine.optimizer import DEFAULT_TOP_K, optimize_travel
+from engine.recommendations import RecommendationCache
+
+class OptimizeTravelTool(Tool):
+    """Tool for ranking candidate flights paired with the best card in the user's wallet."""
+
+    name = "optimize_travel"
+    description = (
+        "Rank candidate flights by net cost after card rewards, trip benefits "
+        "and preference penalties"
+    )
+
+    def __init__(
+        self,
+        catalog: CardCatalog,
+        recommendations: RecommendationCache,
+        chase_travel: ChaseTravelClient
+    ):
+        super().__init__()
+        self.catalog = catalog
+        self.recommendations = recommendations
+        self.chase_travel = chase_travel
+
+    async def execute(self, context: ToolContext, **kwargs) -> dict:
+        # JSON mode: created_at must survive json.dumps in the in-process agent
+        return (await self.execute_payload(context, **kwargs)).model_dump(mode="json")
+
+    async def execute_payload(self, context: ToolContext, **kwargs) -> OptimizationResult:
+        """Result as a model, for serializing straight to JSON."""
+        try:
+            user_id = kwargs.get("user_id")
+            flight_search_id = kwargs.get("flight_search_id")
+            flights = kwargs.get("flights", [])
+            if not user_id:
+                raise ValueError("User ID is required")
+            if flight_search_id:
+                # Stored results of an earlier search_flights call; no new search
+                flights = await self.chase_travel.fetch_search_flights(flight_search_id)
+            if not flights:
+                raise ValueError("Either flights or a flight_search_id with results is required")
+
+            # Same wallet source as recommend_payment_method (in-process in combined mode)
+            cards = await self.recommendations.fetch_wallet(user_id)
+            return optimize_travel(
+                flights,
+                cards,
+                self.catalog,
+                preferences=kwargs.get("preferences"),
+                k=int(kwargs.get("top_k", DEFAULT_TOP_K)),
+                metadata={"user_id": user_id, "flight_search_id": flight_search_id}
+            )
+
+        except ValueError as e:
+            raise ValueError(f"Invalid input parameters: {str(e)}")
+        except WalletUnavailableError as e:
+            raise Exception(f"Error loading wallet: {str(e)}")
+        except SearchUnavailableError as e:
+            raise Exception(f"Error loading search results: {str(e)}")
+        except Exception as e:
+            raise Exception(f"Error optimizing travel: {str(e)}")
+
+    @property
+    def parameters(self) -> dict:
+        return {
+            "type": "object",
+            "properties": {
+                "user_id": {
+                    "type": "string",
+                    "description": "User ID whose wallet to pay with"
+                },
+                "flights": {
+                    "type": "array",
+                    "items": {
+                        "type": "object",
+                        "properties": {
+                            "id": {"type": "string"},
+                            "segments": {"type": "array", "minItems": 1},
+                            "price": {"type": "object", "additionalProperties": True}
+                        },
+                        "required": ["id", "segments", "price"]
+                    },
+                    "minItems": 1,
+                    "description": (
+                        "Candidate flights, as returned by search_flights; "
+                        "omit when passing flight_search_id"
+                    )
+                },
+                "flight_search_id": {
+                    "type": "string",
+                    "description": "search_id from search_flights, to optimize its stored results"
+                },
+                "preferences": {
+                    "type": "object",
+                    "properties": {
+                        "max_price": {
+                            "type": "number",
+                            "minimum": 0,
+                            "description": "Budget; pricier flights are penalized per dollar over"
+                        },
+                        "preferred_airlines": {
+                            "type": "array",
+                            "items": {"type": "string"},
+                            "description": (
+                                "Airline IATA codes; flights on other airlines are penalized"
+                            )
+                        },
+                        "min_layover_time": {
+                            "type": "integer",
+                            "minimum": 0,
+                            "description": (
+                                "Minimum connection time in minutes; "
+                                "shorter layovers are penalized"
+                            )
+                        }
+                    },
+                    "description": "Soft preferences for ranking"
+                },
+                "top_k": {
+                    "type": "integer",
+                    "minimum": 1,
+                    "maximum": 50,
+                    "description": f"Number of recommendations to return (default {DEFAULT_TOP_K})"
+                }
+            },
+            "required": ["user_id"]
+        }
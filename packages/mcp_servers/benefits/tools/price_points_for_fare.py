@@ -0,0 +1,74 @@
+from mcp import Tool, ToolContext
+from catalog.transfer_partners import TransferGraph, resolve_rewards_program
+
+class PricePointsForFareTool(Tool):
+    """Tool for pricing a flight fare in a card's points."""
+
+    name = "price_points_for_fare"
+    description = (
+        "Price a flight fare in points via transfer partners and the travel portal, "
+        "in cents per point"
+    )
+
+    def __init__(self, graph: TransferGraph):
+        super().__init__()
+        self.graph = graph
+
+    async def execute(self, context: ToolContext, **kwargs) -> dict:
+        try:
+            program_id, portal_cents_per_point = resolve_rewards_program(
+                kwargs.get("card_id"),
+                kwargs.get("program_id")
+            )
+            fare_amount = kwargs.get("fare_amount")
+            if fare_amount is None:
+                raise ValueError("Fare amount is required")
+
+            return self.graph.price_fare(
+                program_id,
+                fare_amount=float(fare_amount),
+                award_costs=kwargs.get("award_costs", {}),
+                taxes_and_fees=float(kwargs.get("taxes_and_fees", 0.0)),
+                portal_cents_per_point=portal_cents_per_point
+            )
+
+        except ValueError as e:
+            raise ValueError(f"Invalid input parameters: {str(e)}")
+        except Exception as e:
+            raise Exception(f"Error pricing fare in points: {str(e)}")
+
+    @property
+    def parameters(self) -> dict:
+        return {
+            "type": "object",
+            "properties": {
+                "card_id": {
+                    "type": "string",
+                    "description": "Card identifier; its rewards program and portal rate are used"
+                },
+                "program_id": {
+                    "type": "string",
+                    "description": "Rewards program identifier, e.g. CHASE_UR"
+                },
+                "fare_amount": {
+                    "type": "number",
+                    "exclusiveMinimum": 0,
+                    "description": "Cash price of the fare"
+                },
+                "award_costs": {
+                    "type": "object",
+                    "additionalProperties": {"type": "number", "exclusiveMinimum": 0},
+                    "description": (
+                        "Award price of the same flight per program, "
+                        "e.g. {\"UNITED_MILEAGEPLUS\": 25000}"
+                    )
+                },
+                "taxes_and_fees": {
+                    "type": "number",
+                    "minimum": 0,
+                    "default": 0,
+                    "description": "Cash taxes and fees due on an award booking"
+                }
+            },
+            "required": ["fare_amount"]
+        }
@@ -0,0 +1,54 @@
+from mcp import Tool, ToolContext
+from clients.safepay_wallet import WalletUnavailableError
+from engine.recommendations import RecommendationCache
+from engine.rewards import PURCHASE_CATEGORIES
+
+class RecommendPaymentMethodTool(Tool):
+    """Tool for recommending which of a user's cards to use for a purchase category."""
+
+    name = "recommend_payment_method"
+    description = (
+        "Recommend the best card in the user's wallet for a purchase category, "
+        "or for every category"
+    )
+
+    def __init__(self, recommendations: RecommendationCache):
+        super().__init__()
+        self.recommendations = recommendations
+
+    async def execute(self, context: ToolContext, **kwargs) -> dict:
+        try:
+            user_id = kwargs.get("user_id")
+            category = kwargs.get("category")
+            if not user_id:
+                raise ValueError("User ID is required")
+
+            table = await self.recommendations.get_table(user_id)
+            if category:
+                return {"user_id": user_id, **table.best(category)}
+            return {"user_id": user_id, "recommendations": table.to_dict()}
+
+        except ValueError as e:
+            raise ValueError(f"Invalid input parameters: {str(e)}")
+        except WalletUnavailableError as e:
+            raise Exception(f"Error loading wallet: {str(e)}")
+        except Exception as e:
+            raise Exception(f"Error recommending payment method: {str(e)}")
+
+    @property
+    def parameters(self) -> dict:
+        return {
+            "type": "object",
+            "properties": {
+                "user_id": {
+                    "type": "string",
+                    "description": "User ID whose wallet to use"
+                },
+                "category": {
+                    "type": "string",
+                    "enum": list(PURCHASE_CATEGORIES),
+                    "description": "Purchase category; omit to get the best card for every category"
+                }
+            },
+            "required": ["user_id"]
+        }
@@ -0,0 +1,89 @@
+"""Cost of storing flight search results and serving pages from the session store.
+
+Run from the chase_travel directory:
+
+    python -m benchmarks.session_store --flights 100 1000 10000 --page-size 50
+
+For each result set size it times:
+
+  create      storing a search (serializing every flight once)
+  page mem    a page of a session held in memory
+  page disk   the same page of a session spilled to a memory-mapped file
+  all flights every flight parsed back to dicts (what optimize_travel loads)
+  model dump  FlightSearchResponse.model_dump_json, for scale
+"""
+import argparse
+import tempfile
+import timeit
+from functools import partial
+from pathlib import Path
+from typing import Any, List
+from shared.models.api.flight_search import Flight, FlightSearchResponse, FlightSegment, Price
+from shared.models.trusted import trusted
+from sessions.store import SearchSessionStore
+
+def flight_results(count: int) -> List[Flight]:
+    return [
+        trusted(
+            Flight,
+            id=f"FL{i}",
+            segments=[
+                trusted(
+                    FlightSegment,
+                    flight_number=f"AA{100 + j}",
+                    airline_code="AA",
+                    departure_airport="JFK" if j == 0 else "ORD",
+                    arrival_airport="ORD" if j == 0 else "LAX",
+                    departure_time="2026-12-01T10:00:00Z",
+                    arrival_time="2026-12-01T12:00:00Z",
+                    duration_minutes=120
+                )
+                for j in range(2)
+            ],
+            price=trusted(Price, amount=199.0 + i, currency="USD"),
+            cabin_class="ECONOMY",
+            available_seats=9
+        )
+        for i in range(count)
+    ]
+
+def per_call_us(fn: Any, number: int) -> float:
+    return min(timeit.repeat(fn, number=number, repeat=5)) / number * 1e6
+
+def main(args: argparse.Namespace) -> None:
+    with tempfile.TemporaryDirectory() as directory:
+        memory = SearchSessionStore(Path(directory) / "memory")
+        disk = SearchSessionStore(Path(directory) / "disk", max_memory_bytes=0)
+        print(
+            f"{'flights':>8}{'create us':>12}{'page mem us':>13}{'page disk us':>14}"
+            f"{'all flights us':>16}{'model dump us':>15}"
+        )
+        for count in args.flights:
+            flights = flight_results(count)
+            number = max(1, args.repeat * 100 // count)
+            create_us = per_call_us(partial(memory.create, {}, flights), number)
+            in_memory = memory.create({}, flights).search_id
+            spilled = disk.create({}, flights).search_id
+            middle = max(0, count // 2 - args.page_size // 2)
+            page_memory_us = per_call_us(
+                partial(memory.page, in_memory, middle, args.page_size), args.repeat * 100
+            )
+            page_disk_us = per_call_us(
+                partial(disk.page, spilled, middle, args.page_size), args.repeat * 100
+            )
+            all_us = per_call_us(partial(memory.flights, in_memory), number)
+            response = trusted(FlightSearchResponse, flights=flights, total_count=count)
+            dump_us = per_call_us(response.model_dump_json, number)
+            print(
+                f"{count:>8}{create_us:>12.1f}{page_memory_us:>13.1f}{page_disk_us:>14.1f}"
+                f"{all_us:>16.1f}{dump_us:>15.1f}"
+            )
+        memory.close()
+        disk.close()
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--flights", type=int, nargs="+", default=[100, 1000, 10000])
+    parser.add_argument("--page-size", type=int, default=50)
+    parser.add_argument("--repeat", type=int, default=20)
+    main(parser.parse_args())
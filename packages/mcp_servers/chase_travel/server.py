@@ -1,22 +1,45 @@
-import asyncio
-import os
-from typing import Dict, Any
-from fastapi import FastAPI
+from typing import Any, Dict, Optional
+from fastapi import FastAPI, HTTPException, Query, Response
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse
 from loguru import logger
 from mcp import FastMCP, MCPRequest, MCPResponse
 from dotenv import load_dotenv
+from shared.server import (
+    CompressionMiddleware,
+    RequestIdentityMiddleware,
+    ServerRuntime,
+    create_metrics_router,
+    create_tool_router,
+    health_response,
+    load_server_config,
+    run_server
+)
+from shared.tracing import configure_tracing
 from tools.search_flights import SearchFlightsTool
 from tools.get_flight_details import GetFlightDetailsTool
+from tools.get_search_results import GetSearchResultsTool
+from sessions.store import SearchSessionStore, SessionNotFoundError, create_session_store
 
 # Load environment variables
 load_dotenv()
 
+# Spans are exported to TRACE_EXPORT_PATH when set
+configure_tracing("chase-travel-mcp")
+
+# Long-lived resources and tools, created at startup and shared by all requests
+runtime = ServerRuntime("Chase Travel")
+runtime.add_resource("sessions", lambda rt: create_session_store(), close=SearchSessionStore.close)
+runtime.add_tool("search_flights", lambda rt: SearchFlightsTool(rt["sessions"]))
+runtime.add_tool("get_flight_details", lambda rt: GetFlightDetailsTool())
+runtime.add_tool("get_search_results", lambda rt: GetSearchResultsTool(rt["sessions"]))
+
 # Initialize FastAPI app
 app = FastAPI(
     title="Chase Travel MCP Server",
     description="MCP server for flight search functionality",
-    version="0.1.0"
+    version="0.1.0",
+    lifespan=runtime.lifespan
 )
 
 # Configure CORS
@@ -28,6 +51,12 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# user-id and priority headers schedule calls per caller; traceparent continues the caller's trace
+app.add_middleware(RequestIdentityMiddleware)
+
+# gzip/zstd for clients that accept it; small responses are sent as-is
+app.add_middleware(CompressionMiddleware)
+
 # Initialize MCP server
 mcp = FastMCP("Chase Travel")
 
@@ -35,39 +64,62 @@ mcp = FastMCP("Chase Travel")
 @mcp.tool("search_flights")
 async def search_flights(request: MCPRequest) -> MCPResponse:
     """Search for available flights based on criteria."""
-    try:
-        tool = SearchFlightsTool()
-        result = await tool.execute(None, **request.parameters)
-        return MCPResponse(status="success", data=result)
-    except ValueError as e:
-        return MCPResponse(status="error", error=str(e))
-    except Exception as e:
-        logger.error(f"Error in flight search: {str(e)}")
-        return MCPResponse(status="error", error="Internal server error")
+    return await runtime.dispatch("search_flights", request.parameters)
 
 @mcp.tool("get_flight_details")
 async def get_flight_details(request: MCPRequest) -> MCPResponse:
     """Get detailed information about a specific flight."""
+    return await runtime.dispatch("get_flight_details", request.parameters)
+
+@mcp.tool("get_search_results")
+async def get_search_results(request: MCPRequest) -> MCPResponse:
+    """Get a page of a previous flight search's results."""
+    return await runtime.dispatch("get_search_results", request.parameters)
+
+# Stored search results as JSON; every flight when limit is omitted (used by the Benefits server)
+@app.get("/api/searches/{search_id}/flights")
+async def get_search_flights_json(
+    search_id: str,
+    offset: int = Query(0, ge=0),
+    limit: Optional[int] = Query(None, ge=1)
+) -> Response:
+    """Get a page of stored search results without searching again."""
     try:
-        tool = GetFlightDetailsTool()
-        result = await tool.execute(None, **request.parameters)
-        return MCPResponse(status="success", data=result)
-    except ValueError as e:
-        return MCPResponse(status="error", error=str(e))
-    except Exception as e:
-        logger.error(f"Error getting flight details: {str(e)}")
-        return MCPResponse(status="error", error="Internal server error")
-
-# Health check endpoint
+        page = runtime["sessions"].page(search_id, offset=offset, limit=limit)
+    except SessionNotFoundError as e:
+        raise HTTPException(status_code=404, detail=str(e)) from e
+    return Response(content=page.content, media_type="application/json")
+
+@app.get("/sessions/stats")
+async def session_stats() -> Dict[str, Any]:
+    """Search session store statistics."""
+    sessions = runtime["sessions"]
+    return {
+        **sessions.stats.to_dict(),
+        "sessions": len(sessions),
+        "memory_bytes": sessions.memory_bytes,
+        "max_memory_bytes": sessions.max_memory_bytes,
+        "disk_bytes": sessions.disk_bytes,
+        "max_disk_bytes": sessions.max_disk_bytes,
+        "write_through": sessions.write_through
+    }
+
+# Fast JSON path: POST /api/tools/{tool_name} serializes results from models or cached bytes
+app.include_router(create_tool_router(runtime))
+
+# Per-tool request, error, latency and payload size metrics
+app.include_router(create_metrics_router(runtime))
+
+# Readiness: 503 while starting or while admission control is shedding calls
 @app.get("/health")
-async def health_check() -> Dict[str, str]:
+async def health_check() -> JSONResponse:
     """Health check endpoint."""
-    return {"status": "healthy", "service": "chase-travel-mcp"}
+    return health_response(runtime, "chase-travel-mcp")
 
 # Mount MCP server to FastAPI app
 app.mount("/mcp", mcp.app)
 
-async def main():
+def main():
     """Main entry point for the server."""
     # Configure logging
     logger.add(
@@ -77,15 +129,8 @@ async def main():
         level="INFO"
     )
     
-    # Start the server
-    import uvicorn
-    port = int(os.getenv("PORT", "3001"))
-    uvicorn.run(
-        "server:app",
-        host="0.0.0.0",
-        port=port,
-        reload=True
-    )
+    # Start the server; one worker unless WEB_CONCURRENCY is set, reloading only in development
+    run_server("server:app", load_server_config(default_port=3001))
 
 if __name__ == "__main__":
-    asyncio.run(main()) 
\ No newline at end of file
+    main()
@@ -0,0 +1,381 @@
+import mmap
+import os
+import re
+import secrets
+import shutil
+import struct
+import tempfile
+import time
+from array import array
+from collections import OrderedDict
+from dataclasses import asdict, dataclass
+from itertools import accumulate
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+from loguru import logger
+from pydantic import BaseModel
+from shared.server import RawJSON, dumps, loads
+
+DEFAULT_TTL = 900.0
+DEFAULT_MAX_MEMORY_BYTES = 64 * 1024 * 1024
+DEFAULT_MAX_DISK_BYTES = 1024 * 1024 * 1024
+DEFAULT_PAGE_SIZE = 50
+SWEEP_INTERVAL = 1.0
+# Shared by every worker on the host unless SEARCH_SESSION_DIR is set
+DEFAULT_DIRECTORY = Path(tempfile.gettempdir()) / "chase-travel-search-sessions"
+
+SEARCH_ID_PATTERN = re.compile(r"^srch_[0-9a-f]{32}$")
+SESSION_SUFFIX = ".session"
+
+# Spill file: header, flight offsets (native int64), request JSON, then the flights JSON
+_HEADER = struct.Struct("=4sHxxdQQ")
+_MAGIC = b"FSRS"
+_VERSION = 1
+
+class SessionNotFoundError(LookupError):
+    """Raised for an unknown or expired search ID."""
+
+    def __init__(self, search_id: str):
+        self.search_id = search_id
+        super().__init__(f"Unknown or expired search: {search_id}")
+
+@dataclass
+class SessionStats:
+    """Counters for the search session store."""
+    created: int = 0
+    memory_hits: int = 0
+    disk_hits: int = 0
+    misses: int = 0
+    spills: int = 0
+    expirations: int = 0
+    evictions: int = 0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+class SearchSession:
+    """One search's results, each flight serialized once and stored back to back.
+
+    Flights are joined with commas, so any page is a single slice of the
+    body: flight i starts at offsets[i] and the page [i, j) ends at
+    offsets[j] - 1. The body is held in memory until the session is
+    spilled; after that pages are read from the memory-mapped file. Files
+    another worker wrote are not owned, and only their owner removes them.
+    """
+    __slots__ = (
+        "search_id", "request", "expires_at", "offsets", "body", "path", "data_offset", "owned"
+    )
+
+    def __init__(
+        self,
+        search_id: str,
+        request: Dict[str, Any],
+        expires_at: float,
+        offsets: array,
+        body: Optional[bytes] = None,
+        path: Optional[Path] = None,
+        data_offset: int = 0,
+        owned: bool = True
+    ):
+        self.search_id = search_id
+        self.request = request
+        self.expires_at = expires_at
+        self.offsets = offsets
+        self.body = body
+        self.path = path
+        self.data_offset = data_offset
+        self.owned = owned
+
+    @property
+    def flight_count(self) -> int:
+        return len(self.offsets) - 1
+
+    @property
+    def nbytes(self) -> int:
+        return self.offsets[-1] + len(self.offsets) * self.offsets.itemsize
+
+    def flights_json(self, start: int = 0, stop: Optional[int] = None) -> bytes:
+        """Flights [start, stop) as the items of a JSON array, without brackets."""
+        stop = self.flight_count if stop is None else min(stop, self.flight_count)
+        if start >= stop:
+            return b""
+        begin, end = self.offsets[start], self.offsets[stop] - 1
+        if self.body is not None:
+            return self.body[begin:end]
+        with (
+            open(self.path, "rb") as f,
+            mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped
+        ):
+            return mapped[self.data_offset + begin:self.data_offset + end]
+
+class SearchSessionStore:
+    """Flight search results by generated search ID, for pagination and optimization.
+
+    Sessions live in an in-memory LRU tier up to max_memory_bytes; the least
+    recently used are spilled to files in directory and served from there
+    memory-mapped, up to max_disk_bytes. Sessions expire ttl seconds after
+    the search. Spill files are self-describing, so workers sharing a
+    directory can read each other's sessions; with write_through every
+    session is written to its file when it is created, so it is visible to
+    the other workers at once.
+    """
+
+    def __init__(
+        self,
+        directory: Optional[Path] = None,
+        ttl: float = DEFAULT_TTL,
+        max_memory_bytes: int = DEFAULT_MAX_MEMORY_BYTES,
+        max_disk_bytes: int = DEFAULT_MAX_DISK_BYTES,
+        write_through: bool = False
+    ):
+        self._owns_directory = directory is None
+        self.directory = (
+            Path(directory) if directory else Path(tempfile.mkdtemp(prefix="search-sessions-"))
+        )
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.ttl = ttl
+        self.max_memory_bytes = max_memory_bytes
+        self.max_disk_bytes = max_disk_bytes
+        self.write_through = write_through
+        self.stats = SessionStats()
+        self.memory_bytes = 0
+        self.disk_bytes = 0
+        self._memory: "OrderedDict[str, SearchSession]" = OrderedDict()
+        self._disk: "OrderedDict[str, SearchSession]" = OrderedDict()
+        self._next_sweep = 0.0
+        if not self._owns_directory:
+            self._remove_expired_files()
+
+    def __len__(self) -> int:
+        return len(self._memory) + len(self._disk)
+
+    def create(self, request: Dict[str, Any], flights: Sequence[BaseModel]) -> SearchSession:
+        """Store a search's flights under a new search ID."""
+        now = time.time()
+        self._sweep(now)
+        flight_json = [dumps(flight) for flight in flights]
+        offsets = array("q", accumulate((len(item) + 1 for item in flight_json), initial=0))
+        session = SearchSession(
+            search_id=f"srch_{secrets.token_hex(16)}",
+            request=request,
+            expires_at=now + self.ttl,
+            offsets=offsets,
+            body=b",".join(flight_json)
+        )
+        if self.write_through:
+            # On failure the session is still served by this worker
+            self._write(session)
+        self._memory[session.search_id] = session
+        self.memory_bytes += session.nbytes
+        self.stats.created += 1
+        self._enforce_memory_limit()
+        return session
+
+    def get(self, search_id: str) -> SearchSession:
+        """Look up a live session, memory tier first, then spill files."""
+        now = time.time()
+        session = self._memory.get(search_id)
+        if session is not None:
+            if now < session.expires_at:
+                self._memory.move_to_end(search_id)
+                self.stats.memory_hits += 1
+                return session
+            self._expire(session)
+            raise self._miss(search_id)
+
+        session = self._disk.get(search_id)
+        if session is not None:
+            self._disk.move_to_end(search_id)
+        else:
+            session = self._open_spilled(search_id)
+            if session is None:
+                raise self._miss(search_id)
+            if now < session.expires_at:
+                # Cached and counted in the disk tier like this worker's own spilled sessions
+                self._disk[search_id] = session
+                self.disk_bytes += session.nbytes
+                self._enforce_memory_limit()
+        if now >= session.expires_at:
+            self._expire(session)
+            raise self._miss(search_id)
+        self.stats.disk_hits += 1
+        return session
+
+    def page(
+        self, search_id: str, offset: int = 0, limit: Optional[int] = DEFAULT_PAGE_SIZE
+    ) -> RawJSON:
+        """A page of a search's flights, assembled from the stored JSON without parsing it."""
+        session = self.get(search_id)
+        total = session.flight_count
+        stop = total if limit is None else min(offset + limit, total)
+        return RawJSON(
+            b'{"search_id":' + dumps(search_id)
+            + b',"flights":[' + session.flights_json(offset, stop)
+            + b'],"total_count":' + str(total).encode()
+            + b',"offset":' + str(offset).encode()
+            + b',"next_offset":' + (str(stop).encode() if stop < total else b"null")
+            + b',"expires_at":' + dumps(session.expires_at) + b"}"
+        )
+
+    def flights(self, search_id: str) -> List[Dict[str, Any]]:
+        """All of a search's flights as dicts."""
+        return loads(b"[" + self.get(search_id).flights_json() + b"]")
+
+    def close(self) -> None:
+        self._memory.clear()
+        self._disk.clear()
+        self.memory_bytes = self.disk_bytes = 0
+        if self._owns_directory:
+            shutil.rmtree(self.directory, ignore_errors=True)
+
+    def _enforce_memory_limit(self) -> None:
+        while self.memory_bytes > self.max_memory_bytes and self._memory:
+            _, session = self._memory.popitem(last=False)
+            self.memory_bytes -= session.nbytes
+            self._spill(session)
+        # Written-through sessions still in memory are on disk too
+        while self.disk_bytes > self.max_disk_bytes and (self._disk or self._memory):
+            tier = self._disk or self._memory
+            _, session = tier.popitem(last=False)
+            if tier is self._memory:
+                self.memory_bytes -= session.nbytes
+            if session.path is not None:
+                self.disk_bytes -= session.nbytes
+                if session.owned:
+                    _unlink(session.path)
+            self.stats.evictions += 1
+
+    def _spill(self, session: SearchSession) -> None:
+        if session.path is None and not self._write(session):
+            return
+        session.body = None
+        self._disk[session.search_id] = session
+        self.stats.spills += 1
+
+    def _write(self, session: SearchSession) -> bool:
+        """Write a session's file, keeping its body; False if it could not be written."""
+        request_json = dumps(session.request)
+        header = _HEADER.pack(
+            _MAGIC, _VERSION, session.expires_at, session.flight_count, len(request_json)
+        )
+        path = self.directory / f"{session.search_id}{SESSION_SUFFIX}"
+        partial = path.with_suffix(".partial")
+        try:
+            with open(partial, "wb") as f:
+                f.write(header)
+                f.write(session.offsets.tobytes())
+                f.write(request_json)
+                f.write(session.body)
+            # Readers in other workers never see a half-written file
+            os.replace(partial, path)
+        except OSError as e:
+            _unlink(partial)
+            logger.error(f"Failed to write search session {session.search_id}: {str(e)}")
+            return False
+        session.data_offset = (
+            len(header) + len(session.offsets) * session.offsets.itemsize + len(request_json)
+        )
+        session.path = path
+        self.disk_bytes += session.nbytes
+        return True
+
+    def _open_spilled(self, search_id: str) -> Optional[SearchSession]:
+        """Load a session another worker spilled into the shared directory."""
+        if not SEARCH_ID_PATTERN.match(search_id):
+            return None
+        path = self.directory / f"{search_id}{SESSION_SUFFIX}"
+        try:
+            with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                expires_at, count, request_length = _read_header(mapped)
+                offsets = array("q")
+                request_start = _HEADER.size + (count + 1) * offsets.itemsize
+                offsets.frombytes(mapped[_HEADER.size:request_start])
+                request = loads(mapped[request_start:request_start + request_length])
+        except (OSError, ValueError):
+            return None
+        return SearchSession(
+            search_id=search_id,
+            request=request,
+            expires_at=expires_at,
+            offsets=offsets,
+            path=path,
+            data_offset=request_start + request_length,
+            owned=False
+        )
+
+    def _sweep(self, now: float) -> None:
+        if now < self._next_sweep:
+            return
+        self._next_sweep = now + SWEEP_INTERVAL
+        for tier in (self._memory, self._disk):
+            for session in [session for session in tier.values() if session.expires_at <= now]:
+                self._expire(session)
+
+    def _expire(self, session: SearchSession) -> None:
+        in_memory = self._memory.pop(session.search_id, None) is not None
+        if in_memory:
+            self.memory_bytes -= session.nbytes
+        cached = in_memory or self._disk.pop(session.search_id, None) is not None
+        if cached and session.path is not None:
+            self.disk_bytes -= session.nbytes
+        # Other workers' files are left to their own sweep and to _remove_expired_files
+        if session.owned:
+            _unlink(session.path)
+        self.stats.expirations += 1
+
+    def _miss(self, search_id: str) -> SessionNotFoundError:
+        self.stats.misses += 1
+        return SessionNotFoundError(search_id)
+
+    def _remove_expired_files(self) -> None:
+        now = time.time()
+        for path in self.directory.glob(f"*{SESSION_SUFFIX}"):
+            try:
+                with open(path, "rb") as f:
+                    expires_at, _, _ = _read_header(f.read(_HEADER.size))
+            except (OSError, ValueError):
+                continue
+            if expires_at <= now:
+                _unlink(path)
+
+def _read_header(buffer: Any) -> Tuple[float, int, int]:
+    try:
+        magic, version, expires_at, count, request_length = _HEADER.unpack_from(buffer)
+    except struct.error:
+        raise ValueError("Truncated search session file") from None
+    if magic != _MAGIC or version != _VERSION:
+        raise ValueError("Not a search session file")
+    return expires_at, count, request_length
+
+def _unlink(path: Optional[Path]) -> None:
+    if path is None:
+        return
+    try:
+        os.unlink(path)
+    except FileNotFoundError:
+        pass
+    except OSError as e:
+        logger.warning(f"Failed to remove search session file {path}: {str(e)}")
+
+def create_session_store() -> SearchSessionStore:
+    """Create a session store configured from env.
+
+    With several workers (WEB_CONCURRENCY > 1) sessions are written through
+    to the shared directory, since a search's pages may be requested from
+    any worker; SEARCH_SESSION_WRITE_THROUGH overrides this.
+    """
+    workers = int(os.getenv("WEB_CONCURRENCY", "1"))
+    write_through = os.getenv("SEARCH_SESSION_WRITE_THROUGH", "true" if workers > 1 else "false")
+    max_memory_mb = float(
+        os.getenv("SEARCH_SESSION_MAX_MEMORY_MB", str(DEFAULT_MAX_MEMORY_BYTES / 2**20))
+    )
+    max_disk_mb = float(
+        os.getenv("SEARCH_SESSION_MAX_DISK_MB", str(DEFAULT_MAX_DISK_BYTES / 2**20))
+    )
+    return SearchSessionStore(
+        directory=Path(os.getenv("SEARCH_SESSION_DIR", str(DEFAULT_DIRECTORY))),
+        ttl=float(os.getenv("SEARCH_SESSION_TTL", str(DEFAULT_TTL))),
+        max_memory_bytes=int(max_memory_mb * 2**20),
+        max_disk_bytes=int(max_disk_mb * 2**20),
+        write_through=write_through.lower() in ("1", "true", "yes")
+    )
@@ -1,5 +1,6 @@
 from typing import Optional
 from mcp import Tool, ToolContext
+from shared.models.trusted import trusted
 from shared.models.api.flight_search import (
     Flight,
     FlightSegment,
@@ -13,6 +14,10 @@ class GetFlightDetailsTool(Tool):
     description = "Get detailed information about a specific flight"
     
     async def execute(self, context: ToolContext, **kwargs) -> dict:
+        return (await self.execute_payload(context, **kwargs)).model_dump()
+    
+    async def execute_payload(self, context: ToolContext, **kwargs) -> Flight:
+        """Result as a model, for serializing straight to JSON."""
         try:
             flight_id = kwargs.get("flight_id")
             if not flight_id:
@@ -20,10 +25,12 @@ class GetFlightDetailsTool(Tool):
             
             # TODO: Implement actual flight details retrieval logic
             # This is a mock implementation
-            mock_flight = Flight(
+            mock_flight = trusted(
+                Flight,
                 id=flight_id,
                 segments=[
-                    FlightSegment(
+                    trusted(
+                        FlightSegment,
                         flight_number="AA123",
                         airline_code="AA",
                         departure_airport="JFK",
@@ -33,12 +40,12 @@ class GetFlightDetailsTool(Tool):
                         duration_minutes=120
                     )
                 ],
-                price=Price(amount=299.99, currency="USD"),
+                price=trusted(Price, amount=299.99, currency="USD"),
                 cabin_class="ECONOMY",
                 available_seats=10
             )
             
-            return mock_flight.model_dump()
+            return mock_flight
             
         except ValueError as e:
             raise ValueError(f"Invalid input parameters: {str(e)}")
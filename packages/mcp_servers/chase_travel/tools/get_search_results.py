@@ -0,0 +1,64 @@
+from mcp import Tool, ToolContext
+from shared.server import RawJSON
+from sessions.store import DEFAULT_PAGE_SIZE, SearchSessionStore, SessionNotFoundError
+
+class GetSearchResultsTool(Tool):
+    """Tool for paging through stored flight search results."""
+
+    name = "get_search_results"
+    description = (
+        "Get a page of a previous flight search's results by search ID, without searching again"
+    )
+
+    def __init__(self, sessions: SearchSessionStore):
+        super().__init__()
+        self.sessions = sessions
+
+    async def execute(self, context: ToolContext, **kwargs) -> dict:
+        return (await self.execute_payload(context, **kwargs)).loads()
+
+    async def execute_payload(self, context: ToolContext, **kwargs) -> RawJSON:
+        """Page assembled from the stored JSON bytes."""
+        try:
+            search_id = kwargs.get("search_id")
+            if not search_id:
+                raise ValueError("Search ID is required")
+
+            return self.sessions.page(
+                search_id,
+                offset=int(kwargs.get("offset", 0)),
+                limit=int(kwargs.get("limit", DEFAULT_PAGE_SIZE))
+            )
+
+        except SessionNotFoundError as e:
+            raise ValueError(f"{str(e)}; run search_flights again for a new search ID") from e
+        except ValueError as e:
+            raise ValueError(f"Invalid input parameters: {str(e)}")
+        except Exception as e:
+            raise Exception(f"Error getting search results: {str(e)}")
+
+    @property
+    def parameters(self) -> dict:
+        return {
+            "type": "object",
+            "properties": {
+                "search_id": {
+                    "type": "string",
+                    "description": "Search ID returned by search_flights"
+                },
+                "offset": {
+                    "type": "integer",
+                    "minimum": 0,
+                    "default": 0,
+                    "description": "Index of the first flight to return"
+                },
+                "limit": {
+                    "type": "integer",
+                    "minimum": 1,
+                    "maximum": 500,
+                    "default": DEFAULT_PAGE_SIZE,
+                    "description": "Maximum number of flights to return"
+                }
+            },
+            "required": ["search_id"]
+        }
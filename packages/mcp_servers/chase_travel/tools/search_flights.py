@@ -1,6 +1,8 @@
 from typing import List, Optional
 from datetime import date
 from mcp import Tool, ToolContext
+from shared.models.trusted import trusted
+from shared.tracing import start_span
 from shared.models.api.flight_search import (
     FlightSearchRequest,
     FlightSearchResponse,
@@ -9,6 +11,7 @@ from shared.models.api.flight_search import (
     Price,
     PassengerCount
 )
+from sessions.store import SearchSessionStore
 
 class SearchFlightsTool(Tool):
     """Tool for searching available flights."""
@@ -16,48 +19,81 @@ class SearchFlightsTool(Tool):
     name = "search_flights"
     description = "Search for available flights based on origin, destination, dates, and passenger information"
     
+    def __init__(self, sessions: SearchSessionStore):
+        super().__init__()
+        self.sessions = sessions
+    
     async def execute(self, context: ToolContext, **kwargs) -> dict:
+        response = await self.execute_payload(context, **kwargs)
+        with start_span("serialize"):
+            return response.model_dump()
+    
+    async def execute_payload(self, context: ToolContext, **kwargs) -> FlightSearchResponse:
+        """Result as a model, for serializing straight to JSON."""
         try:
             # Parse request parameters
-            request = FlightSearchRequest(
-                origin=kwargs.get("origin"),
-                destination=kwargs.get("destination"),
-                departure_date=date.fromisoformat(kwargs.get("departure_date")),
-                passengers=PassengerCount(
-                    adults=kwargs.get("adults", 1),
-                    children=kwargs.get("children", 0),
-                    infants=kwargs.get("infants", 0)
-                ),
-                return_date=date.fromisoformat(kwargs.get("return_date")) if kwargs.get("return_date") else None,
-                cabin_class=kwargs.get("cabin_class", "ECONOMY")
-            )
+            with start_span("validate"):
+                request = FlightSearchRequest(
+                    origin=kwargs.get("origin"),
+                    destination=kwargs.get("destination"),
+                    departure_date=date.fromisoformat(kwargs.get("departure_date")),
+                    passengers=PassengerCount(
+                        adults=kwargs.get("adults", 1),
+                        children=kwargs.get("children", 0),
+                        infants=kwargs.get("infants", 0)
+                    ),
+                    return_date=(
+                        date.fromisoformat(kwargs.get("return_date"))
+                        if kwargs.get("return_date")
+                        else None
+                    ),
+                    cabin_class=kwargs.get("cabin_class", "ECONOMY")
+                )
             
-            # TODO: Implement actual flight search logic
-            # This is a mock implementation
-            mock_flight = Flight(
-                id="FL123",
-                segments=[
-                    FlightSegment(
-                        flight_number="AA123",
-                        airline_code="AA",
-                        departure_airport=request.origin,
-                        arrival_airport=request.destination,
-                        departure_time="2024-03-15T10:00:00Z",
-                        arrival_time="2024-03-15T12:00:00Z",
-                        duration_minutes=120
-                    )
-                ],
-                price=Price(amount=299.99, currency="USD"),
-                cabin_class=request.cabin_class,
-                available_seats=10
-            )
+            with start_span(
+                "search",
+                attributes={
+                    "flights.origin": request.origin,
+                    "flights.destination": request.destination
+                }
+            ):
+                # TODO: Implement actual flight search logic
+                # This is a mock implementation; results are built from the
+                # validated request and indexed data, so without re-validation
+                mock_flight = trusted(
+                    Flight,
+                    id="FL123",
+                    segments=[
+                        trusted(
+                            FlightSegment,
+                            flight_number="AA123",
+                            airline_code="AA",
+                            departure_airport=request.origin,
+                            arrival_airport=request.destination,
+                            departure_time="2024-03-15T10:00:00Z",
+                            arrival_time="2024-03-15T12:00:00Z",
+                            duration_minutes=120
+                        )
+                    ],
+                    price=trusted(Price, amount=299.99, currency="USD"),
+                    cabin_class=request.cabin_class,
+                    available_seats=10
+                )
+            
+                flights = [mock_flight]
             
-            response = FlightSearchResponse(
-                flights=[mock_flight],
-                total_count=1
+            # Stored so pages and optimizations reuse the results instead of searching again
+            with start_span("store_session", attributes={"flights.count": len(flights)}):
+                session = self.sessions.create(request.model_dump(mode="json"), flights)
+            
+            response = trusted(
+                FlightSearchResponse,
+                flights=flights,
+                total_count=len(flights),
+                search_id=session.search_id
             )
             
-            return response.model_dump()
+            return response
             
         except ValueError as e:
             raise ValueError(f"Invalid input parameters: {str(e)}")
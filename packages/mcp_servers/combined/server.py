@@ -0,0 +1,149 @@
+import importlib.util
+import sys
+from pathlib import Path
+from types import ModuleType
+from typing import Any, Dict, List, Optional
+from fastapi import FastAPI
+from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse
+from loguru import logger
+from mcp import FastMCP, MCPRequest, MCPResponse
+from dotenv import load_dotenv
+from shared.server import (
+    CompressionMiddleware,
+    RequestIdentityMiddleware,
+    RuntimeGroup,
+    create_metrics_router,
+    create_tool_router,
+    health_response,
+    load_server_config,
+    run_server
+)
+from shared.tracing import configure_tracing
+
+# Load environment variables
+load_dotenv()
+
+SERVERS_ROOT = Path(__file__).resolve().parent.parent
+# Start order: Benefits links to the SafePay wallet cache once both are up
+SERVER_NAMES = ("chase_travel", "safepay_wallet", "benefits")
+
+def load_server_module(name: str) -> ModuleType:
+    """Import a server's server.py under a unique module name."""
+    module_name = f"{name}_server"
+    if module_name in sys.modules:
+        return sys.modules[module_name]
+    spec = importlib.util.spec_from_file_location(module_name, SERVERS_ROOT / name / "server.py")
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[module_name] = module
+    spec.loader.exec_module(module)
+    return module
+
+def load_servers() -> Dict[str, ModuleType]:
+    # Each server imports its own packages (tools, wallet, engine, catalog, ...) by
+    # top-level name; the tools directories merge into one namespace package.
+    for name in SERVER_NAMES:
+        path = str(SERVERS_ROOT / name)
+        if path not in sys.path:
+            sys.path.append(path)
+    return {name: load_server_module(name) for name in SERVER_NAMES}
+
+def link_in_process(group: RuntimeGroup) -> None:
+    """Replace Benefits <-> SafePay and Benefits -> Chase Travel HTTP calls with direct calls."""
+    wallet_cache = group["safepay_wallet"]["wallet_cache"]
+    recommendations = group["benefits"]["recommendations"]
+    sessions = group["chase_travel"]["sessions"]
+
+    async def fetch_wallet_cards(user_id: str) -> List[Dict[str, Any]]:
+        return (await wallet_cache.get(user_id))["cards"]
+
+    async def invalidate_recommendations(user_id: str, event: Optional[Any]) -> None:
+        recommendations.invalidate(user_id)
+
+    async def fetch_search_flights(search_id: str) -> List[Dict[str, Any]]:
+        try:
+            return sessions.flights(search_id)
+        except LookupError as e:
+            raise ValueError(str(e))
+
+    recommendations.fetch_wallet = fetch_wallet_cards
+    wallet_cache.add_listener(invalidate_recommendations)
+    group["benefits"]["chase_travel_client"].fetch_search_flights = fetch_search_flights
+    logger.info(
+        "Linked Benefits to the SafePay wallet cache and Chase Travel search sessions in-process"
+    )
+
+servers = load_servers()
+# Spans are exported to TRACE_EXPORT_PATH when set; replaces the tracer each server configured
+configure_tracing("travel-mcp")
+runtime = RuntimeGroup("Travel MCP", {name: module.runtime for name, module in servers.items()})
+runtime.on_startup(link_in_process)
+
+# Initialize FastAPI app
+app = FastAPI(
+    title="Travel MCP Server",
+    description="Chase Travel, SafePay Wallet and Benefits tools in one process",
+    version="0.1.0",
+    lifespan=runtime.lifespan
+)
+
+# Configure CORS
+app.add_middleware(
+    CORSMiddleware,
+    allow_origins=["*"],  # Configure appropriately for production
+    allow_credentials=True,
+    allow_methods=["*"],
+    allow_headers=["*"],
+)
+
+# user-id and priority headers schedule calls per caller; traceparent continues the caller's trace
+app.add_middleware(RequestIdentityMiddleware)
+
+# gzip/zstd for clients that accept it; small responses are sent as-is
+app.add_middleware(CompressionMiddleware)
+
+# Initialize MCP server with every server's tools
+mcp = FastMCP("Travel")
+
+def register_tool(tool_name: str) -> None:
+    @mcp.tool(tool_name)
+    async def call_tool(request: MCPRequest) -> MCPResponse:
+        return await runtime.dispatch(tool_name, request.parameters)
+
+for tool_name in runtime.tool_names:
+    register_tool(tool_name)
+
+# Fast JSON path for every tool
+app.include_router(create_tool_router(runtime))
+
+# Per-tool request, error, latency and payload size metrics
+app.include_router(create_metrics_router(runtime))
+
+# Readiness: 503 while starting or while admission control is shedding calls
+@app.get("/health")
+async def health_check() -> JSONResponse:
+    """Health check endpoint."""
+    return health_response(runtime, "travel-mcp")
+
+# Each server's REST routes, e.g. /safepay_wallet/api/wallet/payment-methods
+for name, module in servers.items():
+    app.mount(f"/{name}", module.app)
+
+# Mount MCP server to FastAPI app
+app.mount("/mcp", mcp.app)
+
+def main():
+    """Main entry point for the server."""
+    # Configure logging
+    logger.add(
+        "logs/travel_mcp.log",
+        rotation="1 day",
+        retention="7 days",
+        level="INFO"
+    )
+
+    # Start the server; one worker unless WEB_CONCURRENCY is set, reloading only in development
+    run_server("server:app", load_server_config(default_port=3000))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,132 @@
+"""Concurrent get_payment_methods load against the SQLite wallet store.
+
+Run from the safepay_wallet directory:
+
+    python -m benchmarks.wallet_store --users 5000 --requests 20000 --concurrency 2000
+
+Each mode drives the same lookup path as the get_payment_methods tool and
+reports throughput, latency percentiles and event-loop lag (how late a 5ms
+timer fires while the load runs). "blocking" runs the same query on the
+event loop as a baseline for the lag figures.
+"""
+import argparse
+import asyncio
+import random
+import sqlite3
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, List
+import numpy as np
+from shared.models.api.payment_methods import Card
+from wallet.cache import WalletCache
+from wallet.sqlite_store import SELECT_CARDS, SQLiteWalletStore, _row_to_card
+
+LAG_INTERVAL = 0.005
+
+def seed_users(store: SQLiteWalletStore, users: int) -> None:
+    def insert(connection: sqlite3.Connection) -> None:
+        rows = [
+            (
+                f"user_{i}",
+                f"card_{i}_{j}",
+                "CREDIT",
+                f"{j:04d}",
+                1 + j,
+                2030,
+                f"User {i}",
+                int(j == 0)
+            )
+            for i in range(users)
+            for j in range(3)
+        ]
+        connection.execute("BEGIN")
+        connection.executemany(
+            "INSERT INTO cards (user_id, card_id, type, last_four_digits, expiry_month, "
+            "expiry_year, cardholder_name, is_default) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+            rows
+        )
+        connection.execute("COMMIT")
+    store.pool.run_sync(insert)
+
+async def monitor_lag(samples: List[float], stop: asyncio.Event) -> None:
+    while not stop.is_set():
+        started = time.perf_counter()
+        await asyncio.sleep(LAG_INTERVAL)
+        samples.append(time.perf_counter() - started - LAG_INTERVAL)
+
+async def run_load(
+    lookup: Callable[[str], Awaitable[Any]],
+    user_ids: List[str],
+    concurrency: int
+) -> Dict[str, float]:
+    latencies: List[float] = []
+    lag: List[float] = []
+    stop = asyncio.Event()
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def one(user_id: str) -> None:
+        async with semaphore:
+            started = time.perf_counter()
+            await lookup(user_id)
+            latencies.append(time.perf_counter() - started)
+
+    monitor = asyncio.create_task(monitor_lag(lag, stop))
+    started = time.perf_counter()
+    await asyncio.gather(*(one(user_id) for user_id in user_ids))
+    elapsed = time.perf_counter() - started
+    stop.set()
+    await monitor
+
+    latency_ms = np.array(latencies) * 1000
+    lag_ms = np.array(lag or [0.0]) * 1000
+    return {
+        "requests_per_sec": len(user_ids) / elapsed,
+        "p50_ms": float(np.percentile(latency_ms, 50)),
+        "p99_ms": float(np.percentile(latency_ms, 99)),
+        "loop_lag_p99_ms": float(np.percentile(lag_ms, 99)),
+        "loop_lag_max_ms": float(lag_ms.max())
+    }
+
+async def main(args: argparse.Namespace) -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        store = SQLiteWalletStore(str(Path(tmp) / "wallet.db"), pool_size=args.pool_size)
+        seed_users(store, args.users)
+        rng = random.Random(0)
+        user_ids = [f"user_{rng.randrange(args.users)}" for _ in range(args.requests)]
+
+        blocking_connection = store.pool._connect()
+
+        async def blocking(user_id: str) -> List[Card]:
+            return [
+                _row_to_card(row) for row in blocking_connection.execute(SELECT_CARDS, (user_id,))
+            ]
+
+        modes = {
+            "blocking": blocking,
+            "pooled": WalletCache(store, ttl=0).get,
+            "pooled+cache": WalletCache(store, max_size=args.users).get
+        }
+        print(
+            f"{args.requests} lookups over {args.users} users, "
+            f"concurrency {args.concurrency}, pool {args.pool_size}"
+        )
+        for name, lookup in modes.items():
+            result = await run_load(lookup, user_ids, args.concurrency)
+            print(
+                f"{name:>13}: {result['requests_per_sec']:9.0f} req/s  "
+                f"p50 {result['p50_ms']:7.2f}ms  p99 {result['p99_ms']:7.2f}ms  "
+                f"loop lag p99 {result['loop_lag_p99_ms']:6.2f}ms  "
+                f"max {result['loop_lag_max_ms']:6.2f}ms"
+            )
+
+        blocking_connection.close()
+        await store.close()
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--users", type=int, default=5000)
+    parser.add_argument("--requests", type=int, default=20000)
+    parser.add_argument("--concurrency", type=int, default=2000)
+    parser.add_argument("--pool-size", type=int, default=8)
+    asyncio.run(main(parser.parse_args()))
@@ -1,21 +1,62 @@
-import asyncio
-import os
-from typing import Dict, Any
-from fastapi import FastAPI
+from typing import Dict, Any, Optional
+from fastapi import FastAPI, Header, HTTPException, Response
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse
 from loguru import logger
 from mcp import FastMCP, MCPRequest, MCPResponse
 from dotenv import load_dotenv
+from shared.server import (
+    CompressionMiddleware,
+    RequestIdentityMiddleware,
+    ServerRuntime,
+    create_metrics_router,
+    create_tool_router,
+    health_response,
+    load_server_config,
+    run_server
+)
+from shared.tracing import configure_tracing
 from tools.get_payment_methods import GetPaymentMethodsTool
+from tools.get_payment_methods_bulk import GetPaymentMethodsBulkTool, create_bulk_semaphore
+from shared.models.api.payment_methods import Card
+from wallet.cache import WalletEvent, create_wallet_cache
+from wallet.store import WalletStore, load_wallet_store
+from wallet.notifications import BenefitsNotifier, create_benefits_notifier
 
 # Load environment variables
 load_dotenv()
 
+# Spans are exported to TRACE_EXPORT_PATH when set
+configure_tracing("safepay-wallet-mcp")
+
+def _create_benefits_notifier(rt: ServerRuntime) -> Optional[BenefitsNotifier]:
+    # Keep Benefits recommendations in step with wallet changes
+    notifier = create_benefits_notifier()
+    if notifier:
+        rt["wallet_cache"].add_listener(notifier)
+    return notifier
+
+# Long-lived resources and tools, created at startup and shared by all requests
+runtime = ServerRuntime("SafePay Wallet")
+runtime.add_resource("wallet_store", lambda rt: load_wallet_store(), close=WalletStore.close)
+runtime.add_resource("wallet_cache", lambda rt: create_wallet_cache(rt["wallet_store"]))
+runtime.add_resource("benefits_notifier", _create_benefits_notifier, close=BenefitsNotifier.aclose)
+runtime.add_resource("bulk_semaphore", lambda rt: create_bulk_semaphore())
+runtime.add_tool("get_payment_methods", lambda rt: GetPaymentMethodsTool(rt["wallet_cache"]))
+# Each bulk call fans out to many wallet loads, so admit fewer at once and behind interactive calls
+runtime.add_tool(
+    "get_payment_methods_bulk",
+    lambda rt: GetPaymentMethodsBulkTool(rt["wallet_cache"], rt["bulk_semaphore"]),
+    max_concurrency=8,
+    priority="batch"
+)
+
 # Initialize FastAPI app
 app = FastAPI(
     title="SafePay Wallet MCP Server",
     description="MCP server for payment methods functionality",
-    version="0.1.0"
+    version="0.1.0",
+    lifespan=runtime.lifespan
 )
 
 # Configure CORS
@@ -27,33 +68,101 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# user-id and priority headers schedule calls per caller; traceparent continues the caller's trace
+app.add_middleware(RequestIdentityMiddleware)
+
+# gzip/zstd for clients that accept it; small responses are sent as-is
+app.add_middleware(CompressionMiddleware)
+
 # Initialize MCP server
 mcp = FastMCP("SafePay Wallet")
 
 # Register tools using decorator pattern
 @mcp.tool("get_payment_methods")
 async def get_payment_methods(request: MCPRequest) -> MCPResponse:
+    """Get available payment methods for a user."""
+    return await runtime.dispatch("get_payment_methods", request.parameters)
+
+@mcp.tool("get_payment_methods_bulk")
+async def get_payment_methods_bulk(request: MCPRequest) -> MCPResponse:
+    """Get payment methods for several users in one call."""
+    return await runtime.dispatch("get_payment_methods_bulk", request.parameters)
+
+# REST view of the wallet for other services (e.g. Benefits recommendations)
+@app.get("/api/wallet/payment-methods")
+async def get_payment_methods_json(
+    user_id: str = Header(..., description="User ID for authentication")
+) -> Dict[str, Any]:
     """Get available payment methods for a user."""
     try:
-        tool = GetPaymentMethodsTool()
-        result = await tool.execute(None, **request.parameters)
-        return MCPResponse(status="success", data=result)
+        return await runtime.tools["get_payment_methods"].execute(None, user_id=user_id)
     except ValueError as e:
-        return MCPResponse(status="error", error=str(e))
-    except Exception as e:
-        logger.error(f"Error getting payment methods: {str(e)}")
-        return MCPResponse(status="error", error="Internal server error")
+        raise HTTPException(status_code=400, detail=str(e)) from e
 
-# Health check endpoint
+@app.post("/api/wallet/payment-methods", status_code=201)
+async def add_payment_method(
+    card: Card,
+    user_id: str = Header(..., description="User ID for authentication")
+) -> Dict[str, Any]:
+    """Add a card to a user's wallet."""
+    try:
+        await runtime["wallet_store"].add_card(user_id, card)
+    except ValueError as e:
+        raise HTTPException(status_code=409, detail=str(e)) from e
+    return card.model_dump()
+
+@app.delete("/api/wallet/payment-methods/{card_id}", status_code=204)
+async def remove_payment_method(
+    card_id: str,
+    user_id: str = Header(..., description="User ID for authentication")
+) -> Response:
+    """Remove a card from a user's wallet."""
+    if not await runtime["wallet_store"].remove_card(user_id, card_id):
+        raise HTTPException(status_code=404, detail=f"Card {card_id} not found")
+    return Response(status_code=204)
+
+@app.put("/api/wallet/payment-methods/{card_id}/default", status_code=204)
+async def set_default_payment_method(
+    card_id: str,
+    user_id: str = Header(..., description="User ID for authentication")
+) -> Response:
+    """Make a card the user's default payment method."""
+    if not await runtime["wallet_store"].set_default_card(user_id, card_id):
+        raise HTTPException(status_code=404, detail=f"Card {card_id} not found")
+    return Response(status_code=204)
+
+# Changes made directly in the wallet backend
+@app.post("/api/wallet/events", status_code=204)
+async def wallet_event(
+    event: WalletEvent,
+    user_id: str = Header(..., description="User ID for authentication")
+) -> Response:
+    """Invalidate a user's cached wallet after a card is added, removed or made default."""
+    await runtime["wallet_cache"].invalidate(user_id, event)
+    return Response(status_code=204)
+
+@app.get("/cache/stats")
+async def cache_stats() -> Dict[str, Any]:
+    """Wallet cache hit-rate and size."""
+    cache = runtime["wallet_cache"]
+    return {**cache.stats.to_dict(), "size": len(cache), "max_size": cache.max_size}
+
+# Fast JSON path: POST /api/tools/{tool_name} serializes results from models or cached bytes
+app.include_router(create_tool_router(runtime))
+
+# Per-tool request, error, latency and payload size metrics
+app.include_router(create_metrics_router(runtime))
+
+# Readiness: 503 while starting or while admission control is shedding calls
 @app.get("/health")
-async def health_check() -> Dict[str, str]:
+async def health_check() -> JSONResponse:
     """Health check endpoint."""
-    return {"status": "healthy", "service": "safepay-wallet-mcp"}
+    return health_response(runtime, "safepay-wallet-mcp")
 
 # Mount MCP server to FastAPI app
 app.mount("/mcp", mcp.app)
 
-async def main():
+def main():
     """Main entry point for the server."""
     # Configure logging
     logger.add(
@@ -63,15 +172,8 @@ async def main():
         level="INFO"
     )
     
-    # Start the server
-    import uvicorn
-    port = int(os.getenv("PORT", "3002"))
-    uvicorn.run(
-        "server:app",
-        host="0.0.0.0",
-        port=port,
-        reload=True
-    )
+    # Start the server; one worker unless WEB_CONCURRENCY is set, reloading only in development
+    run_server("server:app", load_server_config(default_port=3002))
 
 if __name__ == "__main__":
-    asyncio.run(main()) 
\ No newline at end of file
+    main()
@@ -1,9 +1,6 @@
-from typing import List
 from mcp import Tool, ToolContext
-from shared.models.api.payment_methods import (
-    PaymentMethodsResponse,
-    Card
-)
+from shared.server import RawJSON
+from wallet.cache import CachedWallet, WalletCache
 
 class GetPaymentMethodsTool(Tool):
     """Tool for retrieving user's payment methods."""
@@ -11,41 +8,24 @@ class GetPaymentMethodsTool(Tool):
     name = "get_payment_methods"
     description = "Get all payment methods associated with a user"
     
+    def __init__(self, cache: WalletCache):
+        super().__init__()
+        self.cache = cache
+    
     async def execute(self, context: ToolContext, **kwargs) -> dict:
+        return (await self._load(kwargs)).to_dict()
+    
+    async def execute_payload(self, context: ToolContext, **kwargs) -> RawJSON:
+        """Result as cached JSON bytes."""
+        return RawJSON((await self._load(kwargs)).json)
+    
+    async def _load(self, kwargs: dict) -> CachedWallet:
         try:
             user_id = kwargs.get("user_id")
             if not user_id:
                 raise ValueError("User ID is required")
             
-            # TODO: Implement actual payment methods retrieval logic
-            # This is a mock implementation
-            mock_cards = [
-                Card(
-                    card_id="card_123",
-                    type="CREDIT",
-                    last_four_digits="1234",
-                    expiry_month=12,
-                    expiry_year=2025,
-                    cardholder_name="John Doe",
-                    is_default=True
-                ),
-                Card(
-                    card_id="card_456",
-                    type="DEBIT",
-                    last_four_digits="5678",
-                    expiry_month=6,
-                    expiry_year=2026,
-                    cardholder_name="John Doe",
-                    is_default=False
-                )
-            ]
-            
-            response = PaymentMethodsResponse(
-                cards=mock_cards,
-                total_count=len(mock_cards)
-            )
-            
-            return response.model_dump()
+            return await self.cache.get_wallet(user_id)
             
         except ValueError as e:
             raise ValueError(f"Invalid input parameters: {str(e)}")
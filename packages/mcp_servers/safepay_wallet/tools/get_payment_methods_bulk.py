@@ -0,0 +1,87 @@
+import asyncio
+import os
+from typing import Any, Dict, Union
+from mcp import Tool, ToolContext
+from wallet.cache import CachedWallet, WalletCache
+
+DEFAULT_CONCURRENCY = 16
+MAX_USERS = 500
+
+class GetPaymentMethodsBulkTool(Tool):
+    """Tool for retrieving payment methods for many users in one call."""
+
+    name = "get_payment_methods_bulk"
+    description = "Get payment methods for several users at once, with a result or error per user"
+
+    def __init__(self, cache: WalletCache, semaphore: asyncio.Semaphore):
+        super().__init__()
+        self.cache = cache
+        self.semaphore = semaphore
+
+    async def execute(self, context: ToolContext, **kwargs) -> dict:
+        try:
+            user_ids = kwargs.get("user_ids", [])
+
+            if not user_ids:
+                raise ValueError("At least one user ID is required")
+            if len(user_ids) > MAX_USERS:
+                raise ValueError(f"At most {MAX_USERS} user IDs are allowed per call")
+
+            # Duplicates share one lookup; results keep the caller's order
+            unique_ids = list(dict.fromkeys(user_ids))
+            lookups = await asyncio.gather(*(
+                _fetch_wallet(self.cache, self.semaphore, user_id) for user_id in unique_ids
+            ))
+            by_user = dict(zip(unique_ids, lookups, strict=True))
+            # Built per occurrence, so duplicates never share a mutable dict
+            results = [_result(user_id, by_user[user_id]) for user_id in user_ids]
+
+            # Counted over results, so a duplicated ID counts once per occurrence
+            return {
+                "results": results,
+                "succeeded": sum(1 for result in results if result["status"] == "success"),
+                "failed": sum(1 for result in results if result["status"] == "error")
+            }
+
+        except ValueError as e:
+            raise ValueError(f"Invalid input parameters: {str(e)}")
+        except Exception as e:
+            raise Exception(f"Error retrieving payment methods: {str(e)}")
+
+    @property
+    def parameters(self) -> dict:
+        return {
+            "type": "object",
+            "properties": {
+                "user_ids": {
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "minItems": 1,
+                    "maxItems": MAX_USERS,
+                    "description": "User IDs whose payment methods to retrieve"
+                }
+            },
+            "required": ["user_ids"]
+        }
+
+async def _fetch_wallet(
+    cache: WalletCache, semaphore: asyncio.Semaphore, user_id: Any
+) -> Union[CachedWallet, str]:
+    """One user's cached wallet, or the error that prevented loading it."""
+    if not isinstance(user_id, str) or not user_id:
+        return "User ID must be a non-empty string"
+    try:
+        async with semaphore:
+            return await cache.get_wallet(user_id)
+    except Exception as e:
+        return f"Error retrieving payment methods: {str(e)}"
+
+def _result(user_id: Any, outcome: Union[CachedWallet, str]) -> Dict[str, Any]:
+    if isinstance(outcome, CachedWallet):
+        return {"user_id": user_id, "status": "success", "data": outcome.to_dict()}
+    return {"user_id": user_id, "status": "error", "error": outcome}
+
+def create_bulk_semaphore() -> asyncio.Semaphore:
+    """Lookup slots shared by all bulk calls, so WALLET_BULK_CONCURRENCY bounds the whole server."""
+    concurrency = int(os.getenv("WALLET_BULK_CONCURRENCY", str(DEFAULT_CONCURRENCY)))
+    return asyncio.Semaphore(max(concurrency, 1))
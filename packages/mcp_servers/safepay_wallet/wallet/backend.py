@@ -0,0 +1,31 @@
+from typing import List, Protocol
+from shared.models.api.payment_methods import Card
+
+class WalletBackend(Protocol):
+    """Source of truth for users' payment methods."""
+
+    async def fetch_cards(self, user_id: str) -> List[Card]:
+        ...
+
+def demo_cards() -> List[Card]:
+    """Cards given to demo users."""
+    return [
+        Card(
+            card_id="card_123",
+            type="CREDIT",
+            last_four_digits="1234",
+            expiry_month=12,
+            expiry_year=2025,
+            cardholder_name="John Doe",
+            is_default=True
+        ),
+        Card(
+            card_id="card_456",
+            type="DEBIT",
+            last_four_digits="5678",
+            expiry_month=6,
+            expiry_year=2026,
+            cardholder_name="John Doe",
+            is_default=False
+        )
+    ]
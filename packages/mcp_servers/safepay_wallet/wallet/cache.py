@@ -0,0 +1,178 @@
+import asyncio
+import os
+import time
+from collections import OrderedDict
+from dataclasses import asdict, dataclass
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+from loguru import logger
+from shared.models.api.payment_methods import PaymentMethodsResponse
+from shared.models.trusted import trusted
+from shared.server import dumps
+from wallet.backend import WalletBackend
+from wallet.store import WalletEvent, WalletStore
+
+DEFAULT_MAX_SIZE = 10_000
+DEFAULT_TTL = 300.0
+
+InvalidationListener = Callable[[str, Optional[WalletEvent]], Awaitable[None]]
+
+@dataclass
+class CacheStats:
+    """Counters for the wallet cache."""
+    hits: int = 0
+    misses: int = 0
+    coalesced: int = 0
+    loads: int = 0
+    load_errors: int = 0
+    evictions: int = 0
+    expirations: int = 0
+    invalidations: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses + self.coalesced
+        return self.hits / lookups if lookups else 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {**asdict(self), "hit_rate": self.hit_rate}
+
+class CachedWallet:
+    """A loaded wallet and, once requested, its JSON form.
+
+    The model and JSON are shared by every reader; dicts handed to callers
+    are built fresh by to_dict so mutating one cannot change the cache.
+    """
+    __slots__ = ("response", "_json")
+
+    def __init__(self, response: PaymentMethodsResponse):
+        self.response = response
+        self._json: Optional[bytes] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        return self.response.model_dump()
+
+    @property
+    def json(self) -> bytes:
+        if self._json is None:
+            self._json = dumps(self.response)
+        return self._json
+
+class WalletCache:
+    """Per-user wallet cache with LRU eviction, TTL and single-flight loading.
+
+    Concurrent misses for the same user share one backend fetch, which runs
+    in its own task so that a cancelled caller does not abort the others. A
+    wallet invalidated while its fetch is in flight is not cached when the fetch
+    completes.
+    """
+
+    def __init__(
+        self, backend: WalletBackend, max_size: int = DEFAULT_MAX_SIZE, ttl: float = DEFAULT_TTL
+    ):
+        self.backend = backend
+        self.max_size = max_size
+        self.ttl = ttl
+        self.stats = CacheStats()
+        self._entries: "OrderedDict[str, Tuple[float, CachedWallet]]" = OrderedDict()
+        self._inflight: Dict[str, asyncio.Task] = {}
+        self._listeners: List[InvalidationListener] = []
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    async def get(self, user_id: str) -> Dict[str, Any]:
+        """Get a copy of a user's payment methods, loading them on a miss."""
+        return (await self.get_wallet(user_id)).to_dict()
+
+    async def get_wallet(self, user_id: str) -> CachedWallet:
+        """Get a user's cached wallet, whose JSON is serialized at most once per load."""
+        entry = self._entries.get(user_id)
+        if entry is not None:
+            expires_at, wallet = entry
+            if time.monotonic() < expires_at:
+                self._entries.move_to_end(user_id)
+                self.stats.hits += 1
+                return wallet
+            del self._entries[user_id]
+            self.stats.expirations += 1
+
+        inflight = self._inflight.get(user_id)
+        if inflight is not None:
+            self.stats.coalesced += 1
+            return await asyncio.shield(inflight)
+
+        self.stats.misses += 1
+        task = asyncio.create_task(self._fill(user_id))
+        self._inflight[user_id] = task
+        task.add_done_callback(lambda done: self._finish(user_id, done))
+        return await asyncio.shield(task)
+
+    async def invalidate(self, user_id: str, event: Optional[WalletEvent] = None) -> None:
+        """Drop a user's cached wallet and notify listeners."""
+        self._entries.pop(user_id, None)
+        self._inflight.pop(user_id, None)
+        self.stats.invalidations += 1
+        logger.debug(
+            f"Invalidated wallet cache for {user_id} ({event.value if event else 'manual'})"
+        )
+        for listener in self._listeners:
+            try:
+                await listener(user_id, event)
+            except Exception as e:
+                logger.warning(f"Wallet invalidation listener failed for {user_id}: {str(e)}")
+
+    async def on_card_added(self, user_id: str) -> None:
+        await self.invalidate(user_id, WalletEvent.CARD_ADDED)
+
+    async def on_card_removed(self, user_id: str) -> None:
+        await self.invalidate(user_id, WalletEvent.CARD_REMOVED)
+
+    async def on_default_changed(self, user_id: str) -> None:
+        await self.invalidate(user_id, WalletEvent.DEFAULT_CHANGED)
+
+    def add_listener(self, listener: InvalidationListener) -> None:
+        """Register a callback run after each invalidation."""
+        self._listeners.append(listener)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    async def _load(self, user_id: str) -> CachedWallet:
+        self.stats.loads += 1
+        cards = await self.backend.fetch_cards(user_id)
+        return CachedWallet(trusted(PaymentMethodsResponse, cards=cards, total_count=len(cards)))
+
+    async def _fill(self, user_id: str) -> CachedWallet:
+        try:
+            wallet = await self._load(user_id)
+        except Exception:
+            self.stats.load_errors += 1
+            raise
+        # Not cached if the wallet was invalidated while loading
+        if self._inflight.get(user_id) is asyncio.current_task():
+            self._store(user_id, wallet)
+        return wallet
+
+    def _finish(self, user_id: str, task: asyncio.Task) -> None:
+        if self._inflight.get(user_id) is task:
+            del self._inflight[user_id]
+        if not task.cancelled():
+            # Mark retrieved so failures whose callers all left are not reported as unhandled
+            task.exception()
+
+    def _store(self, user_id: str, wallet: CachedWallet) -> None:
+        self._entries[user_id] = (time.monotonic() + self.ttl, wallet)
+        self._entries.move_to_end(user_id)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+            self.stats.evictions += 1
+
+def create_wallet_cache(store: WalletStore) -> WalletCache:
+    """Create a cache in front of store, invalidated by its mutations."""
+    cache = WalletCache(
+        store,
+        max_size=int(os.getenv("WALLET_CACHE_MAX_SIZE", str(DEFAULT_MAX_SIZE))),
+        ttl=float(os.getenv("WALLET_CACHE_TTL", str(DEFAULT_TTL)))
+    )
+    store.add_change_listener(cache.invalidate)
+    return cache
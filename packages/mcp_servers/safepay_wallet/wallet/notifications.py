@@ -0,0 +1,31 @@
+import os
+from typing import Optional
+import httpx
+from loguru import logger
+from wallet.cache import WalletEvent
+
+DEFAULT_TIMEOUT = 5.0
+
+class BenefitsNotifier:
+    """Tells the Benefits server to drop recommendations built from a stale wallet."""
+
+    def __init__(self, base_url: str, timeout: float = DEFAULT_TIMEOUT):
+        self.base_url = base_url.rstrip("/")
+        self._client = httpx.AsyncClient(timeout=timeout)
+
+    async def __call__(self, user_id: str, event: Optional[WalletEvent]) -> None:
+        try:
+            response = await self._client.post(
+                f"{self.base_url}/api/benefits/wallet-events/{user_id}"
+            )
+            response.raise_for_status()
+        except httpx.HTTPError as e:
+            logger.warning(f"Could not notify Benefits of wallet change for {user_id}: {str(e)}")
+
+    async def aclose(self) -> None:
+        await self._client.aclose()
+
+def create_benefits_notifier() -> Optional[BenefitsNotifier]:
+    """Notifier for BENEFITS_URL, or None when it is not set."""
+    url = os.getenv("BENEFITS_URL")
+    return BenefitsNotifier(url) if url else None
@@ -0,0 +1,245 @@
+import asyncio
+import itertools
+import os
+import sqlite3
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Callable, Iterator, List, Optional, Sequence, TypeVar
+from urllib.parse import parse_qs, urlparse
+from loguru import logger
+from shared.models.api.payment_methods import Card
+from shared.models.trusted import trusted
+from wallet.backend import demo_cards
+from wallet.store import WalletEvent, WalletStore, get_seed_user_ids, register_store_backend
+
+DEFAULT_POOL_SIZE = 8
+DEFAULT_BUSY_TIMEOUT_MS = 5000
+STATEMENT_CACHE_SIZE = 64
+
+T = TypeVar("T")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS cards (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    user_id TEXT NOT NULL,
+    card_id TEXT NOT NULL,
+    type TEXT NOT NULL,
+    last_four_digits TEXT NOT NULL,
+    expiry_month INTEGER NOT NULL,
+    expiry_year INTEGER NOT NULL,
+    cardholder_name TEXT NOT NULL,
+    is_default INTEGER NOT NULL DEFAULT 0,
+    UNIQUE (user_id, card_id)
+);
+CREATE INDEX IF NOT EXISTS idx_cards_user_id ON cards (user_id, is_default DESC, id);
+CREATE INDEX IF NOT EXISTS idx_cards_card_id ON cards (card_id);
+CREATE UNIQUE INDEX IF NOT EXISTS idx_cards_user_default ON cards (user_id) WHERE is_default = 1;
+"""
+
+# Statements are compiled once per connection and reused from its statement
+# cache, so the SQL text must stay identical between calls.
+SELECT_CARDS = (
+    "SELECT card_id, type, last_four_digits, expiry_month, expiry_year, cardholder_name, "
+    "is_default FROM cards WHERE user_id = ? ORDER BY is_default DESC, id"
+)
+SELECT_CARD = (
+    "SELECT card_id, type, last_four_digits, expiry_month, expiry_year, cardholder_name, "
+    "is_default FROM cards WHERE user_id = ? AND card_id = ?"
+)
+INSERT_CARD = (
+    "INSERT INTO cards (user_id, card_id, type, last_four_digits, expiry_month, expiry_year, "
+    "cardholder_name, is_default) VALUES (?, ?, ?, ?, ?, ?, ?, ?)"
+)
+DELETE_CARD = "DELETE FROM cards WHERE user_id = ? AND card_id = ?"
+CLEAR_DEFAULT = "UPDATE cards SET is_default = 0 WHERE user_id = ? AND is_default = 1"
+SET_DEFAULT = "UPDATE cards SET is_default = 1 WHERE user_id = ? AND card_id = ?"
+COUNT_CARDS = "SELECT COUNT(*) FROM cards"
+
+_memory_databases = itertools.count()
+
+class SQLitePool:
+    """Fixed pool of SQLite connections driven from a dedicated thread pool.
+
+    Queries run off the event loop; callers wait for a free connection
+    without holding a thread.
+    """
+
+    def __init__(
+        self,
+        database: str,
+        size: int = DEFAULT_POOL_SIZE,
+        busy_timeout_ms: int = DEFAULT_BUSY_TIMEOUT_MS
+    ):
+        self.size = size
+        self.busy_timeout_ms = busy_timeout_ms
+        self._uri = database == ":memory:"
+        # Pooled in-memory connections must share one named database
+        self.database = (
+            f"file:wallet-{next(_memory_databases)}?mode=memory&cache=shared"
+            if self._uri
+            else database
+        )
+        self._connections = [self._connect() for _ in range(size)]
+        self._idle: "asyncio.Queue[sqlite3.Connection]" = asyncio.Queue()
+        for connection in self._connections:
+            self._idle.put_nowait(connection)
+        self._executor = ThreadPoolExecutor(max_workers=size, thread_name_prefix="wallet-sqlite")
+
+    async def run(self, fn: Callable[..., T], *args: Any) -> T:
+        """Run fn(connection, *args) on a pooled connection in a worker thread."""
+        connection = await self._idle.get()
+        future = asyncio.get_running_loop().run_in_executor(self._executor, fn, connection, *args)
+        # The connection goes back only once the query finishes, even if the caller is cancelled
+        future.add_done_callback(lambda _: self._idle.put_nowait(connection))
+        return await asyncio.shield(future)
+
+    def run_sync(self, fn: Callable[..., T], *args: Any) -> T:
+        """Run fn on the first connection; only for startup before the pool is shared."""
+        return fn(self._connections[0], *args)
+
+    def close(self) -> None:
+        self._executor.shutdown(wait=True)
+        for connection in self._connections:
+            connection.close()
+
+    def _connect(self) -> sqlite3.Connection:
+        connection = sqlite3.connect(
+            self.database,
+            uri=self._uri,
+            check_same_thread=False,
+            isolation_level=None,
+            cached_statements=STATEMENT_CACHE_SIZE
+        )
+        connection.execute(f"PRAGMA busy_timeout = {int(self.busy_timeout_ms)}")
+        connection.execute("PRAGMA journal_mode = WAL")
+        connection.execute("PRAGMA synchronous = NORMAL")
+        return connection
+
+class SQLiteWalletStore(WalletStore):
+    """Wallet store on SQLite, used locally in place of the production database."""
+
+    def __init__(
+        self, database: str, pool_size: int = DEFAULT_POOL_SIZE, seed_user_ids: Sequence[str] = ()
+    ):
+        super().__init__()
+        if database != ":memory:":
+            Path(database).parent.mkdir(parents=True, exist_ok=True)
+        self.pool = SQLitePool(database, size=pool_size)
+        self.pool.run_sync(_initialize, list(seed_user_ids))
+
+    async def fetch_cards(self, user_id: str) -> List[Card]:
+        return await self.pool.run(_select_cards, user_id)
+
+    async def get_card(self, user_id: str, card_id: str) -> Optional[Card]:
+        return await self.pool.run(_select_card, user_id, card_id)
+
+    async def add_card(self, user_id: str, card: Card) -> None:
+        try:
+            await self.pool.run(_insert_card, user_id, card)
+        except sqlite3.IntegrityError:
+            raise ValueError(f"Card {card.card_id} is already in the wallet") from None
+        await self._notify(user_id, WalletEvent.CARD_ADDED)
+
+    async def remove_card(self, user_id: str, card_id: str) -> bool:
+        removed = await self.pool.run(_delete_card, user_id, card_id)
+        if removed:
+            await self._notify(user_id, WalletEvent.CARD_REMOVED)
+        return removed
+
+    async def set_default_card(self, user_id: str, card_id: str) -> bool:
+        changed = await self.pool.run(_set_default, user_id, card_id)
+        if changed:
+            await self._notify(user_id, WalletEvent.DEFAULT_CHANGED)
+        return changed
+
+    async def close(self) -> None:
+        await asyncio.get_running_loop().run_in_executor(None, self.pool.close)
+
+@contextmanager
+def _write_transaction(connection: sqlite3.Connection) -> Iterator[None]:
+    """BEGIN IMMEDIATE ... COMMIT, taking the write lock up front."""
+    connection.execute("BEGIN IMMEDIATE")
+    try:
+        yield
+    except BaseException:
+        connection.execute("ROLLBACK")
+        raise
+    connection.execute("COMMIT")
+
+def _row_to_card(row: Sequence[Any]) -> Card:
+    # Rows were validated as Cards when they were written
+    return trusted(
+        Card,
+        card_id=row[0],
+        type=row[1],
+        last_four_digits=row[2],
+        expiry_month=row[3],
+        expiry_year=row[4],
+        cardholder_name=row[5],
+        is_default=bool(row[6])
+    )
+
+def _card_params(user_id: str, card: Card) -> tuple:
+    return (
+        user_id,
+        card.card_id,
+        card.type,
+        card.last_four_digits,
+        card.expiry_month,
+        card.expiry_year,
+        card.cardholder_name,
+        int(card.is_default)
+    )
+
+def _select_cards(connection: sqlite3.Connection, user_id: str) -> List[Card]:
+    return [_row_to_card(row) for row in connection.execute(SELECT_CARDS, (user_id,))]
+
+def _select_card(connection: sqlite3.Connection, user_id: str, card_id: str) -> Optional[Card]:
+    row = connection.execute(SELECT_CARD, (user_id, card_id)).fetchone()
+    return _row_to_card(row) if row else None
+
+def _insert_card(connection: sqlite3.Connection, user_id: str, card: Card) -> None:
+    with _write_transaction(connection):
+        if card.is_default:
+            connection.execute(CLEAR_DEFAULT, (user_id,))
+        connection.execute(INSERT_CARD, _card_params(user_id, card))
+
+def _delete_card(connection: sqlite3.Connection, user_id: str, card_id: str) -> bool:
+    with _write_transaction(connection):
+        return connection.execute(DELETE_CARD, (user_id, card_id)).rowcount > 0
+
+def _set_default(connection: sqlite3.Connection, user_id: str, card_id: str) -> bool:
+    with _write_transaction(connection):
+        if connection.execute(SELECT_CARD, (user_id, card_id)).fetchone() is None:
+            return False
+        connection.execute(CLEAR_DEFAULT, (user_id,))
+        connection.execute(SET_DEFAULT, (user_id, card_id))
+        return True
+
+def _initialize(connection: sqlite3.Connection, seed_user_ids: List[str]) -> None:
+    connection.executescript(SCHEMA)
+    if not seed_user_ids:
+        return
+    # Checked under the write lock, so workers sharing the file seed it once
+    with _write_transaction(connection):
+        if connection.execute(COUNT_CARDS).fetchone()[0]:
+            return
+        connection.executemany(INSERT_CARD, [
+            _card_params(user_id, card) for user_id in seed_user_ids for card in demo_cards()
+        ])
+    logger.info(f"Seeded demo wallets for {len(seed_user_ids)} users")
+
+def _create_sqlite_store(url: str) -> SQLiteWalletStore:
+    """sqlite:///relative.db, sqlite:////absolute.db or sqlite:///:memory:, plus ?pool_size=N."""
+    parsed = urlparse(url)
+    database = parsed.path[1:]
+    if not database:
+        raise ValueError(f"Wallet database URL has no path: {url}")
+    query = parse_qs(parsed.query)
+    pool_size = int(
+        query.get("pool_size", [os.getenv("WALLET_DATABASE_POOL_SIZE", str(DEFAULT_POOL_SIZE))])[0]
+    )
+    return SQLiteWalletStore(database, pool_size=pool_size, seed_user_ids=get_seed_user_ids())
+
+register_store_backend("sqlite", _create_sqlite_store)
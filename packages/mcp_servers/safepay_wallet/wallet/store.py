@@ -0,0 +1,89 @@
+import os
+from abc import ABC, abstractmethod
+from enum import Enum
+from pathlib import Path
+from typing import Awaitable, Callable, Dict, List, Optional
+from urllib.parse import urlparse
+from loguru import logger
+from shared.models.api.payment_methods import Card
+
+DEFAULT_DATABASE_URL = f"sqlite:///{Path(__file__).resolve().parent.parent / 'data' / 'wallet.db'}"
+DEFAULT_SEED_USER_IDS = "D649217"
+
+class WalletEvent(str, Enum):
+    """Wallet changes that make a cached wallet stale."""
+    CARD_ADDED = "card_added"
+    CARD_REMOVED = "card_removed"
+    DEFAULT_CHANGED = "default_changed"
+
+ChangeListener = Callable[[str, WalletEvent], Awaitable[None]]
+StoreFactory = Callable[[str], "WalletStore"]
+
+class WalletStore(ABC):
+    """Async access to users' stored payment methods.
+
+    Mutations notify change listeners with the user and the WalletEvent.
+    """
+
+    def __init__(self):
+        self._listeners: List[ChangeListener] = []
+
+    @abstractmethod
+    async def fetch_cards(self, user_id: str) -> List[Card]:
+        """All of a user's cards, default card first."""
+
+    @abstractmethod
+    async def get_card(self, user_id: str, card_id: str) -> Optional[Card]:
+        """One of a user's cards, or None."""
+
+    @abstractmethod
+    async def add_card(self, user_id: str, card: Card) -> None:
+        """Add a card; a default card replaces the current default."""
+
+    @abstractmethod
+    async def remove_card(self, user_id: str, card_id: str) -> bool:
+        """Remove a card, returning False if the user does not have it."""
+
+    @abstractmethod
+    async def set_default_card(self, user_id: str, card_id: str) -> bool:
+        """Make a card the user's default, returning False if the user does not have it."""
+
+    @abstractmethod
+    async def close(self) -> None:
+        """Release connections held by the store."""
+
+    def add_change_listener(self, listener: ChangeListener) -> None:
+        """Register a callback run after each successful mutation."""
+        self._listeners.append(listener)
+
+    async def _notify(self, user_id: str, event: WalletEvent) -> None:
+        for listener in self._listeners:
+            try:
+                await listener(user_id, event)
+            except Exception as e:
+                logger.warning(f"Wallet change listener failed for {user_id}: {str(e)}")
+
+# Store implementations by URL scheme; production backends register here
+STORE_BACKENDS: Dict[str, StoreFactory] = {}
+
+def register_store_backend(scheme: str, factory: StoreFactory) -> None:
+    STORE_BACKENDS[scheme] = factory
+
+def create_wallet_store(url: str) -> WalletStore:
+    """Create a store from a database URL such as sqlite:///path/to/wallet.db."""
+    scheme = urlparse(url).scheme
+    factory = STORE_BACKENDS.get(scheme)
+    if factory is None:
+        raise ValueError(f"Unsupported wallet database URL scheme: {scheme or url}")
+    return factory(url)
+
+def load_wallet_store() -> WalletStore:
+    """Create the store configured by WALLET_DATABASE_URL."""
+    # Imported for its backend registration
+    import wallet.sqlite_store  # noqa: F401
+    return create_wallet_store(os.getenv("WALLET_DATABASE_URL", DEFAULT_DATABASE_URL))
+
+def get_seed_user_ids() -> List[str]:
+    """Users given the demo wallet when a store is first created."""
+    raw = os.getenv("WALLET_SEED_USER_IDS", DEFAULT_SEED_USER_IDS)
+    return [user_id.strip() for user_id in raw.split(",") if user_id.strip()]
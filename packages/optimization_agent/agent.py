@@ -1,6 +1,7 @@
 import asyncio
 import logging
-from typing import Optional, Dict, Any
+import os
+from typing import Optional, Dict, Any, List
 import requests
 from smart_sdk.tools import StdioServerParams, mcp_server_tools
 from smart_sdk.agents import SMARTLLMAgent
@@ -8,6 +9,7 @@ from smart_sdk import CancellationToken, Console
 from smart_sdk.model import AzureOpenAIChatCompletionClient
 from loguru import logger
 import sys
+from shared.tracing import configure_tracing, start_span
 from dotenv import load_dotenv
 
 # Load environment variables
@@ -94,10 +96,14 @@ async def process_user_input(agent: SMARTLLMAgent, user_input: str) -> None:
     """Process user input and generate response using the agent."""
     try:
         logger.info(f"Processing user input: {user_input}")
-        await Console(agent.run_stream(
-            task=user_input,
-            cancellation_token=CancellationToken()
-        ))
+        # One trace per turn; in-process tool calls and their server-side spans nest under it
+        with start_span("agent.turn", attributes={"turn.input_length": len(user_input)}) as span:
+            if span is not None:
+                logger.info(f"Turn trace {span.trace_id}")
+            await Console(agent.run_stream(
+                task=user_input,
+                cancellation_token=CancellationToken()
+            ))
     except Exception as e:
         logger.error(f"Error processing user input: {str(e)}", exc_info=True)
         print(f"An error occurred: {str(e)}")
@@ -124,35 +130,56 @@ async def run_conversation_loop(agent: SMARTLLMAgent) -> None:
             print("\nEnding conversation.")
             break
 
+async def connect_stdio_servers() -> List[Any]:
+    """Start each MCP server as a subprocess and collect its tools over stdio."""
+    tools = []
+    server_params = {
+        "chase_travel": StdioServerParams(command="uv", args=["run", "chase-travel-mcp"]),
+        "safepay_wallet": StdioServerParams(command="uv", args=["run", "safepay-wallet-mcp"]),
+        "benefits": StdioServerParams(command="uv", args=["run", "benefits-mcp"])
+    }
+    
+    # Try to connect to each server independently
+    for server_id, params in server_params.items():
+        try:
+            logger.info(f"Attempting to connect to {server_id} server")
+            server_tools = await mcp_server_tools(params)
+            tools.extend(server_tools)
+            logger.info(f"Successfully connected to {server_id} server")
+        except Exception as e:
+            logger.warning(f"Could not connect to {server_id} server: {str(e)}")
+            logger.info(f"Continuing without {server_id} server tools")
+    return tools
+
+async def run_agent(tools: List[Any]) -> None:
+    # After loading tools: the in-process servers install their own tracer on import
+    configure_tracing("optimization-agent")
+    if not tools:
+        logger.warning(
+            "No MCP servers were available. The agent will run with limited functionality."
+        )
+    
+    agent = create_agent(tools)
+    await run_conversation_loop(agent)
+
 async def main() -> None:
     """Main entry point for the application."""
     try:
         logger.info("Starting application")
         
-        # Initialize MCP server tools
-        tools = {}
-        server_params = {
-            "chase_travel": StdioServerParams(command="uv", args=["run", "chase-travel-mcp"]),
-            "safepay_wallet": StdioServerParams(command="uv", args=["run", "safepay-wallet-mcp"]),
-            "benefits": StdioServerParams(command="uv", args=["run", "benefits-mcp"])
-        }
-        
-        # Try to connect to each server independently
-        for server_id, params in server_params.items():
-            try:
-                logger.info(f"Attempting to connect to {server_id} server")
-                server_tools = await mcp_server_tools(params)
-                tools.update(server_tools)
-                logger.info(f"Successfully connected to {server_id} server")
-            except Exception as e:
-                logger.warning(f"Could not connect to {server_id} server: {str(e)}")
-                logger.info(f"Continuing without {server_id} server tools")
-        
-        if not tools:
-            logger.warning("No MCP servers were available. The agent will run with limited functionality.")
-        
-        agent = create_agent(tools)
-        await run_conversation_loop(agent)
+        # MCP_MODE=in_process hosts every server's tools in this process;
+        # MCP_MODE=http connects to already-running servers
+        mode = os.getenv("MCP_MODE", "stdio").lower()
+        if mode == "in_process":
+            from in_process import in_process_tools
+            async with in_process_tools() as tools:
+                await run_agent(tools)
+        elif mode == "http":
+            from http_transport import http_tools
+            async with http_tools() as tools:
+                await run_agent(tools)
+        else:
+            await run_agent(await connect_stdio_servers())
                 
     except Exception as e:
         logger.error(f"Application error: {str(e)}", exc_info=True)
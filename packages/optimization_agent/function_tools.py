@@ -0,0 +1,50 @@
+import inspect
+from typing import Annotated, Any, Awaitable, Callable, Dict, Optional
+from smart_sdk.tools import FunctionTool
+
+JSON_SCHEMA_TYPES = {
+    "string": str,
+    "integer": int,
+    "number": float,
+    "boolean": bool,
+    "array": list,
+    "object": dict
+}
+
+ToolCall = Callable[[Dict[str, Any]], Awaitable[Any]]
+
+def tool_signature(schema: Dict[str, Any]) -> inspect.Signature:
+    """Keyword-only signature from a tool's JSON schema; optional arguments default to None."""
+    required = set(schema.get("required", []))
+    parameters = []
+    for name, spec in schema.get("properties", {}).items():
+        annotation = Annotated[
+            JSON_SCHEMA_TYPES.get(spec.get("type"), Any), spec.get("description", name)
+        ]
+        if name in required:
+            parameters.append(
+                inspect.Parameter(name, inspect.Parameter.KEYWORD_ONLY, annotation=annotation)
+            )
+        else:
+            parameters.append(
+                inspect.Parameter(
+                    name,
+                    inspect.Parameter.KEYWORD_ONLY,
+                    default=None,
+                    annotation=Optional[annotation]
+                )
+            )
+    return inspect.Signature(parameters, return_annotation=Any)
+
+def create_function_tool(
+    name: str, description: str, schema: Dict[str, Any], call: ToolCall
+) -> FunctionTool:
+    """Agent tool with the arguments the schema declares, forwarding them to call as a dict."""
+
+    async def call_tool(**kwargs: Any) -> Any:
+        # Omitted optional arguments fall back to the tool's own defaults
+        return await call({key: value for key, value in kwargs.items() if value is not None})
+
+    call_tool.__name__ = name
+    call_tool.__signature__ = tool_signature(schema)
+    return FunctionTool(call_tool, name=name, description=description)
@@ -0,0 +1,163 @@
+"""Agent tools that call long-running MCP servers over HTTP.
+
+Connects to the servers in MCPConfig instead of spawning them, so many agent
+processes can share one (horizontally scaled) server fleet. One pooled
+keep-alive client serves every server; HTTP/2 is negotiated when the h2
+package is installed and the endpoint supports it (typically a TLS load
+balancer in front of the servers).
+"""
+import asyncio
+import importlib.util
+import os
+import random
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Dict, List, Optional
+import httpx
+from loguru import logger
+from smart_sdk.tools import FunctionTool
+from shared.models.config import MCPConfig
+from shared.tracing import TRACEPARENT_HEADER, SpanKind, current_traceparent, start_span
+from function_tools import create_function_tool
+
+# Proxy and overload errors; tools only read data, so repeating a call is safe
+RETRYABLE_STATUS_CODES = (502, 503, 504)
+RETRY_BASE_DELAY = 0.1
+RETRY_MAX_DELAY = 10.0
+
+class MCPTransportError(Exception):
+    """Raised when an MCP server cannot be reached or returns an unexpected response."""
+    pass
+
+class MCPToolError(Exception):
+    """Raised when a tool call returns an error response."""
+    pass
+
+def load_mcp_config() -> MCPConfig:
+    """Server URLs, timeout and retries from env, defaulting to the local servers."""
+    return MCPConfig(
+        chase_travel_url=os.getenv("CHASE_TRAVEL_URL", "http://localhost:3001"),
+        safepay_wallet_url=os.getenv("SAFEPAY_WALLET_URL", "http://localhost:3002"),
+        benefits_url=os.getenv("BENEFITS_URL", "http://localhost:3003"),
+        timeout=float(os.getenv("MCP_TIMEOUT", "30")),
+        retry_attempts=int(os.getenv("MCP_RETRY_ATTEMPTS", "3"))
+    )
+
+class MCPHTTPClient:
+    """Pooled HTTP client for the MCP servers' tool endpoints."""
+
+    def __init__(
+        self, config: MCPConfig, max_connections: int = 100, max_keepalive_connections: int = 20
+    ):
+        self.config = config
+        self.http2 = importlib.util.find_spec("h2") is not None
+        self._client = httpx.AsyncClient(
+            timeout=config.timeout,
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_keepalive_connections,
+                keepalive_expiry=60.0
+            ),
+            http2=self.http2
+        )
+
+    @property
+    def server_urls(self) -> Dict[str, str]:
+        return {
+            "chase_travel": self.config.chase_travel_url.rstrip("/"),
+            "safepay_wallet": self.config.safepay_wallet_url.rstrip("/"),
+            "benefits": self.config.benefits_url.rstrip("/")
+        }
+
+    async def list_tools(self, base_url: str) -> List[Dict[str, Any]]:
+        response = await self._request("GET", f"{base_url}/api/tools")
+        try:
+            response.raise_for_status()
+            return response.json()["tools"]
+        except (httpx.HTTPStatusError, KeyError, ValueError) as e:
+            raise MCPTransportError(f"Could not list tools at {base_url}: {str(e)}") from e
+
+    async def call_tool(self, base_url: str, tool_name: str, parameters: Dict[str, Any]) -> Any:
+        with start_span(
+            f"tools/call {tool_name}", SpanKind.CLIENT, {"server.address": base_url}
+        ) as span:
+            headers = {TRACEPARENT_HEADER: current_traceparent()} if span is not None else None
+            response = await self._request(
+                "POST", f"{base_url}/api/tools/{tool_name}", json=parameters, headers=headers
+            )
+            try:
+                body = response.json()
+                status, data, error = body["status"], body["data"], body["error"]
+            except (KeyError, TypeError, ValueError) as e:
+                raise MCPTransportError(
+                    f"Unexpected response from {tool_name} (HTTP {response.status_code})"
+                ) from e
+        if status != "success":
+            raise MCPToolError(f"{tool_name} failed: {error}")
+        return data
+
+    async def _request(self, method: str, url: str, **kwargs: Any) -> httpx.Response:
+        """Send with up to retry_attempts retries on connection failures and retryable statuses."""
+        attempts = self.config.retry_attempts + 1
+        for attempt in range(attempts):
+            last = attempt == attempts - 1
+            try:
+                response = await self._client.request(method, url, **kwargs)
+            except (httpx.ConnectError, httpx.ConnectTimeout, httpx.PoolTimeout) as e:
+                if last:
+                    raise MCPTransportError(f"Could not reach {url}: {str(e)}") from e
+                delay = _backoff(attempt)
+            else:
+                if response.status_code not in RETRYABLE_STATUS_CODES or last:
+                    return response
+                delay = _retry_after(response) or _backoff(attempt)
+            logger.warning(
+                f"Retrying {method} {url} in {delay:.2f}s (attempt {attempt + 2} of {attempts})"
+            )
+            await asyncio.sleep(delay)
+
+    async def aclose(self) -> None:
+        await self._client.aclose()
+
+def _backoff(attempt: int) -> float:
+    # Exponential with jitter, so many agents do not retry in lockstep
+    return min(RETRY_MAX_DELAY, RETRY_BASE_DELAY * 2 ** attempt) * random.uniform(0.5, 1.5)
+
+def _retry_after(response: httpx.Response) -> Optional[float]:
+    try:
+        return min(RETRY_MAX_DELAY, float(response.headers["Retry-After"]))
+    except (KeyError, ValueError):
+        return None
+
+def create_http_tool(client: MCPHTTPClient, base_url: str, tool: Dict[str, Any]) -> FunctionTool:
+    tool_name = tool["name"]
+
+    async def call(parameters: Dict[str, Any]) -> Any:
+        return await client.call_tool(base_url, tool_name, parameters)
+
+    return create_function_tool(tool_name, tool["description"], tool.get("parameters") or {}, call)
+
+@asynccontextmanager
+async def http_tools(config: Optional[MCPConfig] = None) -> AsyncIterator[List[FunctionTool]]:
+    """Connect to the running servers and yield their tools; unreachable servers are skipped."""
+    client = MCPHTTPClient(config or load_mcp_config())
+    try:
+        tools: List[FunctionTool] = []
+        seen_urls = set()
+        for server_id, base_url in client.server_urls.items():
+            # Several servers may point at one combined server
+            if base_url in seen_urls:
+                continue
+            seen_urls.add(base_url)
+            try:
+                logger.info(f"Attempting to connect to {server_id} server at {base_url}")
+                server_tools = await client.list_tools(base_url)
+                tools.extend(create_http_tool(client, base_url, tool) for tool in server_tools)
+                logger.info(
+                    f"Successfully connected to {server_id} server ({len(server_tools)} tools)"
+                )
+            except MCPTransportError as e:
+                logger.warning(f"Could not connect to {server_id} server: {str(e)}")
+                logger.info(f"Continuing without {server_id} server tools")
+        yield tools
+    finally:
+        await client.aclose()
@@ -0,0 +1,63 @@
+"""Agent tools that call the MCP servers inside the agent process.
+
+Loads the combined server (packages/mcp_servers/combined) and wraps each of
+its tools as a function tool that dispatches straight to the tool instance:
+no subprocess, no stdio or HTTP hop and no JSON encoding of arguments or
+results.
+"""
+import importlib.util
+import sys
+from contextlib import asynccontextmanager
+from pathlib import Path
+from types import ModuleType
+from typing import Any, AsyncIterator, Dict, List
+from loguru import logger
+from smart_sdk.tools import FunctionTool
+from shared.tracing import SpanKind, current_traceparent, start_span
+from function_tools import create_function_tool
+
+COMBINED_SERVER_PATH = (
+    Path(__file__).resolve().parent.parent / "mcp_servers" / "combined" / "server.py"
+)
+
+class InProcessToolError(Exception):
+    """Raised when an in-process tool call returns an error response."""
+    pass
+
+def load_combined_server() -> ModuleType:
+    module_name = "combined_server"
+    if module_name in sys.modules:
+        return sys.modules[module_name]
+    spec = importlib.util.spec_from_file_location(module_name, COMBINED_SERVER_PATH)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[module_name] = module
+    spec.loader.exec_module(module)
+    return module
+
+def create_in_process_tool(runtime: Any, tool: Any) -> FunctionTool:
+    """Wrap one tool instance with the arguments its JSON schema declares."""
+    tool_name = tool.name
+
+    async def call(parameters: Dict[str, Any]) -> Any:
+        with start_span(f"tools/call {tool_name}", SpanKind.CLIENT) as span:
+            if span is not None:
+                # Same MCP request metadata a remote server would receive
+                parameters["_meta"] = {"traceparent": current_traceparent()}
+            response = await runtime.dispatch(tool_name, parameters)
+        if response.status != "success":
+            raise InProcessToolError(f"{tool_name} failed: {response.error}")
+        return response.data
+
+    return create_function_tool(tool_name, tool.description, tool.parameters, call)
+
+@asynccontextmanager
+async def in_process_tools() -> AsyncIterator[List[FunctionTool]]:
+    """Start every server's runtime in this process and yield its tools."""
+    runtime = load_combined_server().runtime
+    await runtime.startup()
+    try:
+        tools = [create_in_process_tool(runtime, tool) for tool in runtime.tools.values()]
+        logger.info(f"Loaded {len(tools)} in-process tools")
+        yield tools
+    finally:
+        await runtime.shutdown()
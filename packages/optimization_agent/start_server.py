@@ -1,9 +1,27 @@
+"""Start, supervise and stop the MCP servers.
+
+    python start_server.py start                 # every server, in the foreground
+    python start_server.py start benefits        # just one
+    python start_server.py stop                  # from another terminal
+    python start_server.py status
+
+`start` launches the servers concurrently and polls each one's /health until
+it reports ready, logging per-server time-to-ready. Servers that exit with
+an error are restarted with exponential backoff. SIGINT/SIGTERM send
+SIGTERM to every server's process group (workers included) so in-flight
+requests drain before the supervisor exits. Pidfiles in MCP_RUN_DIR
+(default run/) let `stop` and `status` find the supervisor and servers.
+"""
 import argparse
-import json
-import subprocess
-import sys
+import asyncio
 import os
+import signal
+import sys
+import time
+from dataclasses import dataclass, field
 from pathlib import Path
+from typing import Dict, List, Optional
+import httpx
 from loguru import logger
 
 # Configure logging
@@ -14,6 +32,10 @@ logger.add(
     level="INFO"
 )
 
+ROOT = Path(__file__).resolve().parent.parent.parent
+RUN_DIR = Path(os.getenv("MCP_RUN_DIR", "run"))
+SUPERVISOR = "supervisor"
+
 # MCP Server Configuration
 MCP_SERVERS = {
     "chase_travel": {
@@ -30,69 +52,309 @@ MCP_SERVERS = {
     }
 }
 
-def create_uv_config(server_name: str) -> None:
-    """Create UV configuration for a single server."""
-    if server_name not in MCP_SERVERS:
-        raise ValueError(f"Unknown server: {server_name}. Available servers: {', '.join(MCP_SERVERS.keys())}")
-    
-    config = {
-        "servers": [
-            {
-                "name": server_name,
-                "command": "python",
-                "args": [MCP_SERVERS[server_name]["path"]],
-                "env": {
-                    "PORT": str(MCP_SERVERS[server_name]["port"])
-                }
-            }
-        ]
-    }
-    
-    config_path = Path("uv.json")
-    with open(config_path, "w") as f:
-        json.dump(config, f, indent=2)
-    logger.info(f"Created UV configuration for {server_name}")
-
-def start_server(server_name: str) -> None:
-    """Start a single MCP server using UV."""
+HEALTH_INTERVAL = 0.1
+RESTART_BASE_DELAY = 1.0
+RESTART_MAX_DELAY = 60.0
+# A server up this long has recovered; its next crash starts the backoff over
+STABLE_AFTER = 60.0
+# Longer than the servers' default graceful shutdown (SERVER_GRACEFUL_TIMEOUT, 30s)
+DRAIN_TIMEOUT = 35.0
+
+@dataclass
+class ManagedServer:
+    """One supervised server process and its restart state."""
+    name: str
+    port: int
+    path: Path
+    process: Optional[asyncio.subprocess.Process] = None
+    restarts: int = 0
+    ready: asyncio.Event = field(default_factory=asyncio.Event)
+    time_to_ready: Optional[float] = None
+
+    @property
+    def health_url(self) -> str:
+        return f"http://127.0.0.1:{self.port}/health"
+
+def pidfile(name: str) -> Path:
+    return RUN_DIR / f"{name}.pid"
+
+def write_pidfile(name: str, pid: int) -> None:
+    RUN_DIR.mkdir(parents=True, exist_ok=True)
+    pidfile(name).write_text(str(pid))
+
+def read_pidfile(name: str) -> Optional[int]:
+    """Pid recorded for name if that process is still running; stale pidfiles are removed."""
+    path = pidfile(name)
     try:
-        create_uv_config(server_name)
-        # Use uv run instead of uv start
-        subprocess.run(["uv", "run", server_name], check=True)
-        logger.info(f"Successfully started {server_name} server")
-    except subprocess.CalledProcessError as e:
-        logger.error(f"Failed to start {server_name} server: {str(e)}")
-        raise
-
-def stop_server(server_name: str) -> None:
-    """Stop a running MCP server using UV."""
+        pid = int(path.read_text().strip())
+        os.kill(pid, 0)
+        return pid
+    except (FileNotFoundError, ValueError):
+        return None
+    except ProcessLookupError:
+        path.unlink(missing_ok=True)
+        return None
+    except PermissionError:
+        return pid
+
+def signal_group(pid: int, sig: signal.Signals) -> None:
+    """Signal a server's whole process group (it leads its own session), workers included."""
     try:
-        # Use uv kill instead of uv stop
-        subprocess.run(["uv", "kill", server_name], check=True)
-        logger.info(f"Successfully stopped {server_name} server")
-    except subprocess.CalledProcessError as e:
-        logger.error(f"Failed to stop {server_name} server: {str(e)}")
-        raise
+        os.killpg(pid, sig)
+    except ProcessLookupError:
+        pass
+
+class Supervisor:
+    """Runs the servers concurrently, gates on /health and restarts crashed servers."""
+
+    def __init__(
+        self,
+        names: List[str],
+        use_uv: bool = False,
+        startup_timeout: float = 60.0,
+        max_restarts: int = 10
+    ):
+        self.servers = [
+            ManagedServer(name, MCP_SERVERS[name]["port"], ROOT / MCP_SERVERS[name]["path"])
+            for name in names
+        ]
+        self.use_uv = use_uv
+        self.startup_timeout = startup_timeout
+        self.max_restarts = max_restarts
+        self._stopping = asyncio.Event()
+
+    async def run(self) -> int:
+        loop = asyncio.get_running_loop()
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            loop.add_signal_handler(sig, self.stop, sig)
+        write_pidfile(SUPERVISOR, os.getpid())
+        started = time.monotonic()
+        try:
+            async with httpx.AsyncClient(timeout=1.0) as client:
+                supervisors = [
+                    asyncio.create_task(self.supervise(server, client)) for server in self.servers
+                ]
+                report = asyncio.create_task(self.report_ready(started))
+                await asyncio.gather(*supervisors)
+                report.cancel()
+        finally:
+            pidfile(SUPERVISOR).unlink(missing_ok=True)
+        if self._stopping.is_set():
+            return 0
+        # Every server has exited on its own; fail if any of them crashed
+        crashed = any(
+            server.process is not None and server.process.returncode != 0 for server in self.servers
+        )
+        return 1 if crashed else 0
+
+    def stop(self, sig: signal.Signals = signal.SIGTERM) -> None:
+        """Ask every server to drain; a second signal kills them."""
+        if self._stopping.is_set():
+            logger.warning("Second signal received; killing servers")
+            for server in self.servers:
+                self._send(server, signal.SIGKILL)
+            return
+        logger.info(f"Received {signal.Signals(sig).name}; draining servers")
+        self._stopping.set()
+        # SIGTERM even for Ctrl-C: workers may also get the signal from their parent,
+        # and uvicorn treats a repeated SIGINT as a forced exit
+        for server in self.servers:
+            self._send(server, signal.SIGTERM)
+
+    async def report_ready(self, started: float) -> None:
+        await asyncio.gather(*(server.ready.wait() for server in self.servers))
+        slowest = max(self.servers, key=lambda server: server.time_to_ready)
+        logger.info(
+            f"All servers ready in {time.monotonic() - started:.2f}s (slowest: {slowest.name})"
+        )
+
+    async def supervise(self, server: ManagedServer, client: httpx.AsyncClient) -> None:
+        attempt = 0
+        while not self._stopping.is_set():
+            started = time.monotonic()
+            await self._spawn(server)
+            if self._stopping.is_set():
+                # Stopped while this server was being spawned
+                self._send(server, signal.SIGTERM)
+            if not await self._wait_ready(server, client, started):
+                if server.process.returncode is None:
+                    logger.error(
+                        f"{server.name} was not ready after {self.startup_timeout}s; restarting it"
+                    )
+                    self._send(server, signal.SIGKILL)
+            code = await server.process.wait()
+            # Reloader and multi-worker children would otherwise keep the port
+            signal_group(server.process.pid, signal.SIGKILL)
+            pidfile(server.name).unlink(missing_ok=True)
+            if self._stopping.is_set():
+                logger.info(f"{server.name} stopped (exit code {code})")
+                return
+            if code == 0:
+                logger.info(f"{server.name} exited cleanly; not restarting it")
+                return
+            attempt = 1 if time.monotonic() - started >= STABLE_AFTER else attempt + 1
+            if attempt > self.max_restarts:
+                logger.error(
+                    f"{server.name} crashed {attempt} times in a row (exit code {code}); giving up"
+                )
+                return
+            delay = min(RESTART_MAX_DELAY, RESTART_BASE_DELAY * 2 ** (attempt - 1))
+            logger.warning(f"{server.name} exited with code {code}; restarting in {delay:.1f}s")
+            try:
+                await asyncio.wait_for(self._stopping.wait(), timeout=delay)
+            except asyncio.TimeoutError:
+                server.restarts += 1
+
+    async def _spawn(self, server: ManagedServer) -> None:
+        command = (
+            ["uv", "run", "python", server.path.name]
+            if self.use_uv
+            else [sys.executable, server.path.name]
+        )
+        # A session of its own, so a terminal Ctrl-C reaches servers once, via the supervisor
+        server.process = await asyncio.create_subprocess_exec(
+            *command,
+            cwd=server.path.parent,
+            env={**os.environ, "PORT": str(server.port)},
+            start_new_session=True
+        )
+        write_pidfile(server.name, server.process.pid)
+        logger.info(f"Started {server.name} on port {server.port} (pid {server.process.pid})")
+
+    async def _wait_ready(
+        self, server: ManagedServer, client: httpx.AsyncClient, started: float
+    ) -> bool:
+        """Poll /health until it returns 200; False if the server exits or times out first."""
+        deadline = started + self.startup_timeout
+        while (
+            time.monotonic() < deadline
+            and server.process.returncode is None
+            and not self._stopping.is_set()
+        ):
+            try:
+                if (await client.get(server.health_url)).status_code == 200:
+                    elapsed = time.monotonic() - started
+                    if not server.ready.is_set():
+                        server.time_to_ready = elapsed
+                        server.ready.set()
+                    logger.info(
+                        f"{server.name} ready in {elapsed:.2f}s"
+                        + (f" (restart {server.restarts})" if server.restarts else "")
+                    )
+                    return True
+            except httpx.TransportError:
+                pass
+            await asyncio.sleep(HEALTH_INTERVAL)
+        return False
+
+    def _send(self, server: ManagedServer, sig: signal.Signals) -> None:
+        if server.process is not None and server.process.returncode is None:
+            signal_group(server.process.pid, sig)
+
+def start_servers(names: List[str], use_uv: bool, startup_timeout: float, max_restarts: int) -> int:
+    running = read_pidfile(SUPERVISOR)
+    if running is not None:
+        logger.error(f"A supervisor is already running (pid {running}); stop it first")
+        return 1
+    supervisor = Supervisor(
+        names, use_uv=use_uv, startup_timeout=startup_timeout, max_restarts=max_restarts
+    )
+    return asyncio.run(supervisor.run())
+
+def stop_servers(names: List[str], timeout: float = DRAIN_TIMEOUT) -> int:
+    """SIGTERM the supervisor (which drains every server), or the named servers only.
+
+    A server stopped on its own exits cleanly and is not restarted.
+    """
+    targets = [SUPERVISOR] if not names and read_pidfile(SUPERVISOR) else names or list(MCP_SERVERS)
+    pids: Dict[str, int] = {
+        name: pid for name in targets if (pid := read_pidfile(name)) is not None
+    }
+    if not pids:
+        logger.info("No servers running")
+        return 0
+    for name, pid in pids.items():
+        if name == SUPERVISOR:
+            os.kill(pid, signal.SIGTERM)
+        else:
+            signal_group(pid, signal.SIGTERM)
+        logger.info(f"Sent SIGTERM to {name} (pid {pid})")
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if all(read_pidfile(name) is None for name in pids):
+            logger.info("Stopped")
+            return 0
+        time.sleep(0.2)
+    running = [name for name in pids if read_pidfile(name) is not None]
+    logger.error(f"Still running after {timeout:.0f}s: {', '.join(running)}")
+    return 1
+
+def server_status(names: List[str]) -> int:
+    supervisor = read_pidfile(SUPERVISOR)
+    print(f"{SUPERVISOR:<16}{f'running (pid {supervisor})' if supervisor else 'not running'}")
+    with httpx.Client(timeout=1.0) as client:
+        for name in names:
+            pid = read_pidfile(name)
+            try:
+                health = (
+                    client.get(f"http://127.0.0.1:{MCP_SERVERS[name]['port']}/health")
+                    .json()
+                    .get("status", "unknown")
+                )
+            except (httpx.TransportError, ValueError):
+                health = "unreachable"
+            print(f"{name:<16}{'pid ' + str(pid) if pid else 'no pid':<14}{health}")
+    return 0
 
 def main():
-    parser = argparse.ArgumentParser(description="Manage MCP servers using UV")
+    parser = argparse.ArgumentParser(description="Manage the MCP servers")
     parser.add_argument(
         "action",
-        choices=["start", "stop"],
-        help="Action to perform (start or stop)"
+        choices=["start", "stop", "status"],
+        help=(
+            "start supervises the servers in the foreground; "
+            "stop and status act on a running supervisor"
+        )
+    )
+    parser.add_argument(
+        "servers",
+        nargs="*",
+        help=f"Servers to manage: {', '.join(MCP_SERVERS.keys())} (default: all)"
+    )
+    parser.add_argument(
+        "--uv",
+        action="store_true",
+        help="Run each server with `uv run` in its own project environment"
     )
     parser.add_argument(
-        "server",
-        choices=list(MCP_SERVERS.keys()),
-        help="Name of the server to manage"
+        "--startup-timeout", type=float, default=60.0, help="Seconds a server has to report healthy"
     )
-    
+    parser.add_argument(
+        "--max-restarts",
+        type=int,
+        default=10,
+        help="Consecutive crashes before a server is given up on"
+    )
+
     args = parser.parse_args()
-    
+    names = list(dict.fromkeys(args.servers))
+    unknown = [name for name in names if name not in MCP_SERVERS]
+    if unknown:
+        parser.error(
+            f"Unknown server: {', '.join(unknown)}. "
+            f"Available servers: {', '.join(MCP_SERVERS.keys())}"
+        )
+
     if args.action == "start":
-        start_server(args.server)
+        sys.exit(
+            start_servers(
+                names or list(MCP_SERVERS), args.uv, args.startup_timeout, args.max_restarts
+            )
+        )
+    elif args.action == "stop":
+        sys.exit(stop_servers(names))
     else:
-        stop_server(args.server)
+        sys.exit(server_status(names or list(MCP_SERVERS)))
 
 if __name__ == "__main__":
-    main() 
\ No newline at end of file
+    main()
@@ -1,21 +1,52 @@
-from .flight_search import (
-    router as flight_search_router,
-    FlightSearchRequest,
-    FlightSearchResponse,
-    ErrorResponse as FlightSearchErrorResponse
-)
-
-from .payment_methods import (
-    router as payment_methods_router,
-    PaymentMethodsResponse,
-    ErrorResponse as PaymentMethodsErrorResponse
-)
-
-from .travel_benefits import (
-    router as benefits_router,
-    BenefitsResponse,
-    ErrorResponse as BenefitsErrorResponse
-)
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+# Names are imported on first access, so using one model does not import the
+# others or FastAPI; the routers live in .routers and are the only FastAPI users
+_EXPORTS = {
+    # Flight Search
+    'flight_search_router': ('.routers.flight_search', 'router'),
+    'FlightSearchRequest': ('.flight_search', 'FlightSearchRequest'),
+    'FlightSearchResponse': ('.flight_search', 'FlightSearchResponse'),
+    'FlightSearchErrorResponse': ('.flight_search', 'ErrorResponse'),
+
+    # Payment Methods
+    'payment_methods_router': ('.routers.payment_methods', 'router'),
+    'PaymentMethodsResponse': ('.payment_methods', 'PaymentMethodsResponse'),
+    'PaymentMethodsErrorResponse': ('.payment_methods', 'ErrorResponse'),
+
+    # Travel Benefits
+    'benefits_router': ('.routers.travel_benefits', 'router'),
+    'BenefitsResponse': ('.travel_benefits', 'BenefitsResponse'),
+    'BenefitsErrorResponse': ('.travel_benefits', 'ErrorResponse'),
+}
+
+if TYPE_CHECKING:
+    from .flight_search import (
+        FlightSearchRequest,
+        FlightSearchResponse,
+        ErrorResponse as FlightSearchErrorResponse
+    )
+    from .payment_methods import (
+        PaymentMethodsResponse,
+        ErrorResponse as PaymentMethodsErrorResponse
+    )
+    from .travel_benefits import BenefitsResponse, ErrorResponse as BenefitsErrorResponse
+    from .routers.flight_search import router as flight_search_router
+    from .routers.payment_methods import router as payment_methods_router
+    from .routers.travel_benefits import router as benefits_router
+
+def __getattr__(name: str) -> Any:
+    try:
+        module, attribute = _EXPORTS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(import_module(module, __name__), attribute)
+    globals()[name] = value
+    return value
+
+def __dir__() -> list:
+    return sorted(list(globals()) + list(_EXPORTS))
 
 __all__ = [
     # Flight Search
@@ -23,12 +54,12 @@ __all__ = [
     'FlightSearchRequest',
     'FlightSearchResponse',
     'FlightSearchErrorResponse',
-    
+
     # Payment Methods
     'payment_methods_router',
     'PaymentMethodsResponse',
     'PaymentMethodsErrorResponse',
-    
+
     # Travel Benefits
     'benefits_router',
     'BenefitsResponse',
@@ -0,0 +1,9 @@
+from .flight_search import router as flight_search_router
+from .payment_methods import router as payment_methods_router
+from .travel_benefits import router as benefits_router
+
+__all__ = [
+    'flight_search_router',
+    'payment_methods_router',
+    'benefits_router',
+]
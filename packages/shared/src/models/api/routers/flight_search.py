@@ -0,0 +1,42 @@
+from fastapi import APIRouter, HTTPException, status
+from ..flight_search import FlightSearchRequest, FlightSearchResponse, ErrorResponse
+
+# Router
+router = APIRouter(
+    prefix="/api/flights",
+    tags=["flights"],
+    responses={
+        status.HTTP_400_BAD_REQUEST: {
+            "model": ErrorResponse,
+            "description": "Invalid request parameters"
+        },
+        status.HTTP_404_NOT_FOUND: {"model": ErrorResponse, "description": "No flights found"},
+        status.HTTP_500_INTERNAL_SERVER_ERROR: {
+            "model": ErrorResponse,
+            "description": "Internal server error"
+        }
+    }
+)
+
+@router.post(
+    "/search",
+    response_model=FlightSearchResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Search for available flights",
+    description="Search for flights based on origin, destination, dates, and passenger information"
+)
+async def search_flights(request: FlightSearchRequest) -> FlightSearchResponse:
+    """
+    Search for available flights with the following parameters:
+    
+    - **origin**: Origin airport IATA code (3 characters)
+    - **destination**: Destination airport IATA code (3 characters)
+    - **departure_date**: Flight departure date
+    - **passengers**: Number of passengers by type (adults, children, infants)
+    - **return_date**: Optional return flight date for round trips
+    - **cabin_class**: Optional cabin class preference
+    
+    Returns a list of available flights matching the search criteria.
+    """
+    # Implementation will be added in the actual service
+    pass 
\ No newline at end of file
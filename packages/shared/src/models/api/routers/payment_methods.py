@@ -0,0 +1,42 @@
+from fastapi import APIRouter, HTTPException, status, Header
+from ..payment_methods import PaymentMethodsResponse, ErrorResponse
+
+# Router
+router = APIRouter(
+    prefix="/api/wallet",
+    tags=["wallet"],
+    responses={
+        status.HTTP_401_UNAUTHORIZED: {
+            "model": ErrorResponse,
+            "description": "Unauthorized access"
+        },
+        status.HTTP_404_NOT_FOUND: {
+            "model": ErrorResponse,
+            "description": "No payment methods found"
+        },
+        status.HTTP_500_INTERNAL_SERVER_ERROR: {
+            "model": ErrorResponse,
+            "description": "Internal server error"
+        }
+    }
+)
+
+@router.get(
+    "/payment-methods",
+    response_model=PaymentMethodsResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Get user's payment methods",
+    description="Retrieve all payment methods associated with the user"
+)
+async def get_payment_methods(
+    user_id: str = Header(..., description="User ID for authentication")
+) -> PaymentMethodsResponse:
+    """
+    Get all payment methods for a user.
+    
+    - **user_id**: User ID in request header for authentication
+    
+    Returns a list of payment methods associated with the user.
+    """
+    # Implementation will be added in the actual service
+    pass 
\ No newline at end of file
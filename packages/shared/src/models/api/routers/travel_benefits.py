@@ -0,0 +1,35 @@
+from fastapi import APIRouter, HTTPException, status, Path
+from ..travel_benefits import BenefitsResponse, ErrorResponse
+
+# Router
+router = APIRouter(
+    prefix="/api/benefits",
+    tags=["benefits"],
+    responses={
+        status.HTTP_404_NOT_FOUND: {"model": ErrorResponse, "description": "Card not found"},
+        status.HTTP_500_INTERNAL_SERVER_ERROR: {
+            "model": ErrorResponse,
+            "description": "Internal server error"
+        }
+    }
+)
+
+@router.get(
+    "/cards/{card_id}",
+    response_model=BenefitsResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Get card benefits",
+    description="Retrieve benefits and multipliers for a specific card"
+)
+async def get_card_benefits(
+    card_id: str = Path(..., description="Card identifier")
+) -> BenefitsResponse:
+    """
+    Get benefits and multipliers for a specific card.
+    
+    - **card_id**: Card identifier in the URL path
+    
+    Returns the card's benefits, multipliers, and other relevant information.
+    """
+    # Implementation will be added in the actual service
+    pass 
\ No newline at end of file
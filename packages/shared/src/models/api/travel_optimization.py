@@ -1,6 +1,7 @@
 from datetime import datetime
 from typing import List, Dict, Any
 from pydantic import BaseModel, Field, ConfigDict
+from ..domain.optimization_entities import Recommendation
 
 class OptimizationRequest(BaseModel):
     """Request model for travel optimization."""
@@ -9,6 +10,7 @@ class OptimizationRequest(BaseModel):
     preferences: dict = Field(..., description="User preferences for optimization")
     
     model_config = ConfigDict(
+        defer_build=True,
         json_schema_extra={
             "example": {
                 "flight_search_id": "search_123",
@@ -24,11 +26,14 @@ class OptimizationRequest(BaseModel):
 
 class OptimizationResponse(BaseModel):
     """Response model for optimization results."""
-    recommendations: List["Recommendation"] = Field(..., description="List of optimization recommendations")
+    recommendations: List[Recommendation] = Field(
+        ..., description="List of optimization recommendations"
+    )
     optimization_id: str = Field(..., description="Unique identifier for this optimization")
     created_at: datetime = Field(..., description="Timestamp of optimization creation")
     
     model_config = ConfigDict(
+        defer_build=True,
         json_schema_extra={
             "example": {
                 "recommendations": [],
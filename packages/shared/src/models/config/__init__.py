@@ -1,9 +1,15 @@
 from .environment import EnvironmentConfig
 from .mcp import MCPConfig
+from .server import ServerConfig
+from .admission import AdmissionConfig
+from .compression import CompressionConfig
 from .app import AppConfig
 
 __all__ = [
     'EnvironmentConfig',
     'MCPConfig',
+    'ServerConfig',
+    'AdmissionConfig',
+    'CompressionConfig',
     'AppConfig',
 ]
@@ -0,0 +1,59 @@
+from typing import Dict
+from pydantic import BaseModel, Field, ConfigDict, model_validator
+
+class AdmissionConfig(BaseModel):
+    """Model representing per-tool admission control in an MCP server process."""
+    enabled: bool = Field(True, description="Whether tool calls are admission controlled")
+    max_concurrency: int = Field(64, ge=1, description="Default concurrent executions per tool")
+    tool_concurrency: Dict[str, int] = Field(
+        default_factory=dict, description="Per-tool overrides of max_concurrency"
+    )
+    max_queue: int = Field(
+        256, ge=0, description="Calls per tool and priority class allowed to wait for a slot"
+    )
+    max_wait: float = Field(
+        1.0, gt=0, description="Seconds a call may wait for a slot before it is rejected"
+    )
+    shed_delay: float = Field(
+        0.25, gt=0, description="Queueing delay after which new calls are rejected immediately"
+    )
+    priority_weights: Dict[str, float] = Field(
+        default_factory=lambda: {"interactive": 8.0, "batch": 1.0},
+        description="Share of freed slots each priority class receives while several are waiting"
+    )
+    default_priority: str = Field(
+        "interactive", description="Priority class of calls that do not declare one"
+    )
+    user_rate: float = Field(
+        20.0, ge=0, description="Calls per second each user may start per server; 0 disables"
+    )
+    user_burst: int = Field(
+        40, ge=1, description="Calls a user may start at once before user_rate applies"
+    )
+
+    model_config = ConfigDict(
+        json_schema_extra={
+            "example": {
+                "enabled": True,
+                "max_concurrency": 64,
+                "tool_concurrency": {"get_payment_methods_bulk": 8},
+                "max_queue": 256,
+                "max_wait": 1.0,
+                "shed_delay": 0.25,
+                "priority_weights": {"interactive": 8.0, "batch": 1.0},
+                "default_priority": "interactive",
+                "user_rate": 20.0,
+                "user_burst": 40
+            }
+        }
+    )
+
+    @model_validator(mode="after")
+    def validate_priorities(self) -> "AdmissionConfig":
+        if not self.priority_weights or any(
+            weight <= 0 for weight in self.priority_weights.values()
+        ):
+            raise ValueError("priority_weights must map at least one class to a positive weight")
+        if self.default_priority not in self.priority_weights:
+            raise ValueError(f"default_priority {self.default_priority} is not in priority_weights")
+        return self
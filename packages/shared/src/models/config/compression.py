@@ -0,0 +1,44 @@
+from typing import List
+from pydantic import BaseModel, Field, ConfigDict, field_validator
+
+SUPPORTED_ENCODINGS = ("zstd", "gzip")
+
+class CompressionConfig(BaseModel):
+    """Model representing HTTP response compression in an MCP server process."""
+    enabled: bool = Field(
+        True, description="Whether responses are compressed for clients that accept it"
+    )
+    minimum_size: int = Field(
+        1024,
+        ge=0,
+        description="Complete responses smaller than this many bytes are sent uncompressed"
+    )
+    encodings: List[str] = Field(
+        default_factory=lambda: list(SUPPORTED_ENCODINGS),
+        description="Content codings in server preference order; zstd needs the zstandard package"
+    )
+    gzip_level: int = Field(1, ge=1, le=9, description="gzip compression level")
+    zstd_level: int = Field(3, ge=1, le=22, description="zstd compression level")
+
+    model_config = ConfigDict(
+        json_schema_extra={
+            "example": {
+                "enabled": True,
+                "minimum_size": 1024,
+                "encodings": ["zstd", "gzip"],
+                "gzip_level": 1,
+                "zstd_level": 3
+            }
+        }
+    )
+
+    @field_validator("encodings")
+    @classmethod
+    def validate_encodings(cls, encodings: List[str]) -> List[str]:
+        encodings = [encoding.strip().lower() for encoding in encodings]
+        unsupported = [encoding for encoding in encodings if encoding not in SUPPORTED_ENCODINGS]
+        if unsupported:
+            raise ValueError(
+                f"Unsupported encodings {unsupported}; expected any of {list(SUPPORTED_ENCODINGS)}"
+            )
+        return encodings
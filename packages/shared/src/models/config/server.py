@@ -0,0 +1,46 @@
+from typing import Literal, Optional
+from pydantic import BaseModel, Field, ConfigDict
+
+class ServerConfig(BaseModel):
+    """Model representing how an MCP server process is served."""
+    host: str = Field("0.0.0.0", description="Interface to bind")
+    port: int = Field(..., ge=1, le=65535, description="Port to bind")
+    workers: int = Field(1, ge=1, description="Number of worker processes")
+    reload: bool = Field(
+        False, description="Restart on source changes (development only, single worker)"
+    )
+    loop: Literal["auto", "asyncio", "uvloop"] = Field(
+        "auto", description="Event loop; auto uses uvloop when installed"
+    )
+    http: Literal["auto", "h11", "httptools"] = Field(
+        "auto", description="HTTP parser; auto uses httptools when installed"
+    )
+    timeout_keep_alive: int = Field(
+        5, ge=0, description="Seconds to hold idle keep-alive connections open"
+    )
+    timeout_graceful_shutdown: Optional[int] = Field(
+        30, ge=0, description="Seconds to drain in-flight requests on shutdown"
+    )
+    backlog: int = Field(2048, ge=1, description="Maximum pending connections")
+    limit_concurrency: Optional[int] = Field(
+        None, ge=1, description="Maximum concurrent connections per worker before 503s"
+    )
+    access_log: bool = Field(True, description="Whether to log every request")
+
+    model_config = ConfigDict(
+        json_schema_extra={
+            "example": {
+                "host": "0.0.0.0",
+                "port": 3001,
+                "workers": 4,
+                "reload": False,
+                "loop": "auto",
+                "http": "auto",
+                "timeout_keep_alive": 75,
+                "timeout_graceful_shutdown": 30,
+                "backlog": 2048,
+                "limit_concurrency": None,
+                "access_log": False
+            }
+        }
+    )
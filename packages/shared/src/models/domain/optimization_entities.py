@@ -1,13 +1,16 @@
 from datetime import datetime
 from typing import List, Dict, Any
 from pydantic import BaseModel, Field, ConfigDict
+from .benefit_entities import Benefit
+from .flight_entities import Flight
+from .payment_entities import PaymentMethod
 
 class Recommendation(BaseModel):
     """Model representing an optimization recommendation."""
     id: str = Field(..., description="Recommendation identifier")
-    flight: "Flight" = Field(..., description="Recommended flight")
-    payment_method: "PaymentMethod" = Field(..., description="Recommended payment method")
-    benefits: List["Benefit"] = Field(..., description="Applicable benefits")
+    flight: Flight = Field(..., description="Recommended flight")
+    payment_method: PaymentMethod = Field(..., description="Recommended payment method")
+    benefits: List[Benefit] = Field(..., description="Applicable benefits")
     total_savings: float = Field(..., description="Total savings amount")
     currency: str = Field("USD", description="Currency for savings")
     explanation: str = Field(..., description="Explanation of the recommendation")
@@ -0,0 +1,68 @@
+import os
+from typing import Any, Dict, Optional, Tuple, Type, TypeVar
+from pydantic import BaseModel
+from pydantic.fields import FieldInfo
+
+Model = TypeVar("Model", bound=BaseModel)
+
+# Resolved on first use, after the server has loaded its .env
+_validate: Optional[bool] = None
+
+# Per model class: its optional fields, or None if it needs model_construct
+_optional_fields: Dict[type, Optional[Tuple[Tuple[str, FieldInfo], ...]]] = {}
+
+_new = object.__new__
+_setattr = object.__setattr__
+
+def trusted_validation_enabled() -> bool:
+    """Whether trusted() fully validates; VALIDATE_TRUSTED_MODELS, defaulting to DEBUG."""
+    global _validate
+    if _validate is None:
+        value = os.getenv("VALIDATE_TRUSTED_MODELS", os.getenv("DEBUG", "false"))
+        _validate = value.lower() in ("1", "true", "yes")
+    return _validate
+
+def set_trusted_validation(enabled: bool) -> None:
+    global _validate
+    _validate = enabled
+
+def trusted(model: Type[Model], **fields: Any) -> Model:
+    """Build a model from data validated when it entered the system (request, ingest or store).
+
+    Skips validation, so constraints (lengths, bounds, min_items) are not
+    re-checked on every request. Nested models must be passed as instances,
+    built with trusted() themselves. In debug mode the fields are fully
+    validated instead, so code that builds invalid data fails with a
+    ValidationError.
+    """
+    if trusted_validation_enabled():
+        return model.model_validate(fields)
+    try:
+        optional_fields = _optional_fields[model]
+    except KeyError:
+        optional_fields = _optional_fields[model] = _lean_fields(model)
+    if optional_fields is None:
+        return model.model_construct(**fields)
+    # What model_construct does for these plain models, without its alias and
+    # extra handling, which makes it slower than validating in pydantic-core
+    fields_set = set(fields)
+    for name, field in optional_fields:
+        if name not in fields:
+            fields[name] = field.get_default(call_default_factory=True)
+    instance = _new(model)
+    _setattr(instance, "__dict__", fields)
+    _setattr(instance, "__pydantic_fields_set__", fields_set)
+    _setattr(instance, "__pydantic_extra__", None)
+    _setattr(instance, "__pydantic_private__", None)
+    return instance
+
+def _lean_fields(model: Type[BaseModel]) -> Optional[Tuple[Tuple[str, FieldInfo], ...]]:
+    if (
+        model.__private_attributes__
+        or model.__pydantic_post_init__
+        or model.model_config.get("extra") == "allow"
+    ):
+        return None
+    return tuple(
+        (name, field) for name, field in model.model_fields.items() if not field.is_required()
+    )
@@ -0,0 +1,91 @@
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+# Names are imported on first access, so a tool that only needs RawJSON does
+# not import FastAPI (routes) or MCP (runtime)
+_EXPORTS = {
+    'load_admission_config': '.launch',
+    'load_compression_config': '.launch',
+    'load_environment_config': '.launch',
+    'load_server_config': '.launch',
+    'run_server': '.launch',
+    'ServerRuntime': '.runtime',
+    'RuntimeGroup': '.runtime',
+    'create_tool_router': '.routes',
+    'create_metrics_router': '.routes',
+    'health_response': '.routes',
+    'ArgumentValidator': '.arguments',
+    'InvalidArgumentsError': '.arguments',
+    'compile_validator': '.arguments',
+    'AdmissionController': '.admission',
+    'OverloadedError': '.admission',
+    'RateLimitedError': '.admission',
+    'RequestIdentityMiddleware': '.identity',
+    'CompressionMiddleware': '.compression',
+    'current_user': '.identity',
+    'current_priority': '.identity',
+    'ToolMetrics': '.metrics',
+    'render_metrics': '.metrics',
+    'RawJSON': '.serialization',
+    'dumps': '.serialization',
+    'loads': '.serialization',
+    'response_json': '.serialization',
+}
+
+if TYPE_CHECKING:
+    from .admission import AdmissionController, OverloadedError, RateLimitedError
+    from .arguments import ArgumentValidator, InvalidArgumentsError, compile_validator
+    from .compression import CompressionMiddleware
+    from .identity import RequestIdentityMiddleware, current_priority, current_user
+    from .launch import (
+        load_admission_config,
+        load_compression_config,
+        load_environment_config,
+        load_server_config,
+        run_server
+    )
+    from .runtime import RuntimeGroup, ServerRuntime
+    from .metrics import ToolMetrics, render_metrics
+    from .routes import create_metrics_router, create_tool_router, health_response
+    from .serialization import RawJSON, dumps, loads, response_json
+
+def __getattr__(name: str) -> Any:
+    try:
+        module = _EXPORTS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+def __dir__() -> list:
+    return sorted(list(globals()) + list(_EXPORTS))
+
+__all__ = [
+    'load_admission_config',
+    'load_compression_config',
+    'load_environment_config',
+    'load_server_config',
+    'run_server',
+    'ServerRuntime',
+    'RuntimeGroup',
+    'create_tool_router',
+    'create_metrics_router',
+    'health_response',
+    'ArgumentValidator',
+    'InvalidArgumentsError',
+    'compile_validator',
+    'AdmissionController',
+    'OverloadedError',
+    'RateLimitedError',
+    'RequestIdentityMiddleware',
+    'CompressionMiddleware',
+    'current_user',
+    'current_priority',
+    'ToolMetrics',
+    'render_metrics',
+    'RawJSON',
+    'dumps',
+    'loads',
+    'response_json',
+]
@@ -0,0 +1,265 @@
+import asyncio
+import time
+from collections import OrderedDict, deque
+from typing import Deque, Dict, List, Optional, Tuple
+from shared.models.config import AdmissionConfig
+
+# Calls without a user share one fair-queue slot and are not rate limited
+ANONYMOUS_USER = ""
+# Idle token buckets are dropped once this many users are tracked
+MAX_TRACKED_USERS = 10000
+
+class OverloadedError(Exception):
+    """Raised when a tool call is shed; safe to retry after retry_after seconds."""
+
+    def __init__(self, message: str, tool_name: str, retry_after: float):
+        self.tool_name = tool_name
+        self.retry_after = retry_after
+        super().__init__(message)
+
+class RateLimitedError(OverloadedError):
+    """Raised when a user has started more calls than their token bucket allows."""
+
+    def __init__(self, tool_name: str, user_id: str, retry_after: float):
+        self.user_id = user_id
+        super().__init__(
+            f"Rate limit exceeded for user {user_id} calling {tool_name}; "
+            f"retry after {retry_after:.3g}s",
+            tool_name,
+            retry_after
+        )
+
+_Waiter = Tuple[float, asyncio.Future]
+
+class _PriorityQueue:
+    """Waiters of one priority class, served round-robin across users."""
+    __slots__ = ("weight", "users", "size", "pass_value", "sojourn")
+
+    def __init__(self, weight: float):
+        self.weight = weight
+        self.users: "OrderedDict[str, Deque[_Waiter]]" = OrderedDict()
+        self.size = 0
+        # Stride scheduling: the class with the lowest pass value is served next
+        self.pass_value = 0.0
+        # Queueing delay of the last waiter served (or timed out), as CoDel measures it
+        self.sojourn = 0.0
+
+    def push(self, user_id: str, waiter: _Waiter) -> None:
+        waiters = self.users.get(user_id)
+        if waiters is None:
+            waiters = self.users[user_id] = deque()
+        waiters.append(waiter)
+        self.size += 1
+
+    def pop(self) -> _Waiter:
+        user_id, waiters = next(iter(self.users.items()))
+        waiter = waiters.popleft()
+        if waiters:
+            self.users.move_to_end(user_id)
+        else:
+            del self.users[user_id]
+        self._shrink()
+        return waiter
+
+    def remove(self, user_id: str, waiter: _Waiter) -> bool:
+        waiters = self.users.get(user_id)
+        if waiters is None:
+            return False
+        try:
+            waiters.remove(waiter)
+        except ValueError:
+            return False
+        if not waiters:
+            del self.users[user_id]
+        self._shrink()
+        return True
+
+    def _shrink(self) -> None:
+        self.size -= 1
+        if not self.size:
+            self.sojourn = 0.0
+
+class ToolGate:
+    """Concurrency limit for one tool with a bounded, fair queue.
+
+    Calls beyond max_concurrency wait up to max_wait for a slot. Freed slots
+    go to the waiting priority classes in proportion to their weights, and
+    within a class round-robin across users, so one user's backlog only
+    delays that user. Once a class's queueing delay exceeds shed_delay, or
+    its queue is full, new calls of that class are rejected immediately.
+    """
+
+    def __init__(
+        self,
+        tool_name: str,
+        max_concurrency: int,
+        max_queue: int,
+        max_wait: float,
+        shed_delay: float,
+        priority_weights: Optional[Dict[str, float]] = None
+    ):
+        self.tool_name = tool_name
+        self.max_concurrency = max_concurrency
+        self.max_queue = max_queue
+        self.max_wait = max_wait
+        self.shed_delay = shed_delay
+        self.active = 0
+        self.queued = 0
+        self._classes = {
+            name: _PriorityQueue(weight)
+            for name, weight in (priority_weights or {"default": 1.0}).items()
+        }
+        # Readiness follows the highest-weight class; lower classes absorb spare capacity
+        self._readiness_class = self._classes[
+            max(self._classes, key=lambda name: self._classes[name].weight)
+        ]
+        self._virtual_time = 0.0
+
+    def queue_delay(self, priority: Optional[str] = None) -> float:
+        """Recent queueing delay of a priority class (default: the highest-weight class)."""
+        queue = self._classes[priority] if priority else self._readiness_class
+        return queue.sojourn if queue.size else 0.0
+
+    @property
+    def saturated(self) -> bool:
+        if not self.max_queue:
+            # Nothing may wait, so new calls are rejected exactly when every slot is busy
+            return self.active >= self.max_concurrency
+        queue = self._readiness_class
+        return queue.size >= self.max_queue or (queue.size > 0 and queue.sojourn > self.shed_delay)
+
+    async def acquire(self, user_id: str = ANONYMOUS_USER, priority: Optional[str] = None) -> None:
+        if self.active < self.max_concurrency and not self.queued:
+            self.active += 1
+            return
+        queue = self._classes.get(priority) or self._readiness_class
+        if queue.size >= self.max_queue:
+            raise self._overloaded("queue is full")
+        if queue.size and queue.sojourn > self.shed_delay:
+            raise self._overloaded(f"is queueing for over {self.shed_delay:g}s")
+
+        if not queue.size:
+            # A class returning from idle does not bank credit for the time it was away
+            queue.pass_value = max(queue.pass_value, self._virtual_time)
+        future = asyncio.get_running_loop().create_future()
+        waiter = (time.monotonic(), future)
+        queue.push(user_id, waiter)
+        self.queued += 1
+        try:
+            await asyncio.wait_for(future, self.max_wait)
+        except asyncio.TimeoutError:
+            if future.done() and not future.cancelled():
+                return
+            queue.sojourn = max(queue.sojourn, self.max_wait)
+            raise self._overloaded(f"had no free slot within {self.max_wait:g}s") from None
+        except asyncio.CancelledError:
+            # A slot handed over just as the caller went away goes to the next waiter
+            if future.done() and not future.cancelled():
+                self.release()
+            raise
+        finally:
+            if queue.remove(user_id, waiter):
+                self.queued -= 1
+
+    def _overloaded(self, reason: str) -> OverloadedError:
+        return OverloadedError(
+            f"Server overloaded: {self.tool_name} {reason}; retry after {self.max_wait:g}s",
+            self.tool_name,
+            self.max_wait
+        )
+
+    def release(self) -> None:
+        # Hand the slot straight to the next live waiter
+        while self.queued:
+            queue = min((q for q in self._classes.values() if q.size), key=lambda q: q.pass_value)
+            queue.pass_value += 1.0 / queue.weight
+            self._virtual_time = queue.pass_value
+            enqueued_at, future = queue.pop()
+            self.queued -= 1
+            if not future.done():
+                queue.sojourn = time.monotonic() - enqueued_at
+                future.set_result(None)
+                return
+        self.active -= 1
+
+class TokenBuckets:
+    """Per-user token buckets: rate calls per second, up to burst at once."""
+
+    def __init__(self, rate: float, burst: int):
+        self.rate = rate
+        self.burst = float(burst)
+        self._buckets: Dict[str, List[float]] = {}
+
+    def take(self, user_id: str) -> float:
+        """Spend a token; returns 0 if allowed, else seconds until one is available."""
+        now = time.monotonic()
+        bucket = self._buckets.get(user_id)
+        if bucket is None:
+            if len(self._buckets) >= MAX_TRACKED_USERS:
+                self._prune(now)
+            bucket = self._buckets[user_id] = [self.burst, now]
+        tokens = min(self.burst, bucket[0] + (now - bucket[1]) * self.rate)
+        bucket[1] = now
+        if tokens >= 1.0:
+            bucket[0] = tokens - 1.0
+            return 0.0
+        bucket[0] = tokens
+        return (1.0 - tokens) / self.rate
+
+    def _prune(self, now: float) -> None:
+        # Buckets that have refilled are indistinguishable from new ones
+        self._buckets = {
+            user_id: bucket for user_id, bucket in self._buckets.items()
+            if bucket[0] + (now - bucket[1]) * self.rate < self.burst
+        }
+
+class AdmissionController:
+    """Per-tool gates and per-user rate limits of one server, built from an AdmissionConfig."""
+
+    def __init__(self, config: AdmissionConfig):
+        self.config = config
+        self.gates: Dict[str, ToolGate] = {}
+        self.priorities: Dict[str, str] = {}
+        self.buckets = (
+            TokenBuckets(config.user_rate, config.user_burst)
+            if config.enabled and config.user_rate > 0
+            else None
+        )
+
+    def add_tool(
+        self, tool_name: str, max_concurrency: Optional[int] = None, priority: Optional[str] = None
+    ) -> None:
+        """Gate a tool; configured per-tool limits win over the tool's own default."""
+        if not self.config.enabled:
+            return
+        if priority is not None and priority not in self.config.priority_weights:
+            raise ValueError(f"Unknown priority class {priority} for {tool_name}")
+        self.priorities[tool_name] = priority or self.config.default_priority
+        limit = self.config.tool_concurrency.get(
+            tool_name, max_concurrency or self.config.max_concurrency
+        )
+        self.gates[tool_name] = ToolGate(
+            tool_name,
+            max_concurrency=limit,
+            max_queue=self.config.max_queue,
+            max_wait=self.config.max_wait,
+            shed_delay=self.config.shed_delay,
+            priority_weights=self.config.priority_weights
+        )
+
+    def priority_for(self, tool_name: str, requested: Optional[str]) -> str:
+        """The caller's priority class if valid, else the tool's default."""
+        if requested in self.config.priority_weights:
+            return requested
+        return self.priorities.get(tool_name, self.config.default_priority)
+
+    def check_rate(self, tool_name: str, user_id: str) -> None:
+        if self.buckets is None or user_id == ANONYMOUS_USER:
+            return
+        retry_after = self.buckets.take(user_id)
+        if retry_after:
+            raise RateLimitedError(tool_name, user_id, retry_after)
+
+    @property
+    def saturated_tools(self) -> List[str]:
+        return [name for name, gate in self.gates.items() if gate.saturated]
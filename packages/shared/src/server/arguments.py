@@ -0,0 +1,121 @@
+from datetime import date
+from typing import Any, Dict, List, Optional
+from pydantic_core import SchemaValidator, ValidationError, core_schema
+
+# JSON schema string formats checked (the value stays a string)
+STRING_FORMATS = {
+    "date": date.fromisoformat
+}
+
+class InvalidArgumentsError(ValueError):
+    """Raised when tool arguments do not match the tool's parameter schema."""
+
+    def __init__(self, tool_name: str, errors: List[Dict[str, Any]]):
+        self.tool_name = tool_name
+        self.errors = errors
+        details = "; ".join(f"{error['loc'] or 'arguments'}: {error['msg']}" for error in errors)
+        super().__init__(f"Invalid arguments for {tool_name}: {details}")
+
+class ArgumentValidator:
+    """A tool's parameter JSON schema compiled to a pydantic-core validator.
+
+    Validates and coerces (lax mode, e.g. "2" to 2 for an integer) the
+    arguments of one call, returning the dict to pass to the tool. Omitted
+    optional arguments stay omitted and null ones are dropped, so tools
+    apply their own defaults; properties the schema does not declare are
+    passed through.
+    """
+
+    def __init__(self, tool_name: str, schema: Dict[str, Any]):
+        self.tool_name = tool_name
+        self._validator = SchemaValidator(_object_schema(schema))
+
+    def validate(self, arguments: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+        try:
+            validated = self._validator.validate_python(arguments or {})
+        except ValidationError as e:
+            raise InvalidArgumentsError(
+                self.tool_name,
+                [
+                    {
+                        "loc": ".".join(str(part) for part in error["loc"]),
+                        "msg": error["msg"],
+                        "type": error["type"]
+                    }
+                    for error in e.errors(include_url=False)
+                ]
+            ) from None
+        return {name: value for name, value in validated.items() if value is not None}
+
+def compile_validator(
+    tool_name: str, schema: Optional[Dict[str, Any]]
+) -> Optional[ArgumentValidator]:
+    """Validator for schema, or None for tools without an object parameter schema."""
+    if not schema or schema.get("type") != "object":
+        return None
+    return ArgumentValidator(tool_name, schema)
+
+def _schema(schema: Dict[str, Any]) -> core_schema.CoreSchema:
+    """Core schema for the JSON schema constructs tool parameters use; others accept anything."""
+    if "enum" in schema:
+        return core_schema.literal_schema(list(schema["enum"]))
+    schema_type = schema.get("type")
+    if schema_type == "string":
+        string = core_schema.str_schema(
+            min_length=schema.get("minLength"),
+            max_length=schema.get("maxLength"),
+            pattern=schema.get("pattern")
+        )
+        check = STRING_FORMATS.get(schema.get("format"))
+        if check is None:
+            return string
+        return core_schema.no_info_after_validator_function(
+            _format_check(check, schema["format"]), string
+        )
+    if schema_type in ("integer", "number"):
+        bounds = {
+            "ge": schema.get("minimum"),
+            "le": schema.get("maximum"),
+            "gt": schema.get("exclusiveMinimum"),
+            "lt": schema.get("exclusiveMaximum")
+        }
+        if schema_type == "integer":
+            return core_schema.int_schema(**bounds)
+        return core_schema.float_schema(**bounds)
+    if schema_type == "boolean":
+        return core_schema.bool_schema()
+    if schema_type == "array":
+        return core_schema.list_schema(
+            _schema(schema["items"]) if "items" in schema else None,
+            min_length=schema.get("minItems"),
+            max_length=schema.get("maxItems")
+        )
+    if schema_type == "object":
+        if "properties" in schema:
+            return _object_schema(schema)
+        values = schema.get("additionalProperties")
+        return core_schema.dict_schema(
+            core_schema.str_schema(), _schema(values) if isinstance(values, dict) else None
+        )
+    return core_schema.any_schema()
+
+def _object_schema(schema: Dict[str, Any]) -> core_schema.CoreSchema:
+    required = set(schema.get("required", []))
+    fields = {}
+    for name, spec in schema.get("properties", {}).items():
+        field = _schema(spec)
+        # Clients commonly send null for optional properties they leave unset
+        if name not in required:
+            field = core_schema.nullable_schema(field)
+        fields[name] = core_schema.typed_dict_field(field, required=name in required)
+    extra = "forbid" if schema.get("additionalProperties") is False else "allow"
+    return core_schema.typed_dict_schema(fields, extra_behavior=extra)
+
+def _format_check(check: Any, format_name: str) -> Any:
+    def validate(value: str) -> str:
+        try:
+            check(value)
+        except ValueError:
+            raise ValueError(f"Value is not a valid {format_name}") from None
+        return value
+    return validate
@@ -0,0 +1,175 @@
+import zlib
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Sequence, Tuple
+from shared.models.config import CompressionConfig
+from .identity import ASGIApp
+from .launch import load_compression_config
+
+try:
+    import zstandard
+except ImportError:  # pragma: no cover - optional encoding
+    zstandard = None
+
+ACCEPT_ENCODING_HEADER = b"accept-encoding"
+# Already-compressed formats (images, archives) gain nothing from another pass
+COMPRESSIBLE_TYPES = ("text/", "application/json", "application/javascript", "application/xml")
+COMPRESSIBLE_SUFFIXES = ("+json", "+xml")
+
+class GzipCompressor:
+    def __init__(self, level: int):
+        self._compressor = zlib.compressobj(level, zlib.DEFLATED, 31)
+
+    def compress(self, data: bytes, flush: bool = False) -> bytes:
+        output = self._compressor.compress(data)
+        return output + self._compressor.flush(zlib.Z_SYNC_FLUSH) if flush else output
+
+    def finish(self) -> bytes:
+        return self._compressor.flush(zlib.Z_FINISH)
+
+class ZstdCompressor:
+    def __init__(self, level: int):
+        # One context per response: compressobj is not safe to interleave across streams
+        self._compressor = zstandard.ZstdCompressor(level=level).compressobj()
+
+    def compress(self, data: bytes, flush: bool = False) -> bytes:
+        output = self._compressor.compress(data)
+        return (
+            output + self._compressor.flush(zstandard.COMPRESSOBJ_FLUSH_BLOCK) if flush else output
+        )
+
+    def finish(self) -> bytes:
+        return self._compressor.flush(zstandard.COMPRESSOBJ_FLUSH_FINISH)
+
+def available_encodings() -> Tuple[str, ...]:
+    return ("zstd", "gzip") if zstandard is not None else ("gzip",)
+
+def create_compressor(encoding: str, config: CompressionConfig) -> Any:
+    if encoding == "zstd":
+        return ZstdCompressor(config.zstd_level)
+    return GzipCompressor(config.gzip_level)
+
+def negotiate_encoding(accept_encoding: str, encodings: Sequence[str]) -> Optional[str]:
+    """First of encodings (server preference order) the Accept-Encoding header allows."""
+    accepted: Dict[str, float] = {}
+    for item in accept_encoding.split(","):
+        name, _, params = item.partition(";")
+        quality = 1.0
+        for param in params.split(";"):
+            key, _, value = param.strip().partition("=")
+            if key == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        if name.strip():
+            accepted[name.strip().lower()] = quality
+    wildcard = accepted.get("*", 0.0)
+    for encoding in encodings:
+        if accepted.get(encoding, wildcard) > 0:
+            return encoding
+    return None
+
+def is_compressible(content_type: str) -> bool:
+    content_type = content_type.split(";", 1)[0].strip().lower()
+    return (
+        content_type.startswith(COMPRESSIBLE_TYPES)
+        or content_type.endswith(COMPRESSIBLE_SUFFIXES)
+    )
+
+class CompressionMiddleware:
+    """ASGI middleware compressing responses with the best encoding the client accepts.
+
+    Complete responses below minimum_size are sent as-is. Streamed responses
+    (e.g. the MCP endpoint's event stream) are compressed chunk by chunk and
+    flushed after each one, so events are not held back. Responses that
+    already carry a Content-Encoding, such as those of a mounted app with its
+    own middleware, are passed through.
+    """
+
+    def __init__(self, app: ASGIApp, config: Optional[CompressionConfig] = None):
+        self.app = app
+        self.config = config or load_compression_config()
+        supported = available_encodings()
+        self.encodings = [encoding for encoding in self.config.encodings if encoding in supported]
+
+    async def __call__(
+        self,
+        scope: Dict[str, Any],
+        receive: Callable[[], Awaitable[Any]],
+        send: Callable[[Any], Awaitable[None]]
+    ) -> None:
+        if scope["type"] != "http" or not self.config.enabled or not self.encodings:
+            await self.app(scope, receive, send)
+            return
+        accept_encoding = next(
+            (
+                value.decode("latin-1")
+                for name, value in scope.get("headers", ())
+                if name == ACCEPT_ENCODING_HEADER
+            ),
+            ""
+        )
+        encoding = negotiate_encoding(accept_encoding, self.encodings) if accept_encoding else None
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+        await self.app(scope, receive, CompressedResponse(send, encoding, self.config).send)
+
+class CompressedResponse:
+    """Send wrapper that compresses one response's body."""
+
+    def __init__(
+        self, send: Callable[[Any], Awaitable[None]], encoding: str, config: CompressionConfig
+    ):
+        self._send = send
+        self.encoding = encoding
+        self.config = config
+        self._start: Optional[Dict[str, Any]] = None
+        self._compressor: Any = None
+        self._passthrough = False
+
+    async def send(self, message: Dict[str, Any]) -> None:
+        if message["type"] == "http.response.start":
+            self._start = message
+            headers = {name.lower(): value for name, value in message.get("headers", ())}
+            content_type = headers.get(b"content-type", b"").decode("latin-1")
+            self._passthrough = b"content-encoding" in headers or not is_compressible(content_type)
+            if self._passthrough:
+                await self._send(message)
+            return
+        if message["type"] != "http.response.body" or self._passthrough:
+            await self._send(message)
+            return
+        body = message.get("body", b"")
+        more_body = message.get("more_body", False)
+        if self._start is None:
+            # Later chunks of a streamed response
+            output = self._compressor.compress(body, flush=more_body)
+            await self._send(
+                {
+                    "type": "http.response.body",
+                    "body": output if more_body else output + self._compressor.finish(),
+                    "more_body": more_body
+                }
+            )
+            return
+        start, self._start = self._start, None
+        if not more_body and len(body) < self.config.minimum_size:
+            self._passthrough = True
+            await self._send(start)
+            await self._send(message)
+            return
+        self._compressor = create_compressor(self.encoding, self.config)
+        headers: List[Tuple[bytes, bytes]] = [
+            (name, value)
+            for name, value in start.get("headers", ())
+            if name.lower() != b"content-length"
+        ]
+        headers.append((b"content-encoding", self.encoding.encode()))
+        headers.append((b"vary", b"Accept-Encoding"))
+        if more_body:
+            output = self._compressor.compress(body, flush=True)
+        else:
+            output = self._compressor.compress(body) + self._compressor.finish()
+            headers.append((b"content-length", str(len(output)).encode()))
+        await self._send({**start, "headers": headers})
+        await self._send({"type": "http.response.body", "body": output, "more_body": more_body})
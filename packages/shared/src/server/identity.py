@@ -0,0 +1,53 @@
+from contextvars import ContextVar
+from typing import Any, Awaitable, Callable, Dict, Optional
+from shared.tracing import TRACEPARENT_HEADER, remote_parent
+
+USER_HEADER = b"user-id"
+PRIORITY_HEADER = b"priority"
+TRACEPARENT = TRACEPARENT_HEADER.encode()
+
+# Caller identity for the current request, read by the runtime when scheduling tool calls
+current_user: ContextVar[Optional[str]] = ContextVar("current_user", default=None)
+current_priority: ContextVar[Optional[str]] = ContextVar("current_priority", default=None)
+
+ASGIApp = Callable[
+    [Dict[str, Any], Callable[[], Awaitable[Any]], Callable[[Any], Awaitable[None]]],
+    Awaitable[None]
+]
+
+class RequestIdentityMiddleware:
+    """ASGI middleware exposing the user-id, priority and traceparent headers to tool dispatch.
+
+    Applies to every route, including the mounted MCP endpoint, so tools
+    without a user_id parameter are still scheduled per caller, and tool
+    spans continue the caller's trace.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(
+        self,
+        scope: Dict[str, Any],
+        receive: Callable[[], Awaitable[Any]],
+        send: Callable[[Any], Awaitable[None]]
+    ) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        user_id = priority = traceparent = None
+        for name, value in scope.get("headers", ()):
+            if name == USER_HEADER:
+                user_id = value.decode("latin-1")
+            elif name == PRIORITY_HEADER:
+                priority = value.decode("latin-1").lower()
+            elif name == TRACEPARENT:
+                traceparent = value.decode("latin-1")
+        user_token = current_user.set(user_id)
+        priority_token = current_priority.set(priority)
+        try:
+            with remote_parent(traceparent):
+                await self.app(scope, receive, send)
+        finally:
+            current_user.reset(user_token)
+            current_priority.reset(priority_token)
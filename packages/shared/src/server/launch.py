@@ -0,0 +1,156 @@
+import importlib.util
+import os
+from typing import Any, Callable, Dict, Optional
+from loguru import logger
+from shared.models.config import AdmissionConfig, CompressionConfig, EnvironmentConfig, ServerConfig
+
+PRODUCTION_ENVIRONMENTS = ("production", "staging")
+PRODUCTION_KEEP_ALIVE = 75
+
+def load_environment_config() -> EnvironmentConfig:
+    """Environment settings from ENVIRONMENT, DEBUG and LOG_LEVEL."""
+    return EnvironmentConfig(
+        environment=os.getenv("ENVIRONMENT", "development"),
+        debug=os.getenv("DEBUG", "false").lower() in ("1", "true", "yes"),
+        log_level=os.getenv("LOG_LEVEL", "INFO")
+    )
+
+def load_server_config(
+    default_port: int, environment: Optional[EnvironmentConfig] = None
+) -> ServerConfig:
+    """Serving settings for the environment, overridable per setting from env.
+
+    Development serves one reloading worker. Production and staging serve
+    without reload, with longer keep-alive so clients behind a load balancer
+    reuse connections. Every environment serves one worker unless
+    WEB_CONCURRENCY says otherwise: caches, search sessions, metrics and
+    admission limits are per process, so extra workers do not share them.
+    """
+    environment = environment or load_environment_config()
+    is_production = environment.environment.lower() in PRODUCTION_ENVIRONMENTS
+    defaults = ServerConfig(
+        port=default_port,
+        reload=not is_production,
+        timeout_keep_alive=PRODUCTION_KEEP_ALIVE if is_production else 5,
+        access_log=not is_production
+    )
+
+    overrides = {
+        "host": os.getenv("HOST"),
+        "port": os.getenv("PORT"),
+        "workers": os.getenv("WEB_CONCURRENCY"),
+        "reload": os.getenv("SERVER_RELOAD"),
+        "loop": os.getenv("SERVER_LOOP"),
+        "http": os.getenv("SERVER_HTTP"),
+        "timeout_keep_alive": os.getenv("SERVER_KEEP_ALIVE"),
+        "timeout_graceful_shutdown": os.getenv("SERVER_GRACEFUL_TIMEOUT"),
+        "backlog": os.getenv("SERVER_BACKLOG"),
+        "limit_concurrency": os.getenv("SERVER_LIMIT_CONCURRENCY"),
+        "access_log": os.getenv("SERVER_ACCESS_LOG")
+    }
+    return ServerConfig.model_validate({
+        **defaults.model_dump(),
+        **{key: value for key, value in overrides.items() if value is not None}
+    })
+
+def load_admission_config() -> AdmissionConfig:
+    """Admission control settings, overridable per setting from env.
+
+    ADMISSION_TOOL_CONCURRENCY and ADMISSION_PRIORITY_WEIGHTS take
+    comma-separated name=value pairs, e.g. "search_flights=32,get_payment_methods_bulk=4"
+    and "interactive=8,batch=1".
+    """
+    overrides = {
+        "enabled": os.getenv("ADMISSION_ENABLED"),
+        "max_concurrency": os.getenv("ADMISSION_MAX_CONCURRENCY"),
+        "tool_concurrency": _parse_pairs("ADMISSION_TOOL_CONCURRENCY", int),
+        "max_queue": os.getenv("ADMISSION_MAX_QUEUE"),
+        "max_wait": os.getenv("ADMISSION_MAX_WAIT"),
+        "shed_delay": os.getenv("ADMISSION_SHED_DELAY"),
+        "priority_weights": _parse_pairs("ADMISSION_PRIORITY_WEIGHTS", float),
+        "default_priority": os.getenv("ADMISSION_DEFAULT_PRIORITY"),
+        "user_rate": os.getenv("ADMISSION_USER_RATE"),
+        "user_burst": os.getenv("ADMISSION_USER_BURST")
+    }
+    return AdmissionConfig.model_validate(
+        {key: value for key, value in overrides.items() if value is not None}
+    )
+
+def load_compression_config() -> CompressionConfig:
+    """Response compression settings, overridable per setting from env.
+
+    COMPRESSION_ENCODINGS is a comma-separated preference list, e.g. "gzip"
+    or "zstd,gzip".
+    """
+    encodings = os.getenv("COMPRESSION_ENCODINGS")
+    overrides = {
+        "enabled": os.getenv("COMPRESSION_ENABLED"),
+        "minimum_size": os.getenv("COMPRESSION_MIN_SIZE"),
+        "encodings": (
+            [encoding for encoding in encodings.split(",") if encoding.strip()]
+            if encodings else None
+        ),
+        "gzip_level": os.getenv("COMPRESSION_GZIP_LEVEL"),
+        "zstd_level": os.getenv("COMPRESSION_ZSTD_LEVEL")
+    }
+    return CompressionConfig.model_validate(
+        {key: value for key, value in overrides.items() if value is not None}
+    )
+
+def _parse_pairs(variable: str, convert: Callable[[str], Any]) -> Optional[Dict[str, Any]]:
+    value = os.getenv(variable)
+    if not value:
+        return None
+    try:
+        return {
+            name.strip(): convert(item)
+            for name, item in (pair.split("=", 1) for pair in value.split(",") if pair.strip())
+        }
+    except ValueError as e:
+        raise ValueError(f"Invalid {variable} {value!r}: expected name=value pairs") from e
+
+def resolve_loop(loop: str) -> str:
+    if loop == "auto":
+        return "uvloop" if importlib.util.find_spec("uvloop") else "asyncio"
+    return loop
+
+def resolve_http(http: str) -> str:
+    if http == "auto":
+        return "httptools" if importlib.util.find_spec("httptools") else "h11"
+    return http
+
+def run_server(app: str, config: ServerConfig) -> None:
+    """Serve an ASGI app given as "module:attribute" with uvicorn.
+
+    Blocks until the server exits; on SIGINT/SIGTERM workers stop accepting
+    connections and drain in-flight requests for up to
+    timeout_graceful_shutdown seconds.
+    """
+    import uvicorn
+
+    workers = config.workers
+    if config.reload and workers > 1:
+        logger.warning(f"Reload serves a single worker; ignoring workers={workers}")
+        workers = 1
+
+    loop = resolve_loop(config.loop)
+    http = resolve_http(config.http)
+    logger.info(
+        f"Serving {app} on {config.host}:{config.port} "
+        f"(workers={workers}, reload={config.reload}, loop={loop}, http={http}, "
+        f"keep_alive={config.timeout_keep_alive}s)"
+    )
+    uvicorn.run(
+        app,
+        host=config.host,
+        port=config.port,
+        workers=workers,
+        reload=config.reload,
+        loop=loop,
+        http=http,
+        timeout_keep_alive=config.timeout_keep_alive,
+        timeout_graceful_shutdown=config.timeout_graceful_shutdown,
+        backlog=config.backlog,
+        limit_concurrency=config.limit_concurrency,
+        access_log=config.access_log
+    )
@@ -0,0 +1,151 @@
+from bisect import bisect_left
+from typing import Dict, Iterable, List, Sequence, Tuple
+
+# Seconds; covers cached lookups through slow upstream calls
+LATENCY_BUCKETS: Tuple[float, ...] = (
+    0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0
+)
+# Bytes of serialized tool results
+SIZE_BUCKETS: Tuple[float, ...] = (256, 1024, 4096, 16384, 65536, 262144, 1048576, 4194304)
+
+ERROR_TYPES = ("invalid_input", "internal", "overloaded", "rate_limited")
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+class Histogram:
+    """Fixed-bucket histogram; observe() is one bisect and two additions."""
+    __slots__ = ("bounds", "counts", "sum", "count")
+
+    def __init__(self, bounds: Sequence[float]):
+        self.bounds = tuple(bounds)
+        self.counts = [0] * (len(self.bounds) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect_left(self.bounds, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def cumulative(self) -> List[Tuple[str, int]]:
+        total = 0
+        buckets = []
+        for bound, count in zip(self.bounds + (float("inf"),), self.counts):
+            total += count
+            buckets.append(("+Inf" if bound == float("inf") else _format(bound), total))
+        return buckets
+
+class ToolStats:
+    """Counters for one tool, updated inline by ServerRuntime on every call."""
+    __slots__ = (
+        "requests", "errors", "in_flight", "queued", "latency", "queue_wait", "response_bytes"
+    )
+
+    def __init__(self):
+        self.requests = 0
+        self.errors: Dict[str, int] = {error_type: 0 for error_type in ERROR_TYPES}
+        self.in_flight = 0
+        self.queued = 0
+        self.latency = Histogram(LATENCY_BUCKETS)
+        self.queue_wait = Histogram(LATENCY_BUCKETS)
+        self.response_bytes = Histogram(SIZE_BUCKETS)
+
+class ToolMetrics:
+    """Per-tool metrics of one server, rendered in the Prometheus text format.
+
+    Response sizes are recorded on the fast JSON path, where the serialized
+    bytes are already at hand; MCP endpoint results are serialized by the
+    MCP library and are not sized.
+    """
+
+    def __init__(self, server: str):
+        self.server = server
+        self.tools: Dict[str, ToolStats] = {}
+
+    def tool(self, tool_name: str) -> ToolStats:
+        stats = self.tools.get(tool_name)
+        if stats is None:
+            stats = self.tools[tool_name] = ToolStats()
+        return stats
+
+def render_metrics(metrics: Iterable[ToolMetrics]) -> bytes:
+    """Prometheus text exposition of one or more servers' tool metrics."""
+    rows = [
+        (m.server, tool_name, stats)
+        for m in metrics
+        for tool_name, stats in sorted(m.tools.items())
+    ]
+    lines: List[str] = []
+
+    lines += [
+        "# HELP mcp_tool_requests_total Tool calls dispatched.",
+        "# TYPE mcp_tool_requests_total counter"
+    ]
+    lines += [
+        f"mcp_tool_requests_total{_labels(server, tool)} {stats.requests}"
+        for server, tool, stats in rows
+    ]
+
+    lines += [
+        "# HELP mcp_tool_errors_total Tool calls that failed, by type "
+        "(invalid_input: ValueError, internal: any other exception, "
+        "overloaded: shed by admission control, rate_limited: over the user's token bucket).",
+        "# TYPE mcp_tool_errors_total counter"
+    ]
+    for server, tool, stats in rows:
+        lines += [
+            f"mcp_tool_errors_total{_labels(server, tool, type=t)} {count}"
+            for t, count in stats.errors.items()
+        ]
+
+    lines += [
+        "# HELP mcp_tool_in_flight Tool calls currently executing.",
+        "# TYPE mcp_tool_in_flight gauge"
+    ]
+    lines += [
+        f"mcp_tool_in_flight{_labels(server, tool)} {stats.in_flight}"
+        for server, tool, stats in rows
+    ]
+
+    lines += [
+        "# HELP mcp_tool_queued Tool calls waiting for an admission slot.",
+        "# TYPE mcp_tool_queued gauge"
+    ]
+    lines += [
+        f"mcp_tool_queued{_labels(server, tool)} {stats.queued}" for server, tool, stats in rows
+    ]
+
+    lines += _histogram_lines(
+        "mcp_tool_duration_seconds", "Tool execution time in seconds.",
+        [(server, tool, stats.latency) for server, tool, stats in rows]
+    )
+    lines += _histogram_lines(
+        "mcp_tool_queue_wait_seconds", "Time admitted tool calls waited for a slot.",
+        [(server, tool, stats.queue_wait) for server, tool, stats in rows]
+    )
+    lines += _histogram_lines(
+        "mcp_tool_response_bytes", "Size of serialized tool responses on the JSON path.",
+        [(server, tool, stats.response_bytes) for server, tool, stats in rows]
+    )
+    return ("\n".join(lines) + "\n").encode()
+
+def _histogram_lines(
+    name: str, help_text: str, rows: List[Tuple[str, str, Histogram]]
+) -> List[str]:
+    lines = [f"# HELP {name} {help_text}", f"# TYPE {name} histogram"]
+    for server, tool, histogram in rows:
+        for le, count in histogram.cumulative():
+            lines.append(f"{name}_bucket{_labels(server, tool, le=le)} {count}")
+        lines.append(f"{name}_sum{_labels(server, tool)} {_format(histogram.sum)}")
+        lines.append(f"{name}_count{_labels(server, tool)} {histogram.count}")
+    return lines
+
+def _labels(server: str, tool: str, **extra: str) -> str:
+    pairs = [("server", server), ("tool", tool), *extra.items()]
+    return "{" + ",".join(f'{key}="{_escape(value)}"' for key, value in pairs) + "}"
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+def _format(value: float) -> str:
+    return repr(float(value)) if value != int(value) else str(int(value))
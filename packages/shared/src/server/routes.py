@@ -0,0 +1,90 @@
+import math
+from typing import Any, Dict, List, Optional, Protocol, Union
+from fastapi import APIRouter, Request, Response
+from fastapi.responses import JSONResponse
+from .admission import OverloadedError
+from .metrics import CONTENT_TYPE, ToolMetrics, render_metrics
+from .serialization import loads, response_json
+
+class JSONDispatcher(Protocol):
+    tools: Dict[str, Any]
+
+    async def dispatch_json(
+        self, tool_name: str, parameters: Optional[Dict[str, Any]] = None, context: Any = None
+    ) -> bytes:
+        ...
+
+class MetricsSource(Protocol):
+    metrics: Union[ToolMetrics, List[ToolMetrics]]
+
+class ReadinessSource(Protocol):
+    started: bool
+    saturated_tools: List[str]
+
+def create_tool_router(runtime: JSONDispatcher) -> APIRouter:
+    """GET /api/tools lists tools; POST /api/tools/{tool_name} calls one via the fast JSON path."""
+    router = APIRouter(prefix="/api/tools", tags=["tools"])
+
+    @router.get("")
+    async def list_tools() -> Dict[str, List[Dict[str, Any]]]:
+        return {
+            "tools": [
+                {"name": name, "description": tool.description, "parameters": tool.parameters}
+                for name, tool in runtime.tools.items()
+            ]
+        }
+
+    @router.post("/{tool_name}")
+    async def call_tool(tool_name: str, request: Request) -> Response:
+        body = await request.body()
+        try:
+            parameters = loads(body) if body else {}
+        except ValueError:
+            return Response(
+                status_code=400,
+                content=b'{"detail":"Request body is not valid JSON"}',
+                media_type="application/json"
+            )
+        if not isinstance(parameters, dict):
+            return Response(
+                status_code=400,
+                content=b'{"detail":"Tool parameters must be a JSON object"}',
+                media_type="application/json"
+            )
+        try:
+            content = await runtime.dispatch_json(tool_name, parameters)
+        except OverloadedError as e:
+            return Response(
+                status_code=503,
+                content=response_json("error", error=str(e)),
+                media_type="application/json",
+                headers={"Retry-After": str(math.ceil(e.retry_after))}
+            )
+        return Response(content=content, media_type="application/json")
+
+    return router
+
+def create_metrics_router(runtime: MetricsSource) -> APIRouter:
+    """GET /metrics: per-tool counters and histograms in the Prometheus text format."""
+    router = APIRouter(tags=["metrics"])
+
+    @router.get("/metrics")
+    async def metrics() -> Response:
+        sources = runtime.metrics
+        if isinstance(sources, ToolMetrics):
+            sources = [sources]
+        return Response(content=render_metrics(sources), media_type=CONTENT_TYPE)
+
+    return router
+
+def health_response(runtime: ReadinessSource, service: str) -> JSONResponse:
+    """Readiness: 503 until the runtime has started and while any tool is shedding calls."""
+    if not runtime.started:
+        return JSONResponse({"status": "starting", "service": service}, status_code=503)
+    saturated = runtime.saturated_tools
+    if saturated:
+        return JSONResponse(
+            {"status": "saturated", "service": service, "saturated_tools": saturated},
+            status_code=503
+        )
+    return JSONResponse({"status": "healthy", "service": service})
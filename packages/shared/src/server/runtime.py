@@ -0,0 +1,404 @@
+import inspect
+import time
+from contextlib import asynccontextmanager, contextmanager, nullcontext
+from dataclasses import dataclass
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Union
+)
+from loguru import logger
+from mcp import MCPResponse, Tool
+from shared.models.config import AdmissionConfig
+from shared.tracing import Span, SpanKind, get_tracer, remote_parent, start_span
+from .arguments import ArgumentValidator, InvalidArgumentsError, compile_validator
+from .admission import ANONYMOUS_USER, AdmissionController, OverloadedError, RateLimitedError
+from .identity import current_priority, current_user
+from .launch import load_admission_config
+from .metrics import ToolMetrics
+from .serialization import response_json
+
+ResourceFactory = Callable[["ServerRuntime"], Union[Any, Awaitable[Any]]]
+ResourceCloser = Callable[[Any], Union[None, Awaitable[None]]]
+ToolFactory = Callable[["ServerRuntime"], Tool]
+
+@dataclass(frozen=True)
+class _ResourceSpec:
+    name: str
+    factory: ResourceFactory
+    close: Optional[ResourceCloser]
+
+class ServerRuntime:
+    """Tools and long-lived resources of one MCP server process.
+
+    Resources (pools, catalogs, caches, HTTP clients) are created in
+    registration order when the app starts and closed in reverse order when
+    it stops. Tools are created once after the resources they depend on, and
+    every MCP call is dispatched to those instances, subject to each tool's
+    admission gate.
+    """
+
+    def __init__(self, name: str, admission: Optional[AdmissionConfig] = None):
+        self.name = name
+        self._resource_specs: List[_ResourceSpec] = []
+        self._tool_factories: Dict[str, ToolFactory] = {}
+        self._resources: Dict[str, Any] = {}
+        self._tools: Dict[str, Tool] = {}
+        self._validators: Dict[str, Optional[ArgumentValidator]] = {}
+        self.metrics = ToolMetrics(name)
+        self.admission = AdmissionController(admission or load_admission_config())
+        self.started = False
+
+    def add_resource(
+        self, name: str, factory: ResourceFactory, close: Optional[ResourceCloser] = None
+    ) -> None:
+        """Register a resource; factory receives the runtime to look up earlier resources."""
+        self._resource_specs.append(_ResourceSpec(name, factory, close))
+
+    def add_tool(
+        self,
+        name: str,
+        factory: ToolFactory,
+        max_concurrency: Optional[int] = None,
+        priority: Optional[str] = None
+    ) -> None:
+        """Register a tool; factory receives the runtime to look up resources.
+
+        max_concurrency overrides the default concurrent executions admitted
+        for this tool (ADMISSION_TOOL_CONCURRENCY still wins); priority is
+        the class its calls queue in unless the caller sends one.
+        """
+        self._tool_factories[name] = factory
+        self.metrics.tool(name)
+        self.admission.add_tool(name, max_concurrency, priority)
+
+    def __getitem__(self, name: str) -> Any:
+        try:
+            return self._resources[name]
+        except KeyError:
+            raise RuntimeError(
+                f"Resource {name} is not available; has {self.name} started?"
+            ) from None
+
+    @property
+    def tools(self) -> Dict[str, Tool]:
+        return self._tools
+
+    @property
+    def tool_names(self) -> List[str]:
+        """Registered tool names, available before startup."""
+        return list(self._tool_factories)
+
+    @property
+    def saturated_tools(self) -> List[str]:
+        """Tools currently shedding calls."""
+        return self.admission.saturated_tools
+
+    async def startup(self) -> None:
+        try:
+            for spec in self._resource_specs:
+                self._resources[spec.name] = await _maybe_await(spec.factory(self))
+            self._tools = {name: factory(self) for name, factory in self._tool_factories.items()}
+            # Parameter schemas compiled once; calls are validated before admission
+            self._validators = {
+                name: compile_validator(name, getattr(tool, "parameters", None))
+                for name, tool in self._tools.items()
+            }
+        except BaseException:
+            # Lifespan never reaches shutdown after a failed startup
+            logger.error(f"{self.name} failed to start; closing {len(self._resources)} resources")
+            self._tools = {}
+            self._validators = {}
+            await self._close_resources()
+            raise
+        self.started = True
+        logger.info(
+            f"{self.name} started with {len(self._resources)} resources "
+            f"and {len(self._tools)} tools"
+        )
+
+    async def shutdown(self) -> None:
+        self.started = False
+        self._tools = {}
+        self._validators = {}
+        await self._close_resources()
+        get_tracer().flush()
+        logger.info(f"{self.name} stopped")
+
+    async def _close_resources(self) -> None:
+        """Close the resources created so far, in reverse registration order."""
+        for spec in reversed(self._resource_specs):
+            resource = self._resources.pop(spec.name, None)
+            if resource is None or spec.close is None:
+                continue
+            try:
+                await _maybe_await(spec.close(resource))
+            except Exception as e:
+                logger.error(f"Failed to close {spec.name}: {str(e)}")
+
+    @asynccontextmanager
+    async def lifespan(self, app: Any) -> AsyncIterator[None]:
+        """FastAPI lifespan: start before serving, drain resources after."""
+        await self.startup()
+        try:
+            yield
+        finally:
+            await self.shutdown()
+
+    async def dispatch(
+        self, tool_name: str, parameters: Optional[Dict[str, Any]] = None, context: Any = None
+    ) -> MCPResponse:
+        """Run a tool and wrap its result or error in an MCPResponse."""
+        parameters, traceparent = _split_meta(parameters)
+        with self._server_span(tool_name, traceparent) as span:
+            try:
+                status, result = await self._call(
+                    tool_name, parameters, context, fast=False, traced=span is not None
+                )
+            except OverloadedError as e:
+                status, result = "error", str(e)
+            except InvalidArgumentsError as e:
+                if span is not None:
+                    span.set_error(str(e))
+                return MCPResponse(status="error", data={"errors": e.errors}, error=str(e))
+            if status == "success":
+                return MCPResponse(status=status, data=result)
+            if span is not None:
+                span.set_error(result)
+            return MCPResponse(status=status, error=result)
+
+    async def dispatch_json(
+        self, tool_name: str, parameters: Optional[Dict[str, Any]] = None, context: Any = None
+    ) -> bytes:
+        """Run a tool and serialize the MCPResponse straight to JSON bytes.
+
+        Tools that define execute_payload return a model or RawJSON that is
+        serialized once, skipping the model_dump() dict and MCPResponse.
+        Raises OverloadedError when the call is shed, so HTTP callers can
+        answer 503 with Retry-After. Invalid arguments are answered with
+        their per-argument errors in data.errors.
+        """
+        parameters, traceparent = _split_meta(parameters)
+        with self._server_span(tool_name, traceparent) as span:
+            errors = None
+            try:
+                status, result = await self._call(
+                    tool_name, parameters, context, fast=True, traced=span is not None
+                )
+            except InvalidArgumentsError as e:
+                status, result, errors = "error", str(e), {"errors": e.errors}
+            with start_span("serialize") if span is not None else nullcontext():
+                if status == "success":
+                    content = response_json(status, data=result)
+                else:
+                    content = response_json(status, data=errors, error=result)
+            if span is not None:
+                span.set_attribute("mcp.response.bytes", len(content))
+                if status != "success":
+                    span.set_error(result)
+        stats = self.metrics.tools.get(tool_name)
+        if stats is not None:
+            stats.response_bytes.observe(len(content))
+        return content
+
+    @contextmanager
+    def _server_span(self, tool_name: str, traceparent: Optional[str]) -> Iterator[Optional[Span]]:
+        """Span for one tool call, continuing the caller's trace when one was propagated."""
+        tracer = get_tracer()
+        if not tracer.enabled:
+            yield None
+            return
+        with remote_parent(traceparent) if traceparent else nullcontext():
+            with tracer.span(
+                f"tools/call {tool_name}",
+                SpanKind.SERVER,
+                {"mcp.server": self.name, "mcp.tool": tool_name}
+            ) as span:
+                yield span
+
+    async def _call(
+        self,
+        tool_name: str,
+        parameters: Optional[Dict[str, Any]],
+        context: Any,
+        fast: bool,
+        traced: bool = False
+    ) -> Tuple[str, Any]:
+        tool = self._tools.get(tool_name)
+        if tool is None:
+            if not self.started:
+                return "error", "Server is not ready"
+            return "error", f"Unknown tool: {tool_name}"
+        execute = getattr(tool, "execute_payload", None) if fast else None
+        stats = self.metrics.tools[tool_name]
+        stats.requests += 1
+        validator = self._validators.get(tool_name)
+        if validator is not None:
+            try:
+                with start_span("validate_arguments") if traced else nullcontext():
+                    parameters = validator.validate(parameters)
+            except InvalidArgumentsError:
+                stats.errors["invalid_input"] += 1
+                raise
+        gate = self.admission.gates.get(tool_name)
+        if gate is not None:
+            user_id = _user_id(parameters)
+            stats.queued += 1
+            queued_at = time.perf_counter()
+            try:
+                with (
+                    start_span("admission", attributes={"user.id": user_id or None})
+                    if traced
+                    else nullcontext()
+                ):
+                    self.admission.check_rate(tool_name, user_id)
+                    await gate.acquire(
+                        user_id, self.admission.priority_for(tool_name, current_priority.get())
+                    )
+            except RateLimitedError:
+                stats.errors["rate_limited"] += 1
+                raise
+            except OverloadedError:
+                stats.errors["overloaded"] += 1
+                raise
+            finally:
+                stats.queued -= 1
+            stats.queue_wait.observe(time.perf_counter() - queued_at)
+        stats.in_flight += 1
+        started = time.perf_counter()
+        try:
+            with (
+                start_span("execute", attributes={"mcp.tool": tool_name})
+                if traced
+                else nullcontext()
+            ):
+                return "success", await (execute or tool.execute)(context, **(parameters or {}))
+        except ValueError as e:
+            stats.errors["invalid_input"] += 1
+            return "error", str(e)
+        except Exception as e:
+            stats.errors["internal"] += 1
+            logger.error(f"Error in {tool_name}: {str(e)}")
+            return "error", "Internal server error"
+        finally:
+            stats.in_flight -= 1
+            stats.latency.observe(time.perf_counter() - started)
+            if gate is not None:
+                gate.release()
+
+class RuntimeGroup:
+    """Several server runtimes hosted in one process behind one dispatcher.
+
+    Runtimes start in the given order (so later ones may use earlier ones'
+    resources) and stop in reverse.
+    """
+
+    def __init__(self, name: str, runtimes: Dict[str, ServerRuntime]):
+        self.name = name
+        self.runtimes = runtimes
+        self._owners: Dict[str, ServerRuntime] = {}
+        for runtime in runtimes.values():
+            for tool_name in runtime.tool_names:
+                if tool_name in self._owners:
+                    raise ValueError(
+                        f"Tool {tool_name} is registered by both "
+                        f"{self._owners[tool_name].name} and {runtime.name}"
+                    )
+                self._owners[tool_name] = runtime
+        self._on_startup: List[Callable[["RuntimeGroup"], Union[None, Awaitable[None]]]] = []
+
+    def __getitem__(self, name: str) -> ServerRuntime:
+        return self.runtimes[name]
+
+    @property
+    def tool_names(self) -> List[str]:
+        return list(self._owners)
+
+    @property
+    def tools(self) -> Dict[str, Tool]:
+        return {
+            name: tool for runtime in self.runtimes.values() for name, tool in runtime.tools.items()
+        }
+
+    @property
+    def started(self) -> bool:
+        return all(runtime.started for runtime in self.runtimes.values())
+
+    @property
+    def saturated_tools(self) -> List[str]:
+        return [name for runtime in self.runtimes.values() for name in runtime.saturated_tools]
+
+    @property
+    def metrics(self) -> List[ToolMetrics]:
+        return [runtime.metrics for runtime in self.runtimes.values()]
+
+    def on_startup(self, hook: Callable[["RuntimeGroup"], Union[None, Awaitable[None]]]) -> None:
+        """Run hook once every runtime has started, e.g. to link them in-process."""
+        self._on_startup.append(hook)
+
+    async def startup(self) -> None:
+        try:
+            for runtime in self.runtimes.values():
+                await runtime.startup()
+            for hook in self._on_startup:
+                await _maybe_await(hook(self))
+        except BaseException:
+            # Runtimes that did start are stopped; shutdown is a no-op for the rest
+            await self.shutdown()
+            raise
+
+    async def shutdown(self) -> None:
+        for runtime in reversed(list(self.runtimes.values())):
+            await runtime.shutdown()
+
+    @asynccontextmanager
+    async def lifespan(self, app: Any) -> AsyncIterator[None]:
+        await self.startup()
+        try:
+            yield
+        finally:
+            await self.shutdown()
+
+    async def dispatch(
+        self, tool_name: str, parameters: Optional[Dict[str, Any]] = None, context: Any = None
+    ) -> MCPResponse:
+        runtime = self._owners.get(tool_name)
+        if runtime is None:
+            return MCPResponse(status="error", error=f"Unknown tool: {tool_name}")
+        return await runtime.dispatch(tool_name, parameters, context)
+
+    async def dispatch_json(
+        self, tool_name: str, parameters: Optional[Dict[str, Any]] = None, context: Any = None
+    ) -> bytes:
+        runtime = self._owners.get(tool_name)
+        if runtime is None:
+            return response_json("error", error=f"Unknown tool: {tool_name}")
+        return await runtime.dispatch_json(tool_name, parameters, context)
+
+def _split_meta(
+    parameters: Optional[Dict[str, Any]]
+) -> Tuple[Optional[Dict[str, Any]], Optional[str]]:
+    """Strip MCP request metadata (_meta) from tool parameters; returns its traceparent."""
+    if not parameters or "_meta" not in parameters:
+        return parameters, None
+    parameters = dict(parameters)
+    meta = parameters.pop("_meta")
+    traceparent = meta.get("traceparent") if isinstance(meta, dict) else None
+    return parameters, traceparent if isinstance(traceparent, str) else None
+
+def _user_id(parameters: Optional[Dict[str, Any]]) -> str:
+    """The calling user: the tool's user_id parameter, else the request's user-id header."""
+    user_id = parameters.get("user_id") if parameters else None
+    if not isinstance(user_id, str):
+        user_id = current_user.get()
+    return user_id or ANONYMOUS_USER
+
+async def _maybe_await(value: Any) -> Any:
+    return await value if inspect.isawaitable(value) else value
@@ -0,0 +1,52 @@
+from typing import Any, Optional
+import pydantic_core
+from pydantic import BaseModel
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
+class RawJSON:
+    """Already-serialized JSON, written to the response as-is."""
+    __slots__ = ("content",)
+
+    def __init__(self, content: bytes):
+        self.content = content
+
+    def loads(self) -> Any:
+        return loads(self.content)
+
+def dumps(value: Any) -> bytes:
+    """Serialize a model, RawJSON or plain value to JSON bytes in one pass.
+
+    Models go through their compiled pydantic serializer; other values
+    through orjson when installed (numpy arrays included), otherwise
+    pydantic_core.
+    """
+    if isinstance(value, RawJSON):
+        return value.content
+    if isinstance(value, BaseModel) or orjson is None:
+        return pydantic_core.to_json(value)
+    return orjson.dumps(
+        value, default=_default, option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+    )
+
+def loads(content: bytes) -> Any:
+    if orjson is not None:
+        return orjson.loads(content)
+    return pydantic_core.from_json(content)
+
+def response_json(status: str, data: Any = None, error: Optional[str] = None) -> bytes:
+    """MCPResponse-shaped JSON built around the serialized data, without an intermediate dict."""
+    error_json = dumps(error) if error is not None else b"null"
+    data_json = dumps(data) if data is not None else b"null"
+    return (
+        b'{"status":' + dumps(status) + b',"data":' + data_json + b',"error":' + error_json + b"}"
+    )
+
+def _default(value: Any) -> Any:
+    # Models nested in plain containers; pydantic_core covers dates, enums, dataclasses, ...
+    if isinstance(value, RawJSON):
+        return pydantic_core.from_json(value.content)
+    return pydantic_core.to_jsonable_python(value)
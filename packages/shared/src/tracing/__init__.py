@@ -0,0 +1,33 @@
+from .tracer import (
+    TRACEPARENT_HEADER,
+    JSONLSpanExporter,
+    Span,
+    SpanKind,
+    StatusCode,
+    Tracer,
+    configure_tracing,
+    current_span,
+    current_traceparent,
+    get_tracer,
+    parse_traceparent,
+    remote_parent,
+    set_remote_parent,
+    start_span,
+)
+
+__all__ = [
+    'TRACEPARENT_HEADER',
+    'JSONLSpanExporter',
+    'Span',
+    'SpanKind',
+    'StatusCode',
+    'Tracer',
+    'configure_tracing',
+    'current_span',
+    'current_traceparent',
+    'get_tracer',
+    'parse_traceparent',
+    'remote_parent',
+    'set_remote_parent',
+    'start_span',
+]
@@ -0,0 +1,70 @@
+"""Convert exported spans to the Chrome trace event format for a flame chart.
+
+    python -m shared.tracing.chrome logs/traces.jsonl --trace-id <id> > turn.json
+
+Open the output in https://ui.perfetto.dev or chrome://tracing. Each
+service is a process and each trace a thread, so one agent turn and the
+tool calls it made stack into a single flame chart.
+"""
+import argparse
+import json
+import sys
+from typing import Any, Dict, Iterator, List, Optional
+
+def read_spans(path: str) -> Iterator[Dict[str, Any]]:
+    """Spans from an OTLP/JSON lines file, each tagged with its service name."""
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            if not line.strip():
+                continue
+            for resource_spans in json.loads(line).get("resourceSpans", []):
+                attributes = {
+                    a["key"]: a["value"]
+                    for a in resource_spans.get("resource", {}).get("attributes", [])
+                }
+                service = attributes.get("service.name", {}).get("stringValue", "unknown")
+                for scope_spans in resource_spans.get("scopeSpans", []):
+                    for span in scope_spans.get("spans", []):
+                        yield {**span, "service": service}
+
+def to_trace_events(spans: List[Dict[str, Any]], trace_id: Optional[str] = None) -> Dict[str, Any]:
+    if trace_id:
+        spans = [span for span in spans if span["traceId"] == trace_id]
+    services = {
+        service: pid
+        for pid, service in enumerate(sorted({span["service"] for span in spans}), start=1)
+    }
+    traces = {
+        trace: tid for tid, trace in enumerate(sorted({span["traceId"] for span in spans}), start=1)
+    }
+    events: List[Dict[str, Any]] = [
+        {"name": "process_name", "ph": "M", "pid": pid, "args": {"name": service}}
+        for service, pid in services.items()
+    ]
+    for span in spans:
+        start_us = int(span["startTimeUnixNano"]) / 1000
+        events.append({
+            "name": span["name"],
+            "ph": "X",
+            "ts": start_us,
+            "dur": int(span["endTimeUnixNano"]) / 1000 - start_us,
+            "pid": services[span["service"]],
+            "tid": traces[span["traceId"]],
+            "args": {
+                "trace_id": span["traceId"],
+                "span_id": span["spanId"],
+                "parent_span_id": span.get("parentSpanId"),
+                **{a["key"]: next(iter(a["value"].values())) for a in span.get("attributes", [])}
+            }
+        })
+    return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("path", help="JSONL file written by the span exporter")
+    parser.add_argument("--trace-id", help="Only this trace (e.g. one agent turn)")
+    args = parser.parse_args()
+    json.dump(to_trace_events(list(read_spans(args.path)), args.trace_id), sys.stdout)
+
+if __name__ == "__main__":
+    main()
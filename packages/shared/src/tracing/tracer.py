@@ -0,0 +1,269 @@
+import atexit
+import json
+import os
+import secrets
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from enum import IntEnum
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+TRACEPARENT_HEADER = "traceparent"
+TRACE_EXPORT_PATH_ENV = "TRACE_EXPORT_PATH"
+
+class SpanKind(IntEnum):
+    """OTLP span kinds."""
+    INTERNAL = 1
+    SERVER = 2
+    CLIENT = 3
+
+class StatusCode(IntEnum):
+    """OTLP status codes."""
+    UNSET = 0
+    OK = 1
+    ERROR = 2
+
+class Span:
+    """One timed operation within a trace."""
+    __slots__ = (
+        "name", "trace_id", "span_id", "parent_span_id", "kind",
+        "start_ns", "end_ns", "attributes", "status", "status_message"
+    )
+
+    def __init__(
+        self,
+        name: str,
+        trace_id: str,
+        parent_span_id: Optional[str],
+        kind: SpanKind,
+        attributes: Optional[Dict[str, Any]]
+    ):
+        self.name = name
+        self.trace_id = trace_id
+        self.span_id = secrets.token_hex(8)
+        self.parent_span_id = parent_span_id
+        self.kind = kind
+        self.start_ns = time.time_ns()
+        self.end_ns = 0
+        self.attributes = dict(attributes) if attributes else {}
+        self.status = StatusCode.UNSET
+        self.status_message = ""
+
+    @property
+    def traceparent(self) -> str:
+        """W3C trace context for this span, to propagate to a callee."""
+        return f"00-{self.trace_id}-{self.span_id}-01"
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        self.attributes[key] = value
+
+    def set_error(self, message: str) -> None:
+        self.status = StatusCode.ERROR
+        self.status_message = message
+
+    def to_otlp(self) -> Dict[str, Any]:
+        span = {
+            "traceId": self.trace_id,
+            "spanId": self.span_id,
+            "name": self.name,
+            "kind": int(self.kind),
+            "startTimeUnixNano": str(self.start_ns),
+            "endTimeUnixNano": str(self.end_ns),
+            "attributes": _otlp_attributes(self.attributes),
+            "status": {"code": int(self.status)}
+        }
+        if self.parent_span_id:
+            span["parentSpanId"] = self.parent_span_id
+        if self.status_message:
+            span["status"]["message"] = self.status_message
+        return span
+
+# The active span, and a parent received from another process (header or _meta)
+_current_span: ContextVar[Optional[Span]] = ContextVar("current_span", default=None)
+_remote_parent: ContextVar[Optional[Tuple[str, str]]] = ContextVar("remote_parent", default=None)
+
+def parse_traceparent(value: Optional[str]) -> Optional[Tuple[str, str]]:
+    """(trace_id, parent span_id) from a W3C traceparent, or None if malformed."""
+    if not value:
+        return None
+    parts = value.strip().split("-")
+    if len(parts) != 4 or len(parts[1]) != 32 or len(parts[2]) != 16:
+        return None
+    trace_id, span_id = parts[1].lower(), parts[2].lower()
+    try:
+        int(trace_id, 16)
+        int(span_id, 16)
+    except ValueError:
+        return None
+    if trace_id == "0" * 32 or span_id == "0" * 16:
+        return None
+    return trace_id, span_id
+
+def current_span() -> Optional[Span]:
+    return _current_span.get()
+
+def current_traceparent() -> Optional[str]:
+    """traceparent of the active span, or of the remote parent if no span is active."""
+    span = _current_span.get()
+    if span is not None:
+        return span.traceparent
+    remote = _remote_parent.get()
+    return f"00-{remote[0]}-{remote[1]}-01" if remote else None
+
+@contextmanager
+def remote_parent(traceparent: Optional[str]) -> Iterator[None]:
+    """Parent the next root span in this context on a caller's traceparent."""
+    token = _remote_parent.set(parse_traceparent(traceparent))
+    try:
+        yield
+    finally:
+        _remote_parent.reset(token)
+
+def set_remote_parent(traceparent: Optional[str]) -> None:
+    """Like remote_parent, for the rest of the current context (e.g. a request task)."""
+    _remote_parent.set(parse_traceparent(traceparent))
+
+class JSONLSpanExporter:
+    """Writes finished spans as OTLP/JSON ExportTraceServiceRequest lines.
+
+    Spans are buffered and written max_batch at a time (or at least every
+    flush_interval seconds when spans keep finishing), one JSON document
+    per line, the format of the OpenTelemetry Collector file exporter.
+    """
+
+    def __init__(
+        self, path: str, service_name: str, max_batch: int = 64, flush_interval: float = 1.0
+    ):
+        self.path = path.replace("{pid}", str(os.getpid()))
+        self.service_name = service_name
+        self.max_batch = max_batch
+        self.flush_interval = flush_interval
+        self._buffer: List[Span] = []
+        self._last_flush = time.monotonic()
+        self._lock = threading.Lock()
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+    def export(self, span: Span) -> None:
+        with self._lock:
+            self._buffer.append(span)
+            if (
+                len(self._buffer) < self.max_batch
+                and time.monotonic() - self._last_flush < self.flush_interval
+            ):
+                return
+            spans, self._buffer = self._buffer, []
+            self._last_flush = time.monotonic()
+        self._write(spans)
+
+    def flush(self) -> None:
+        with self._lock:
+            spans, self._buffer = self._buffer, []
+            self._last_flush = time.monotonic()
+        if spans:
+            self._write(spans)
+
+    def _write(self, spans: List[Span]) -> None:
+        document = {
+            "resourceSpans": [{
+                "resource": {"attributes": _otlp_attributes({"service.name": self.service_name})},
+                "scopeSpans": [{
+                    "scope": {"name": "shared.tracing"},
+                    "spans": [span.to_otlp() for span in spans]
+                }]
+            }]
+        }
+        line = json.dumps(document, separators=(",", ":"), default=str) + "\n"
+        # One append per batch keeps lines from concurrent workers intact
+        with open(self.path, "a", encoding="utf-8") as f:
+            f.write(line)
+
+class Tracer:
+    """Creates spans and hands finished ones to an exporter.
+
+    Without an exporter tracing is off and span() costs one attribute check.
+    """
+
+    def __init__(self, service_name: str, exporter: Optional[JSONLSpanExporter] = None):
+        self.service_name = service_name
+        self.exporter = exporter
+
+    @property
+    def enabled(self) -> bool:
+        return self.exporter is not None
+
+    @contextmanager
+    def span(
+        self,
+        name: str,
+        kind: SpanKind = SpanKind.INTERNAL,
+        attributes: Optional[Dict[str, Any]] = None
+    ) -> Iterator[Optional[Span]]:
+        """Run the block in a child of the active span (or of the remote parent, or a new trace)."""
+        if self.exporter is None:
+            yield None
+            return
+        parent = _current_span.get()
+        if parent is not None:
+            trace_id, parent_id = parent.trace_id, parent.span_id
+        else:
+            remote = _remote_parent.get()
+            trace_id, parent_id = remote if remote else (secrets.token_hex(16), None)
+        span = Span(name, trace_id, parent_id, kind, attributes)
+        token = _current_span.set(span)
+        try:
+            yield span
+        except BaseException as e:
+            span.set_error(f"{type(e).__name__}: {e}")
+            raise
+        finally:
+            _current_span.reset(token)
+            span.end_ns = time.time_ns()
+            self.exporter.export(span)
+
+    def flush(self) -> None:
+        if self.exporter is not None:
+            self.exporter.flush()
+
+_tracer = Tracer("unknown")
+
+def configure_tracing(service_name: str, path: Optional[str] = None) -> Tracer:
+    """Install the process tracer; spans are exported to path or TRACE_EXPORT_PATH.
+
+    Tracing stays off when neither is set. "{pid}" in the path is replaced
+    with the process ID, for one file per worker.
+    """
+    global _tracer
+    _tracer.flush()
+    path = path or os.getenv(TRACE_EXPORT_PATH_ENV)
+    _tracer = Tracer(service_name, JSONLSpanExporter(path, service_name) if path else None)
+    return _tracer
+
+def get_tracer() -> Tracer:
+    return _tracer
+
+def start_span(
+    name: str, kind: SpanKind = SpanKind.INTERNAL, attributes: Optional[Dict[str, Any]] = None
+):
+    """Context manager for a span on the process tracer."""
+    return _tracer.span(name, kind, attributes)
+
+def _otlp_attributes(attributes: Dict[str, Any]) -> List[Dict[str, Any]]:
+    return [
+        {"key": key, "value": _otlp_value(value)}
+        for key, value in attributes.items()
+        if value is not None
+    ]
+
+def _otlp_value(value: Any) -> Dict[str, Any]:
+    if isinstance(value, bool):
+        return {"boolValue": value}
+    if isinstance(value, int):
+        return {"intValue": str(value)}
+    if isinstance(value, float):
+        return {"doubleValue": value}
+    return {"stringValue": str(value)}
+
+atexit.register(lambda: _tracer.flush())